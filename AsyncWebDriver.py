@@ -0,0 +1,406 @@
+"""
+Asyncio WebDriver transport for the async page objects in :mod:`pages.AsyncPages`.
+
+Commands are sent as plain W3C WebDriver HTTP requests over one keep-alive asyncio stream per
+session, so a single worker process can drive dozens of browsers concurrently. One
+chromedriver or Selenium Grid serves every session of a run; geckodriver serves one session
+at a time, so Firefox sessions get a geckodriver each.
+
+Usage::
+
+    python AsyncWebDriver.py --sessions 24 --concurrency 12
+
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import urllib.parse
+from selenium.common.exceptions import (
+    JavascriptException, NoSuchElementException, NoSuchWindowException, StaleElementReferenceException,
+    TimeoutException, WebDriverException, ElementClickInterceptedException, ElementNotInteractableException,
+)
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+
+from BrowserProfiles import build_options, get_profile
+from DriverCache import get_driver_cache
+
+
+# W3C'nin element referansı anahtarı
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+# execute_async_script üst sınırı; async sayfa nesnelerinin event tabanlı beklemeleri bu süreyi aşamaz
+ASYNC_SCRIPT_TIMEOUT = float(os.environ.get("ASYNC_SCRIPT_TIMEOUT", "120"))
+# Aynı anda açık tutulacak oturum sayısı
+ASYNC_SESSIONS = int(os.environ.get("ASYNC_SESSIONS", "12"))
+# Tek oturum sunabilen driver'lar; her oturuma ayrı servis başlatılır
+SINGLE_SESSION_DRIVERS = frozenset({"firefox"})
+
+_ERRORS = {
+    "no such element": NoSuchElementException,
+    "stale element reference": StaleElementReferenceException,
+    "javascript error": JavascriptException,
+    "timeout": TimeoutException,
+    "script timeout": TimeoutException,
+    "no such window": NoSuchWindowException,
+    "element click intercepted": ElementClickInterceptedException,
+    "element not interactable": ElementNotInteractableException,
+}
+
+
+class AsyncWebElement:
+    """
+    Reference to an element of an :class:`AsyncWebDriver` session.
+
+    """
+
+    def __init__(self, driver, element_id):
+        self.driver = driver
+        self.id = element_id
+
+    def __eq__(self, other):
+        return isinstance(other, AsyncWebElement) and other.id == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    async def click(self):
+        await self.driver.command("POST", f"/element/{self.id}/click", {})
+
+    async def send_keys(self, text):
+        await self.driver.command("POST", f"/element/{self.id}/value", {"text": str(text)})
+
+    async def text(self):
+        return await self.driver.command("GET", f"/element/{self.id}/text")
+
+
+class AsyncWebDriver:
+    """
+    One WebDriver session driven through awaitable commands.
+
+    Commands of a session run one at a time over a single keep-alive connection; sessions
+    do not share connections, so they never wait for each other.
+
+    :param server_url: Driver server URL, e.g. ``http://localhost:9515``
+    :param session_id: WebDriver session id
+    :param capabilities: Capabilities returned by the driver server
+
+    """
+
+    def __init__(self, server_url, session_id=None, capabilities=None):
+        parts = urllib.parse.urlsplit(server_url)
+        self.server_url = server_url
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.base_path = parts.path.rstrip("/")
+        self.session_id = session_id
+        self.capabilities = capabilities or {}
+        self.service = None
+        self._streams = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    async def start(cls, server_url, capabilities, script_timeout=ASYNC_SCRIPT_TIMEOUT):
+        """
+        Opens a new session on the driver server.
+
+        :param server_url: Driver server URL
+        :param capabilities: ``alwaysMatch`` capabilities, e.g. ``options.to_capabilities()``
+        :param float script_timeout: Session script timeout in seconds
+        :rtype: AsyncWebDriver
+        :raises WebDriverException: If the session cannot be created
+
+        """
+        driver = cls(server_url)
+        value = await driver.request("POST", "/session", {"capabilities": {"alwaysMatch": capabilities}})
+        driver.session_id = value["sessionId"]
+        driver.capabilities = value.get("capabilities", {})
+        await driver.command("POST", "/timeouts", {"script": int(script_timeout * 1000)})
+        return driver
+
+    async def command(self, method, path, body=None):
+        """
+        Sends a command of this session, e.g. ``command("GET", "/url")``.
+
+        :return: The ``value`` of the response, with element references wrapped
+        :raises WebDriverException: Or the matching subclass for a W3C error
+
+        """
+        return await self.request(method, f"/session/{self.session_id}{path}", body)
+
+    async def request(self, method, path, body=None):
+        async with self._lock:
+            payload = json.dumps(body).encode() if body is not None else b""
+            try:
+                status, data = await self._send(method, path, payload)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                # Gönderilmiş bir komut tekrarlanmaz; tıklama gibi POST'lar iki kez çalışabilirdi
+                await self._disconnect()
+                raise
+        value = json.loads(data or b"null")
+        value = value.get("value") if isinstance(value, dict) and "value" in value else value
+        if status >= 400:
+            error = value.get("error", "unknown error") if isinstance(value, dict) else "unknown error"
+            message = value.get("message", "") if isinstance(value, dict) else str(value)
+            raise _ERRORS.get(error, WebDriverException)(f"{error}: {message}")
+        return self._unwrap(value)
+
+    async def get(self, url):
+        await self.command("POST", "/url", {"url": url})
+
+    async def title(self):
+        return await self.command("GET", "/title")
+
+    async def current_url(self):
+        return await self.command("GET", "/url")
+
+    async def execute_script(self, script, *args):
+        return await self.command("POST", "/execute/sync", {"script": script, "args": self._wrap(args)})
+
+    async def execute_async_script(self, script, *args):
+        return await self.command("POST", "/execute/async", {"script": script, "args": self._wrap(args)})
+
+    async def find_elements(self, by, value):
+        return await self.command("POST", "/elements", {"using": by, "value": value})
+
+    async def window_handles(self):
+        return await self.command("GET", "/window/handles")
+
+    async def current_window_handle(self):
+        return await self.command("GET", "/window")
+
+    async def switch_to_window(self, handle):
+        await self.command("POST", "/window", {"handle": handle})
+
+    async def quit(self):
+        """
+        Ends the session, closes the connection and stops the driver service it was launched with.
+
+        """
+        try:
+            if self.session_id:
+                await self.request("DELETE", f"/session/{self.session_id}")
+        finally:
+            await self._disconnect()
+            if self.service:
+                self.service.stop()
+
+    async def _send(self, method, path, payload):
+        if self._streams is not None and self._streams[0].at_eof():
+            # Sunucu boştaki keep-alive bağlantısını kapatmış; istek gönderilmeden yeniden bağlanılır
+            await self._disconnect()
+        if self._streams is None:
+            self._streams = await asyncio.open_connection(self.host, self.port)
+        reader, writer = self._streams
+        head = (f"{method} {self.base_path}{path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\nContent-Length: {len(payload)}\r\n"
+                f"Connection: keep-alive\r\n\r\n")
+        writer.write(head.encode() + payload)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Driver server closed the connection")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            data = b"".join(chunks)
+        elif "content-length" in headers:
+            data = await reader.readexactly(int(headers["content-length"]))
+        else:
+            data = await reader.read()
+            headers["connection"] = "close"
+        if headers.get("connection", "").lower() == "close":
+            await self._disconnect()
+        return status, data
+
+    async def _disconnect(self):
+        if self._streams is None:
+            return
+        writer = self._streams[1]
+        self._streams = None
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+    def _wrap(self, value):
+        if isinstance(value, AsyncWebElement):
+            return {ELEMENT_KEY: value.id}
+        if isinstance(value, (list, tuple)):
+            return [self._wrap(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._wrap(item) for key, item in value.items()}
+        return value
+
+    def _unwrap(self, value):
+        if isinstance(value, list):
+            return [self._unwrap(item) for item in value]
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return AsyncWebElement(self, value[ELEMENT_KEY])
+            return {key: self._unwrap(item) for key, item in value.items()}
+        return value
+
+
+def start_driver_service(browser):
+    """
+    Starts a chromedriver/geckodriver process; chromedriver can be shared by async sessions,
+    geckodriver serves one session.
+
+    :param browser: 'chrome' or 'firefox'
+    :return: Started Selenium service, its URL is ``service.service_url``
+    :raises ValueError: If the browser is not supported
+
+    """
+    if browser == "chrome":
+        service = ChromeService(get_driver_cache().resolve(browser))
+    elif browser == "firefox":
+        service = FirefoxService(get_driver_cache().resolve(browser))
+    else:
+        raise ValueError(f"Unsupported browser: {browser}")
+    service.start()
+    return service
+
+
+async def launch_async_driver(browser, profile=None, server_url=None):
+    """
+    Opens an async session with the options of a launch profile.
+
+    Without a ``server_url`` a driver service is started for the session and stopped by
+    :meth:`AsyncWebDriver.quit`. Warm profile directories are not used, every session starts
+    from a clean browser profile.
+
+    :param browser: 'chrome' or 'firefox'
+    :param profile: Launch profile, defaults to the one selected by ``BROWSER_PROFILE``
+    :type profile: BrowserProfiles.LaunchProfile
+    :param server_url: URL of an already running driver server or Selenium Grid
+    :rtype: AsyncWebDriver
+
+    """
+    profile = profile or get_profile()
+    capabilities = build_options(browser, profile).to_capabilities()
+    service = None
+    if server_url is None:
+        service = await asyncio.get_running_loop().run_in_executor(None, start_driver_service, browser)
+        server_url = service.service_url
+    try:
+        driver = await AsyncWebDriver.start(server_url, capabilities)
+    except Exception:
+        if service:
+            service.stop()
+        raise
+    driver.service = service
+    driver.launch_profile = profile
+    return driver
+
+
+async def run_sessions(flow, sessions, browser="chrome", concurrency=ASYNC_SESSIONS, profile=None, server_url=None):
+    """
+    Runs an async flow in many browser sessions from the current event loop.
+
+    At most ``concurrency`` sessions are open at the same time. Chrome sessions share one
+    chromedriver; Firefox sessions each start their own geckodriver, which cannot serve two
+    sessions at once. A ``server_url`` is used as given, for Firefox it should be a Grid.
+
+    :param flow: Coroutine function called with each driver
+    :param int sessions: Number of sessions to run the flow in
+    :param browser: 'chrome' or 'firefox'
+    :param int concurrency: Sessions open at the same time
+    :param profile: Launch profile
+    :param server_url: Driver server to use instead of starting one
+    :return: Dicts with 'session', 'result', 'error' and 'seconds', in session order
+    :rtype: list
+
+    """
+    service = None
+    if server_url is None and browser not in SINGLE_SESSION_DRIVERS:
+        service = await asyncio.get_running_loop().run_in_executor(None, start_driver_service, browser)
+        server_url = service.service_url
+    limit = asyncio.Semaphore(concurrency)
+
+    async def run_one(index):
+        async with limit:
+            started = time.perf_counter()
+            driver = None
+            try:
+                driver = await launch_async_driver(browser, profile, server_url)
+                result, error = await flow(driver), None
+            except Exception as e:
+                result, error = None, f"{type(e).__name__}: {e}"
+            finally:
+                if driver:
+                    await driver.quit()
+            return {"session": index, "result": result, "error": error, "seconds": time.perf_counter() - started}
+
+    try:
+        return await asyncio.gather(*(run_one(index) for index in range(sessions)))
+    finally:
+        if service:
+            service.stop()
+
+
+async def smoke_flow(driver):
+    """
+    Home page -> Careers -> QA jobs -> Istanbul filter -> View Role, the same steps and checks
+    as ``tests/tests.py::test_insider_career_page``.
+
+    :return: True if every page of the flow was reached
+    :rtype: bool
+
+    """
+    from pages.AsyncPages import AsyncCareerPage, AsyncHomePage, AsyncQAPage
+
+    home_page = AsyncHomePage(driver)
+    await home_page.open()
+    await home_page.accept_cookies()
+    await home_page.navigate_to_careers()
+    career_page = AsyncCareerPage(driver)
+    if not await career_page.verify_sections():
+        return False
+    await career_page.go_to_qa_careers()
+    qa_page = AsyncQAPage(driver)
+    await qa_page.click_see_all_qa_jobs()
+    if not await qa_page.select_location_if_department_is_qa():
+        return False
+    if not await qa_page.verify_job_listings():
+        return False
+    return await qa_page.verify_view_role_redirects()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the Insider smoke flow in many async browser sessions.")
+    parser.add_argument("--browser", choices=["chrome", "firefox"], default="chrome")
+    parser.add_argument("--sessions", type=int, default=ASYNC_SESSIONS)
+    parser.add_argument("--concurrency", type=int, default=ASYNC_SESSIONS)
+    parser.add_argument("--profile", default="headless")
+    parser.add_argument("--server-url", default=None)
+    args = parser.parse_args()
+
+    started_at = time.perf_counter()
+    results = asyncio.run(run_sessions(smoke_flow, args.sessions, args.browser, args.concurrency,
+                                       get_profile(args.profile), args.server_url))
+    for session in results:
+        status = "✅" if session["result"] else "❌"
+        print(f"{status} session {session['session']} {session['seconds']:.1f}s {session['error'] or ''}")
+    print(f"🎯 {sum(bool(s['result']) for s in results)}/{len(results)} sessions passed "
+          f"in {time.perf_counter() - started_at:.1f}s")
+    sys.exit(0 if all(session["result"] for session in results) else 1)
@@ -0,0 +1,270 @@
+import argparse
+import os
+import shutil
+import statistics
+import time
+from dataclasses import dataclass
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from RequestFilter import block_urls
+
+
+# Çalıştırma başına seçilen profil: BROWSER_PROFILE=fast pytest ...
+BROWSER_PROFILE = os.environ.get("BROWSER_PROFILE", "default")
+PROFILE_ROOT = os.environ.get("BROWSER_PROFILE_DIR", ".browser-profiles")
+FONT_URL_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+# Warm profilde oturumlar arasında taşınmaması gereken çerez/storage dosyaları; HTTP cache korunur
+PROFILE_STATE_PATHS = {
+    "chrome": ["Default/Cookies", "Default/Cookies-journal", "Default/Network/Cookies",
+               "Default/Network/Cookies-journal", "Default/Local Storage", "Default/Session Storage",
+               "Default/IndexedDB", "Default/Service Worker", "Default/Sessions"],
+    "firefox": ["cookies.sqlite", "cookies.sqlite-wal", "webappsstore.sqlite", "webappsstore.sqlite-wal",
+                "storage", "sessionstore.jsonlz4", "sessionstore-backups"],
+}
+
+
+@dataclass(frozen=True)
+class LaunchProfile:
+    """
+    Named set of browser launch options and the readiness checks page objects use with them.
+
+    :param name: Profile name
+    :param bool headless: Run without a visible window
+    :param page_load_strategy: WebDriver pageLoadStrategy ('normal', 'eager' or 'none')
+    :param bool block_images: Disable image loading
+    :param bool block_fonts: Disable web fonts
+    :param window_size: Fixed ``(width, height)``, or None to maximize the window
+    :param bool warm_profile: Reuse a persistent browser profile directory under ``PROFILE_ROOT``
+        for its HTTP cache; cookies and storage are cleared before every session
+    :param ready_states: ``document.readyState`` values accepted by ``wait_for_page_to_load``
+    :param bool wait_for_dom_settled: Also wait for DOM mutations to settle after the ready state
+
+    """
+
+    name: str
+    headless: bool = False
+    page_load_strategy: str = "normal"
+    block_images: bool = False
+    block_fonts: bool = False
+    window_size: tuple = None
+    warm_profile: bool = False
+    ready_states: tuple = ("complete",)
+    wait_for_dom_settled: bool = False
+
+
+PROFILES = {
+    # Mevcut davranış: görünür tarayıcı, tam yükleme
+    "default": LaunchProfile("default"),
+    "headless": LaunchProfile("headless", headless=True, window_size=(1920, 1080)),
+    "fast": LaunchProfile(
+        "fast", headless=True, page_load_strategy="eager", block_images=True, block_fonts=True,
+        window_size=(1920, 1080), ready_states=("interactive", "complete"), wait_for_dom_settled=True,
+    ),
+    "warm": LaunchProfile(
+        "warm", headless=True, page_load_strategy="eager", block_fonts=True, window_size=(1920, 1080),
+        warm_profile=True, ready_states=("interactive", "complete"), wait_for_dom_settled=True,
+    ),
+}
+
+_profile_locks = {}
+
+
+def get_profile(name=None):
+    """
+    Returns a launch profile by name, defaulting to ``BROWSER_PROFILE``.
+
+    :param name: Profile name
+    :rtype: LaunchProfile
+    :raises ValueError: If the profile is unknown
+
+    """
+    name = name or BROWSER_PROFILE
+    if name not in PROFILES:
+        raise ValueError(f"Unknown browser profile: {name} (available: {', '.join(PROFILES)})")
+    return PROFILES[name]
+
+
+def acquire_profile_dir(browser):
+    """
+    Locks and returns a persistent profile directory that no other live browser is using.
+
+    Browsers refuse to share a profile directory, so warm profiles are kept in numbered slots.
+    The cookies and storage the previous session left in the slot are deleted, so every
+    session starts signed out while the HTTP cache stays warm.
+    The lock is released by :func:`release_profile_dir` or when the process exits.
+
+    :param browser: 'chrome' or 'firefox'
+    :return: Absolute profile directory path
+    :rtype: str
+
+    """
+    slot = 0
+    while True:
+        path = os.path.abspath(os.path.join(PROFILE_ROOT, f"{browser}-{slot}"))
+        os.makedirs(path, exist_ok=True)
+        lock_file = open(os.path.join(PROFILE_ROOT, f"{browser}-{slot}.lock"), "w")
+        if not _try_lock(lock_file):
+            lock_file.close()
+            slot += 1
+            continue
+        _profile_locks[path] = lock_file
+        _clear_profile_state(browser, path)
+        return path
+
+
+def release_profile_dir(path):
+    """
+    Releases a profile directory acquired with :func:`acquire_profile_dir`.
+
+    :param path: Profile directory path
+
+    """
+    lock_file = _profile_locks.pop(path, None)
+    if lock_file:
+        lock_file.close()
+
+
+def _try_lock(lock_file):
+    try:
+        import fcntl
+    except ImportError:
+        # Windows'ta fcntl yok; msvcrt dosyanın ilk baytını kilitler
+        import msvcrt
+        try:
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _clear_profile_state(browser, path):
+    for relative_path in PROFILE_STATE_PATHS.get(browser, []):
+        state_path = os.path.join(path, *relative_path.split("/"))
+        if os.path.isdir(state_path):
+            shutil.rmtree(state_path, ignore_errors=True)
+        elif os.path.exists(state_path):
+            os.remove(state_path)
+
+
+def build_options(browser, profile, profile_dir=None, proxy=None):
+    """
+    Builds the Selenium options object for a browser and launch profile.
+
+    :param browser: 'chrome' or 'firefox'
+    :param profile: Launch profile
+    :type profile: LaunchProfile
+    :param profile_dir: Persistent profile directory for warm profiles
+    :param proxy: Filtering proxy to route the browser traffic through
+    :type proxy: RequestFilter.FilteringProxy
+    :return: ChromeOptions or FirefoxOptions
+    :raises ValueError: If the browser is not supported
+
+    """
+    if browser == "chrome":
+        options = ChromeOptions()
+        if profile.headless:
+            options.add_argument("--headless=new")
+        if profile.window_size:
+            options.add_argument("--window-size={},{}".format(*profile.window_size))
+        if profile.block_images:
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        if profile_dir:
+            options.add_argument(f"--user-data-dir={profile_dir}")
+        if proxy:
+            options.add_argument(f"--proxy-server=http://{proxy.url}")
+    elif browser == "firefox":
+        options = FirefoxOptions()
+        if profile.headless:
+            options.add_argument("-headless")
+        if profile.window_size:
+            options.add_argument(f"--width={profile.window_size[0]}")
+            options.add_argument(f"--height={profile.window_size[1]}")
+        if profile.block_images:
+            options.set_preference("permissions.default.image", 2)
+        if profile.block_fonts:
+            options.set_preference("browser.display.use_document_fonts", 0)
+        if profile_dir:
+            options.add_argument("-profile")
+            options.add_argument(profile_dir)
+        if proxy:
+            for name, value in proxy.firefox_preferences().items():
+                options.set_preference(name, value)
+    else:
+        raise ValueError(f"Unsupported browser: {browser}")
+
+    options.page_load_strategy = profile.page_load_strategy
+    return options
+
+
+def apply_profile(driver, profile):
+    """
+    Applies the profile settings that can only be set on a running driver.
+
+    Chrome has no font preference, so fonts are blocked through the DevTools protocol.
+
+    :param driver: Selenium WebDriver instance
+    :param profile: Launch profile
+    :type profile: LaunchProfile
+
+    """
+    if profile.block_fonts and hasattr(driver, "execute_cdp_cmd"):
+        block_urls(driver, FONT_URL_PATTERNS)
+    if not profile.window_size:
+        driver.maximize_window()
+    driver.launch_profile = profile
+
+
+def benchmark(profile_names, browsers, url, runs=3):
+    """
+    Measures driver startup and first navigation time for each profile and browser.
+
+    :param profile_names: Profiles to compare
+    :param browsers: Browsers to launch
+    :param url: URL of the first navigation
+    :param int runs: Launches per profile and browser
+    :return: ``{(profile, browser): {"startup": median, "first_navigation": median}}`` in seconds
+    :rtype: dict
+
+    """
+    from DriverPool import create_driver
+    from pages.BasePage import BasePage
+
+    results = {}
+    for name in profile_names:
+        profile = get_profile(name)
+        for browser in browsers:
+            startups, navigations = [], []
+            for _ in range(runs):
+                started = time.perf_counter()
+                driver = create_driver(browser, profile)
+                startups.append(time.perf_counter() - started)
+                try:
+                    started = time.perf_counter()
+                    driver.get(url)
+                    BasePage(driver).wait_for_page_to_load()
+                    navigations.append(time.perf_counter() - started)
+                finally:
+                    driver.quit()
+            results[(name, browser)] = {
+                "startup": statistics.median(startups),
+                "first_navigation": statistics.median(navigations),
+            }
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare startup and first-navigation time of launch profiles.")
+    parser.add_argument("--profiles", nargs="+", default=list(PROFILES))
+    parser.add_argument("--browsers", nargs="+", default=["chrome", "firefox"])
+    parser.add_argument("--url", default="https://useinsider.com")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'profile':<10} {'browser':<8} {'startup':>9} {'first nav':>10}")
+    for (name, browser), timing in benchmark(args.profiles, args.browsers, args.url, args.runs).items():
+        print(f"{name:<10} {browser:<8} {timing['startup']:>8.2f}s {timing['first_navigation']:>9.2f}s")
@@ -1,10 +1,400 @@
+import os
+import queue
+import re
+import sys
+import threading
+import time
 from influxdb import InfluxDBClient
+from influxdb.line_protocol import make_lines
+
+
+INFLUXDB_HOST = 'localhost'
+INFLUXDB_PORT = 8086
+INFLUXDB_DATABASE = 'test_results'
+
+# 'influx' sends points in the background, 'spool' only appends them to the local spool file
+RESULT_MODE = os.environ.get('INFLUXDB_RESULT_MODE', 'influx')
+SPOOL_PATH = os.environ.get('INFLUXDB_SPOOL_PATH', 'influxdb_spool.lp')
+# Oturum sonunda writer'ı kapatırken beklenen en uzun süre; kalan noktalar spool'a yazılır
+CLOSE_TIMEOUT = float(os.environ.get('INFLUXDB_CLOSE_TIMEOUT', '30'))
+
+# Background thread'e gönderilen kontrol mesajları
+_STOP = object()
+
+
+class _FlushRequest:
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class ResultSpool:
+    """
+    Append-only local spool of points in InfluxDB line protocol.
+
+    :param path: Spool file path
+
+    """
+
+    def __init__(self, path=SPOOL_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def append(self, points):
+        """
+        Appends points to the spool file.
+
+        :param points: Points in the ``InfluxDBClient.write_points`` JSON format
+        :type points: list
+        :return: Number of points written
+        :rtype: int
+
+        """
+        if not points:
+            return 0
+        data = make_lines({"points": points})
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as spool_file:
+                spool_file.write(data)
+        return len(points)
+
+    def replay(self, client, batch_size=5000):
+        """
+        Drains the spool into InfluxDB in bulk, skipping duplicates of the same test and timestamp.
+
+        The spool is moved aside before reading so points appended during the replay go to a new file.
+        If the write fails the drained lines are kept for the next replay.
+
+        :param client: InfluxDBClient with the target database selected
+        :param int batch_size: Lines per HTTP request
+        :return: Number of points sent
+        :rtype: int
+
+        """
+        draining_path = self.path + ".replay"
+        with self._lock:
+            if os.path.exists(self.path) and not os.path.exists(draining_path):
+                os.replace(self.path, draining_path)
+            elif os.path.exists(self.path):
+                # Önceki başarısız replay'den kalan satırlar korunur
+                with open(self.path, encoding="utf-8") as new_file, \
+                        open(draining_path, "a", encoding="utf-8") as draining_file:
+                    draining_file.write(new_file.read())
+                os.remove(self.path)
+        if not os.path.exists(draining_path):
+            return 0
+
+        with open(draining_path, encoding="utf-8") as draining_file:
+            lines = {}
+            for line in draining_file:
+                line = line.strip()
+                if line:
+                    lines[_spool_key(line)] = line
+
+        if lines:
+            client.write_points(list(lines.values()), protocol="line", batch_size=batch_size)
+        os.remove(draining_path)
+        return len(lines)
+
+
+_UNESCAPED_SPACE = re.compile(r"(?<!\\) ")
+_UNESCAPED_COMMA = re.compile(r"(?<!\\),")
+
+
+def _spool_key(line):
+    """
+    Returns the deduplication key of a spooled line: measurement, test name and timestamp.
+
+    :param line: Line protocol record
+    :type line: str
+    :rtype: tuple
+
+    """
+    series = _UNESCAPED_SPACE.split(line, 1)[0]
+    measurement, *tags = _UNESCAPED_COMMA.split(series)
+    test_name = next((tag.split("=", 1)[1] for tag in tags if tag.startswith("test_name=")), series)
+    timestamp = line.rsplit(" ", 1)[-1]
+    return measurement, test_name, timestamp
+
+
+class InfluxResultWriter:
+    """
+    Long-lived InfluxDB writer with a single pooled client and a background flush thread.
+
+    Points are queued by :meth:`write` and sent in batches once ``batch_size`` points are
+    pending or ``flush_interval`` seconds have passed since the first pending point.
+    Batches that cannot be sent are appended to ``spool``. In ``'spool'`` mode no connection
+    is made at all and every point goes to the spool right away.
+
+    :param host: InfluxDB host
+    :param int port: InfluxDB HTTP port
+    :param database: Target database name
+    :param int batch_size: Number of points that triggers an immediate flush
+    :param float flush_interval: Maximum seconds a point waits in the queue
+    :param int max_queue_size: Points beyond this are dropped instead of blocking the test
+    :param float timeout: HTTP timeout for each batch write
+    :param spool: Spool for points that could not be sent, or None to drop them
+    :type spool: ResultSpool
+    :param mode: 'influx' or 'spool'
+
+    """
+
+    def __init__(self, host=INFLUXDB_HOST, port=INFLUXDB_PORT, database=INFLUXDB_DATABASE,
+                 batch_size=50, flush_interval=1.0, max_queue_size=10000, timeout=5, spool=None, mode='influx'):
+        if mode not in ('influx', 'spool'):
+            raise ValueError(f"Unknown result mode: {mode}")
+        if mode == 'spool' and spool is None:
+            spool = ResultSpool()
+        self.client = InfluxDBClient(host=host, port=port, database=database, timeout=timeout, retries=1)
+        self.mode = mode
+        self.spool = spool
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._pending = 0
+        self._thread = None
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "points_written": 0,
+            "points_failed": 0,
+            "points_dropped": 0,
+            "points_spooled": 0,
+            "flush_count": 0,
+            "last_flush_latency": 0.0,
+            "max_flush_latency": 0.0,
+            "total_flush_latency": 0.0,
+        }
+
+    def start(self):
+        """
+        Starts the background flush thread.
+
+        :return: The writer itself
+        :rtype: InfluxResultWriter
+
+        """
+        if self._thread is None and self.mode == 'influx':
+            self._thread = threading.Thread(target=self._run, name="influx-result-writer", daemon=True)
+            self._thread.start()
+        return self
+
+    @property
+    def queue_depth(self):
+        """
+        Number of points accepted but not yet sent to InfluxDB.
+
+        :rtype: int
+
+        """
+        return self._queue.qsize() + self._pending
+
+    def stats(self):
+        """
+        Returns a snapshot of the writer counters.
+
+        :return: Points written/failed/dropped, queue depth and flush latency counters
+        :rtype: dict
+
+        """
+        with self._stats_lock:
+            snapshot = dict(self._stats)
+        snapshot["queue_depth"] = self.queue_depth
+        flushes = snapshot["flush_count"]
+        snapshot["avg_flush_latency"] = snapshot["total_flush_latency"] / flushes if flushes else 0.0
+        return snapshot
+
+    def write(self, point):
+        """
+        Queues a single point without waiting for the database.
+
+        :param point: Point in the ``InfluxDBClient.write_points`` JSON format
+        :type point: dict
+        :return: True if queued or spooled, False if the queue is full and the point was dropped
+        :rtype: bool
+
+        """
+        if self.mode == 'spool':
+            self._spool([point])
+            return True
+        try:
+            self._queue.put_nowait(point)
+            return True
+        except queue.Full:
+            with self._stats_lock:
+                self._stats["points_dropped"] += 1
+            print("❌ InfluxDB kuyruğu dolu, veri atlandı.")
+            return False
+
+    def flush(self, timeout=None):
+        """
+        Blocks until every point queued before this call has been sent.
+
+        If the queue stays full for ``timeout`` seconds, e.g. because InfluxDB stopped answering,
+        the queued points are moved to the spool instead and the flush reports failure.
+
+        :param float timeout: Maximum seconds to wait
+        :return: True if the flush completed in time
+        :rtype: bool
+
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return self.queue_depth == 0
+        deadline = None if timeout is None else time.monotonic() + timeout
+        request = _FlushRequest()
+        try:
+            self._queue.put(request, timeout=timeout)
+        except queue.Full:
+            self._spool_queued()
+            return False
+        return request.done.wait(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+    def close(self, timeout=None):
+        """
+        Flushes pending points, stops the background thread and closes the client.
+
+        If the stop request cannot be queued within ``timeout`` seconds, the queued points are
+        moved to the spool first, so closing never blocks on a full queue.
+
+        :param float timeout: Maximum seconds to wait for the final flush
+
+        """
+        if self._thread is not None and self._thread.is_alive():
+            deadline = None if timeout is None else time.monotonic() + timeout
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                self._spool_queued()
+                try:
+                    self._queue.put_nowait(_STOP)
+                except queue.Full:
+                    # Başka thread'ler hâlâ yazıyor; daemon thread süreçle birlikte biter
+                    pass
+            self._thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        self._thread = None
+        self.client.close()
+
+    def _spool_queued(self):
+        # Takılan writer'ın kuyruğunu boşaltır; noktalar spool'a, bekleyen flush'lar serbest bırakılır
+        points = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, _FlushRequest):
+                item.done.set()
+            elif item is not _STOP:
+                points.append(item)
+        print(f"⚠️ InfluxDB kuyruğu boşaltılamadı, {len(points)} nokta spool'a alındı.")
+        self._spool(points)
+
+    def _run(self):
+        batch = []
+        deadline = None
+        while True:
+            wait = self.flush_interval if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=wait)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP or isinstance(item, _FlushRequest):
+                self._send(batch)
+                batch = []
+                deadline = None
+                if item is _STOP:
+                    return
+                item.done.set()
+                continue
+
+            if item is not None:
+                batch.append(item)
+                self._pending = len(batch)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if batch and (len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._send(batch)
+                batch = []
+                deadline = None
+
+    def _spool(self, points):
+        if self.spool is None:
+            return
+        try:
+            count = self.spool.append(points)
+        except OSError as e:
+            print(f"❌ Spool yazım hatası: {e}")
+            return
+        with self._stats_lock:
+            self._stats["points_spooled"] += count
+
+    def _send(self, batch):
+        if not batch:
+            return
+        started = time.perf_counter()
+        try:
+            self.client.write_points(batch)
+            succeeded = True
+        except Exception as e:
+            print(f"❌ InfluxDB yazım hatası: {e}")
+            succeeded = False
+        latency = time.perf_counter() - started
+        self._pending = 0
+        if not succeeded:
+            self._spool(batch)
+
+        with self._stats_lock:
+            self._stats["points_written" if succeeded else "points_failed"] += len(batch)
+            self._stats["flush_count"] += 1
+            self._stats["last_flush_latency"] = latency
+            self._stats["total_flush_latency"] += latency
+            self._stats["max_flush_latency"] = max(self._stats["max_flush_latency"], latency)
+
+
+_result_writer = None
+_result_writer_lock = threading.Lock()
+
+
+def get_result_writer():
+    """
+    Returns the process-wide result writer, starting it on first use.
+
+    :rtype: InfluxResultWriter
+
+    """
+    global _result_writer
+    with _result_writer_lock:
+        if _result_writer is None:
+            _result_writer = InfluxResultWriter(spool=ResultSpool(), mode=RESULT_MODE).start()
+        return _result_writer
+
+
+def close_result_writer():
+    """
+    Flushes and closes the process-wide result writer, if one was started.
+
+    :return: Final writer counters, or None if no writer was started
+    :rtype: dict
+
+    """
+    global _result_writer
+    with _result_writer_lock:
+        writer, _result_writer = _result_writer, None
+    if writer is None:
+        return None
+    writer.close(timeout=CLOSE_TIMEOUT)
+    stats = writer.stats()
+    print(f"📊 InfluxDB writer: {stats['points_written']} yazıldı, {stats['points_failed']} hatalı, "
+          f"{stats['points_spooled']} spool'a alındı, {stats['flush_count']} flush, ortalama {stats['avg_flush_latency'] * 1000:.1f}ms")
+    return stats
 
 
 # InfluxDB'ye test sonucu yazan fonksiyon
-def insert_test_result_to_influxdb(test_name, status, duration, timestamp):
+def insert_test_result_to_influxdb(test_name, status, duration, timestamp, browser=None):
     """
-    Inserts a test result into the InfluxDB database.
+    Queues a test result for the InfluxDB database.
+
+    The point is sent in a batch by the background writer, see :class:`InfluxResultWriter`.
 
     :param test_name: Name of the test case
     :type test_name: str
@@ -14,29 +404,185 @@ def insert_test_result_to_influxdb(test_name, status, duration, timestamp):
     :type duration: float
     :param timestamp: Timestamp of the test execution (UTC)
     :type timestamp: datetime.datetime
+    :param browser: Browser the test ran in, if any
+    :type browser: str
+
+    """
+    try:
+        point = {
+            "measurement": "ui_test_results",
+            "tags": {
+                "test_name": test_name,
+                "status": status,
+            },
+            "time": timestamp.isoformat(),  # Artık dışarıdan gelen timestamp kullanılıyor
+            "fields": {
+                "duration": float(duration),
+                # MEAN("failed") günlük hata oranını verir
+                "failed": 0 if status == "PASSED" else 1,
+            }
+        }
+        if browser:
+            point["tags"]["browser"] = browser
+
+        writer = get_result_writer()
+        if writer.write(point):
+            print(f"📥 InfluxDB {writer.mode} kuyruğuna eklendi: {test_name} | {status} | {duration:.2f}s")
+
+    except Exception as e:
+        print(f"❌ InfluxDB yazım hatası: {e}")
+
+
+def insert_step_spans(spans, test_name, browser):
+    """
+    Queues the page-object step spans of a test as ``ui_test_steps`` points.
+
+    :param spans: Spans returned by ``StepRecorder.finish_test``
+    :type spans: list
+    :param test_name: Name of the test case
+    :type test_name: str
+    :param browser: Browser the test ran in
+    :type browser: str
 
     """
     try:
-        client = InfluxDBClient(host='localhost', port=8086)
-        client.switch_database('test_results')
-
-        json_body = [
-            {
-                "measurement": "ui_test_results",
-                "tags": {
-                    "test_name": test_name,
-                    "status": status,
-                },
-                "time": timestamp.isoformat(),  # Artık dışarıdan gelen timestamp kullanılıyor
+        writer = get_result_writer()
+        for span in spans:
+            tags = {"test_name": test_name, "browser": browser, "step": span.step}
+            if span.locator:
+                tags["locator"] = span.locator
+            writer.write({
+                "measurement": "ui_test_steps",
+                "tags": tags,
+                "time": span.started_ns,
                 "fields": {
-                    "duration": float(duration)
+                    "wall_time": span.wall_time,
+                    "wait_time": span.wait_time,
+                    "depth": span.depth,
+                    "timed_out": int(span.timed_out),
+                    "cached": int(span.cached),
                 }
-            }
-        ]
+            })
+        print(f"📥 InfluxDB kuyruğuna {len(spans)} adım eklendi: {test_name} | {browser}")
+
+    except Exception as e:
+        print(f"❌ InfluxDB yazım hatası: {e}")
 
-        client.write_points(json_body)
+
+def insert_page_metrics(records, test_name, browser):
+    """
+    Queues the page-load metrics of a test as ``ui_page_metrics`` points, one per navigation.
+
+    :param records: Records returned by ``PageTelemetry.finish_test``
+    :type records: list
+    :param test_name: Name of the test case
+    :type test_name: str
+    :param browser: Browser the test ran in
+    :type browser: str
+
+    """
+    try:
+        writer = get_result_writer()
+        for record in records:
+            fields = dict(record.values)
+            fields["url"] = record.url
+            fields["budget_violations"] = len(record.violations)
+            writer.write({
+                "measurement": "ui_page_metrics",
+                "tags": {"test_name": test_name, "browser": browser, "page": record.page},
+                "time": record.time_ns,
+                "fields": fields,
+            })
+        print(f"📥 InfluxDB kuyruğuna {len(records)} sayfa metriği eklendi: {test_name} | {browser}")
+
+    except Exception as e:
+        print(f"❌ InfluxDB yazım hatası: {e}")
+
+
+def fetch_test_history(days=14, host=INFLUXDB_HOST, port=INFLUXDB_PORT, database=INFLUXDB_DATABASE, timeout=5):
+    """
+    Reads the ``ui_test_results`` points of the last ``days`` days, oldest first.
+
+    :param int days: History window in days
+    :param host: InfluxDB host
+    :param int port: InfluxDB HTTP port
+    :param database: Source database name
+    :param timeout: Request timeout in seconds
+    :return: Dicts with 'time', 'test_name', 'status' and 'duration'
+    :rtype: list
+    :raises Exception: If InfluxDB cannot be queried
+
+    """
+    client = InfluxDBClient(host=host, port=port, database=database, timeout=timeout)
+    try:
+        result = client.query(
+            f'SELECT "duration", "status", "test_name" FROM "ui_test_results" WHERE time > now() - {int(days)}d'
+        )
+        return list(result.get_points())
+    finally:
         client.close()
-        print(f"✅ InfluxDB'ye veri yazıldı: {test_name} | {status} | {duration:.2f}s")
 
+
+# Süresi locator'ın bulunmasına kadar geçen beklemeyi ölçen adımlar; uyarlanan her bekleme bu adımdan geçer
+WAIT_STEPS = ("BasePage._locator_wait",)
+
+
+def fetch_step_wait_times(days=14, host=INFLUXDB_HOST, port=INFLUXDB_PORT, database=INFLUXDB_DATABASE, timeout=5):
+    """
+    Reads the wait times of the adaptive locator waits of the last ``days`` days.
+
+    Waits that timed out are included, their wait time is the timeout they ran into; waits on
+    cached elements are not.
+
+    :param int days: History window in days
+    :param host: InfluxDB host
+    :param int port: InfluxDB HTTP port
+    :param database: Source database name
+    :param timeout: Request timeout in seconds
+    :return: Dicts with 'time', 'locator', 'wait_time' and 'timed_out', oldest first
+    :rtype: list
+    :raises Exception: If InfluxDB cannot be queried
+
+    """
+    steps = " OR ".join(f"\"step\" = '{step}'" for step in WAIT_STEPS)
+    client = InfluxDBClient(host=host, port=port, database=database, timeout=timeout)
+    try:
+        result = client.query(
+            f'SELECT "wait_time", "timed_out", "locator" FROM "ui_test_steps" '
+            f'WHERE time > now() - {int(days)}d AND "cached" = 0 AND ({steps})'
+        )
+        return list(result.get_points())
+    finally:
+        client.close()
+
+
+def replay_spool(path=SPOOL_PATH, host=INFLUXDB_HOST, port=INFLUXDB_PORT, database=INFLUXDB_DATABASE):
+    """
+    Sends every spooled point to InfluxDB in bulk.
+
+    :param path: Spool file path
+    :param host: InfluxDB host
+    :param int port: InfluxDB HTTP port
+    :param database: Target database name
+    :return: Number of points sent, or None if the replay failed
+    :rtype: int
+
+    """
+    client = InfluxDBClient(host=host, port=port, database=database)
+    try:
+        count = ResultSpool(path).replay(client)
+        print(f"✅ Spool InfluxDB'ye aktarıldı: {count} kayıt")
+        return count
     except Exception as e:
-        print(f"❌ InfluxDB yazım hatası: {e}")
\ No newline at end of file
+        print(f"❌ Spool aktarım hatası: {e}")
+        return None
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    # python DBController.py replay [spool_path]
+    if len(sys.argv) >= 2 and sys.argv[1] == "replay":
+        sys.exit(0 if replay_spool(*sys.argv[2:3]) is not None else 1)
+    print("Usage: python DBController.py replay [spool_path]")
+    sys.exit(2)
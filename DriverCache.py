@@ -0,0 +1,261 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import stat
+import subprocess
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+
+
+DRIVER_CACHE_DIR = os.environ.get("DRIVER_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "insider-drivers"))
+# DRIVER_CACHE_OFFLINE=1 ağ erişimi olmadan sadece manifest'teki binary'leri kullanır
+DRIVER_CACHE_OFFLINE = os.environ.get("DRIVER_CACHE_OFFLINE", "0") == "1"
+# Online çalışmada bu süreden eski girdiler yeniden çözülür
+DRIVER_CACHE_MAX_AGE_DAYS = float(os.environ.get("DRIVER_CACHE_MAX_AGE_DAYS", "7"))
+MANIFEST_NAME = "manifest.json"
+
+
+def _install_chromedriver():
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def _install_geckodriver():
+    from webdriver_manager.firefox import GeckoDriverManager
+    return GeckoDriverManager().install()
+
+
+DEFAULT_INSTALLERS = {"chrome": _install_chromedriver, "firefox": _install_geckodriver}
+# Sürümü okunacak tarayıcı binary'leri; ilk bulunan kullanılır
+BROWSER_BINARIES = {
+    "chrome": ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser"),
+    "firefox": ("firefox",),
+}
+
+
+def installed_browser_major(browser):
+    """
+    Returns the major version of the installed browser, e.g. '126'.
+
+    :param browser: 'chrome' or 'firefox'
+    :return: Major version, or None if no browser binary answers ``--version``
+    :rtype: str
+
+    """
+    for name in BROWSER_BINARIES.get(browser, ()):
+        path = shutil.which(name)
+        if not path:
+            continue
+        try:
+            output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"(\d+)\.\d+", output)
+        if match:
+            return match.group(1)
+    return None
+
+
+class DriverBinaryCache:
+    """
+    Content-addressed cache of driver binaries with a manifest, resolved at most once per session.
+
+    Binaries are stored under ``blobs/<sha256>/`` and the manifest maps each browser and installed
+    major version (``chrome-126``) to the pinned digest, the driver version and how long the
+    original webdriver-manager resolution took, so a browser upgrade resolves a matching driver.
+    Once warmed the cache works fully offline. Files are written through unique temporary files,
+    so parallel processes warming the same cache do not collide.
+
+    :param directory: Cache directory
+    :param bool offline: Never call webdriver-manager, fail if a browser is not cached
+    :param float max_age_days: Age after which an online run re-resolves a pinned driver
+    :param installers: Mapping of browser to a callable returning a freshly resolved driver path
+    :param version_probe: Callable returning the installed major version of a browser, or None
+
+    """
+
+    def __init__(self, directory=DRIVER_CACHE_DIR, offline=DRIVER_CACHE_OFFLINE,
+                 max_age_days=DRIVER_CACHE_MAX_AGE_DAYS, installers=None, version_probe=installed_browser_major):
+        self.directory = directory
+        self.offline = offline
+        self.max_age_days = max_age_days
+        self.installers = installers or DEFAULT_INSTALLERS
+        self.version_probe = version_probe
+        self._resolved = {}
+        self._lock = threading.Lock()
+        self.stats = {"lookups": 0, "cache_hits": 0, "resolutions": 0, "seconds_saved": 0.0, "seconds_spent": 0.0}
+
+    @property
+    def manifest_path(self):
+        return os.path.join(self.directory, MANIFEST_NAME)
+
+    def load_manifest(self):
+        """
+        Returns the manifest, or an empty one if the cache was never warmed.
+
+        :rtype: dict
+
+        """
+        try:
+            with open(self.manifest_path, encoding="utf-8") as manifest_file:
+                return json.load(manifest_file)
+        except (OSError, ValueError):
+            return {}
+
+    def resolve(self, browser, refresh=False):
+        """
+        Returns the driver binary path for a browser.
+
+        The first call per session checks the manifest and the binary digest; later calls are
+        answered from memory. webdriver-manager only runs when the browser is not cached yet,
+        the entry is too old, or ``refresh`` is set.
+
+        :param browser: 'chrome' or 'firefox'
+        :param bool refresh: Re-resolve even if a pinned binary exists
+        :return: Absolute path of the driver binary
+        :rtype: str
+        :raises RuntimeError: If the cache is offline and has no valid binary for the browser
+
+        """
+        with self._lock:
+            self.stats["lookups"] += 1
+            if not refresh and browser in self._resolved:
+                path, resolve_seconds = self._resolved[browser]
+                self._record_hit(resolve_seconds)
+                return path
+
+            key = self.manifest_key(browser)
+            entry = self.load_manifest().get(key)
+            if not refresh and entry and self._is_usable(entry):
+                path = os.path.join(self.directory, entry["path"])
+                self._resolved[browser] = (path, entry["resolve_seconds"])
+                self._record_hit(entry["resolve_seconds"])
+                return path
+
+            if self.offline:
+                raise RuntimeError(f"No cached {key} driver available offline in {self.directory}")
+            path, resolve_seconds = self._warm(browser, key)
+            self._resolved[browser] = (path, resolve_seconds)
+            return path
+
+    def manifest_key(self, browser):
+        """
+        Returns the manifest key of a browser: its name and installed major version, e.g.
+        ``chrome-126``, or only the name if the version cannot be read.
+
+        :param browser: 'chrome' or 'firefox'
+        :rtype: str
+
+        """
+        major = self.version_probe(browser) if self.version_probe else None
+        return f"{browser}-{major}" if major else browser
+
+    def report(self):
+        """
+        Returns a one-line summary of the lookups and the time saved this session.
+
+        :rtype: str
+
+        """
+        return (f"📦 Driver cache: {self.stats['lookups']} lookups, {self.stats['cache_hits']} from cache, "
+                f"{self.stats['resolutions']} resolved, {self.stats['seconds_saved']:.1f}s saved, "
+                f"{self.stats['seconds_spent']:.1f}s spent resolving")
+
+    def _record_hit(self, resolve_seconds):
+        self.stats["cache_hits"] += 1
+        self.stats["seconds_saved"] += resolve_seconds
+
+    def _is_usable(self, entry):
+        path = os.path.join(self.directory, entry["path"])
+        if not os.path.isfile(path) or _sha256(path) != entry["sha256"]:
+            return False
+        if self.offline:
+            return True
+        resolved_at = datetime.fromisoformat(entry["resolved_at"])
+        age_days = (datetime.now(timezone.utc) - resolved_at).total_seconds() / 86400
+        return age_days < self.max_age_days
+
+    def _warm(self, browser, key):
+        started = time.perf_counter()
+        source = self.installers[browser]()
+        resolve_seconds = time.perf_counter() - started
+        self.stats["resolutions"] += 1
+        self.stats["seconds_spent"] += resolve_seconds
+
+        digest = _sha256(source)
+        relative_path = os.path.join("blobs", digest, os.path.basename(source))
+        target = os.path.join(self.directory, relative_path)
+        if not os.path.exists(target) or _sha256(target) != digest:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            temp_path = _temp_path(target)
+            shutil.copy2(source, temp_path)
+            os.chmod(temp_path, os.stat(temp_path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+            os.replace(temp_path, target)
+
+        os.makedirs(self.directory, exist_ok=True)
+        manifest = self.load_manifest()
+        manifest[key] = {
+            "sha256": digest,
+            "path": relative_path,
+            "version": os.path.basename(os.path.dirname(source)),
+            "resolve_seconds": round(resolve_seconds, 3),
+            "resolved_at": datetime.now(timezone.utc).isoformat(),
+        }
+        temp_path = _temp_path(self.manifest_path)
+        with open(temp_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+        os.replace(temp_path, self.manifest_path)
+        print(f"📥 {key} driver pinned: {manifest[key]['version']} ({digest[:12]})")
+        return target, manifest[key]["resolve_seconds"]
+
+
+def _temp_path(path):
+    # Aynı dizinde benzersiz geçici dosya; os.replace atomik kalır ve paralel süreçler çakışmaz
+    handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + ".")
+    os.close(handle)
+    return temp_path
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as binary:
+        for chunk in iter(lambda: binary.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+_driver_cache = None
+
+
+def get_driver_cache():
+    """
+    Returns the process-wide driver cache.
+
+    :rtype: DriverBinaryCache
+
+    """
+    global _driver_cache
+    if _driver_cache is None:
+        _driver_cache = DriverBinaryCache()
+    return _driver_cache
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Warm or inspect the local driver binary cache.")
+    parser.add_argument("command", choices=["warm", "show"])
+    parser.add_argument("browsers", nargs="*", default=list(DEFAULT_INSTALLERS))
+    parser.add_argument("--refresh", action="store_true")
+    args = parser.parse_args()
+
+    cache = DriverBinaryCache(offline=False)
+    if args.command == "warm":
+        for name in args.browsers:
+            print(f"{name}: {cache.resolve(name, refresh=args.refresh)}")
+        print(cache.report())
+    else:
+        print(json.dumps(cache.load_manifest(), indent=2, sort_keys=True))
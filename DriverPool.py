@@ -0,0 +1,251 @@
+import os
+import threading
+import urllib.parse
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from DriverCache import get_driver_cache
+from BrowserProfiles import get_profile, build_options, apply_profile, acquire_profile_dir, release_profile_dir
+from RequestFilter import REQUEST_FILTER_ENABLED, attach_request_filter, get_filter_rules, get_filtering_proxy
+
+
+# Tarayıcı başına bekletilecek en fazla boşta driver sayısı
+DRIVER_POOL_SIZE = int(os.environ.get("DRIVER_POOL_SIZE", "1"))
+
+
+def create_driver(browser, profile=None, proxy=None):
+    """
+    Launches a new WebDriver session for the given browser and launch profile.
+
+    With ``REQUEST_FILTER=1`` third-party requests are blocked: Chrome through DevTools,
+    Firefox through the process-wide filtering proxy.
+
+    :param browser: 'chrome' or 'firefox'
+    :param profile: Launch profile, defaults to the one selected by ``BROWSER_PROFILE``
+    :type profile: BrowserProfiles.LaunchProfile
+    :param proxy: Filtering proxy to route the browser traffic through
+    :type proxy: RequestFilter.FilteringProxy
+    :return: Selenium WebDriver instance
+    :raises ValueError: If the browser is not supported
+
+    """
+    profile = profile or get_profile()
+    if proxy is None and REQUEST_FILTER_ENABLED and browser == "firefox":
+        proxy = get_filtering_proxy()
+    profile_dir = acquire_profile_dir(browser) if profile.warm_profile else None
+    try:
+        options = build_options(browser, profile, profile_dir, proxy)
+        if browser == "chrome":
+            service = ChromeService(get_driver_cache().resolve(browser))
+            driver = webdriver.Chrome(service=service, options=options)
+        else:
+            service = FirefoxService(get_driver_cache().resolve(browser))
+            driver = webdriver.Firefox(service=service, options=options)
+    except Exception:
+        if profile_dir:
+            release_profile_dir(profile_dir)
+        raise
+
+    driver.profile_dir = profile_dir
+    apply_profile(driver, profile)
+    if REQUEST_FILTER_ENABLED and proxy is None:
+        attach_request_filter(driver, get_filter_rules())
+    return driver
+
+
+def _origin(url):
+    if not isinstance(url, str):
+        return None
+    parts = urllib.parse.urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}" if parts.scheme in ("http", "https") and parts.netloc else None
+
+
+def track_origins(driver):
+    """
+    Records the origins a driver loads in ``driver.visited_origins``.
+
+    The URLs are taken from the commands the driver already sends: navigations, current URL
+    reads, URL arguments of scripts (tab navigation) and script results with a ``url`` field
+    (page state and metrics reads). Origins only loaded as third-party resources are not seen.
+
+    :param driver: Selenium WebDriver instance
+    :return: The same driver
+
+    """
+    if hasattr(driver, "visited_origins"):
+        return driver
+    driver.visited_origins = set()
+    execute = driver.execute
+
+    def tracking_execute(driver_command, params=None):
+        response = execute(driver_command, params)
+        urls = []
+        if driver_command == Command.GET:
+            urls.append(params["url"])
+        elif driver_command in (Command.W3C_EXECUTE_SCRIPT, Command.W3C_EXECUTE_SCRIPT_ASYNC):
+            urls.extend((params or {}).get("args", []))
+        value = response.get("value") if isinstance(response, dict) else None
+        urls.append(value.get("url") if isinstance(value, dict) else value)
+        driver.visited_origins.update(origin for origin in map(_origin, urls) if origin)
+        return response
+
+    driver.execute = tracking_execute
+    return driver
+
+
+class DriverPool:
+    """
+    Pool of warm WebDriver sessions keyed by browser type.
+
+    Tests borrow a driver with :meth:`acquire` and give it back with :meth:`release`, which
+    resets the browser state instead of quitting it. Drivers that fail the health check or
+    the reset are quit and replaced by a fresh launch.
+
+    The reset clears cookies and storage of every origin the driver loaded during the test
+    (see :func:`track_origins`), including origins whose tabs were already closed.
+
+    :param int size: Maximum number of idle drivers kept per browser
+    :param factory: Callable that launches a driver for a browser name
+
+    """
+
+    def __init__(self, size=DRIVER_POOL_SIZE, factory=create_driver):
+        self.size = size
+        self.factory = factory
+        self._idle = {}
+        self._lock = threading.Lock()
+        self.stats = {"launches": 0, "reuses": 0, "recycled": 0}
+
+    def acquire(self, browser):
+        """
+        Returns a healthy idle driver for the browser, or launches a new one.
+
+        :param browser: 'chrome' or 'firefox'
+        :return: Selenium WebDriver instance
+
+        """
+        while True:
+            with self._lock:
+                idle = self._idle.get(browser)
+                driver = idle.pop() if idle else None
+            if driver is None:
+                break
+            if self.is_healthy(driver):
+                self._count("reuses")
+                print(f"♻️ {browser} driver reused.")
+                return driver
+            self._recycle(driver)
+
+        print(f"🚀 Launching new {browser} driver.")
+        driver = track_origins(self.factory(browser))
+        self._count("launches")
+        return driver
+
+    def release(self, driver, browser):
+        """
+        Resets the driver and returns it to the pool, or quits it if the pool is full.
+
+        :param driver: Driver returned by :meth:`acquire`
+        :param browser: Browser the driver was acquired for
+
+        """
+        try:
+            self.reset(driver)
+        except WebDriverException as e:
+            print(f"⚠️ Driver reset failed, recycling: {e}")
+            self._recycle(driver)
+            return
+
+        with self._lock:
+            idle = self._idle.setdefault(browser, [])
+            if len(idle) < self.size:
+                idle.append(driver)
+                return
+        self._quit(driver)
+
+    def reset(self, driver):
+        """
+        Clears cookies and storage of every visited origin, closes extra tabs and leaves the first one on about:blank.
+
+        The open tabs are cleared in place. Other visited origins are cleared through DevTools
+        on Chrome; without DevTools (Firefox) the first tab visits each origin's ``/robots.txt``,
+        a small same-origin document, and clears it there.
+
+        :param driver: Selenium WebDriver instance
+
+        """
+        handles = driver.window_handles
+        cleared = set()
+        for handle in reversed(handles):
+            driver.switch_to.window(handle)
+            cleared.add(_origin(driver.current_url))
+            self._clear_storage(driver)
+            if handle != handles[0]:
+                driver.close()
+        driver.switch_to.window(handles[0])
+
+        visited = set(getattr(driver, "visited_origins", ()))
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            for origin in sorted(visited):
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        else:
+            for origin in sorted(visited - cleared):
+                driver.get(f"{origin}/robots.txt")
+                self._clear_storage(driver)
+        driver.get("about:blank")
+        if hasattr(driver, "visited_origins"):
+            driver.visited_origins.clear()
+
+    def is_healthy(self, driver):
+        """
+        Checks that the driver session still responds.
+
+        :param driver: Selenium WebDriver instance
+        :rtype: bool
+
+        """
+        try:
+            driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    def close(self):
+        """
+        Quits every idle driver and prints the pool counters.
+
+        """
+        with self._lock:
+            drivers = [driver for idle in self._idle.values() for driver in idle]
+            self._idle.clear()
+        for driver in drivers:
+            self._quit(driver)
+        print(f"📊 Driver pool: {self.stats['launches']} launched, {self.stats['reuses']} reused, "
+              f"{self.stats['recycled']} recycled")
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _clear_storage(self, driver):
+        driver.delete_all_cookies()
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except WebDriverException:
+            # about:blank ve bazı sayfalarda storage erişimi yok
+            pass
+
+    def _recycle(self, driver):
+        self._count("recycled")
+        self._quit(driver)
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+        if getattr(driver, "profile_dir", None):
+            release_profile_dir(driver.profile_dir)
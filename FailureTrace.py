@@ -0,0 +1,137 @@
+import base64
+import gzip
+import json
+import os
+import queue
+import re
+import threading
+from datetime import datetime, timezone
+from selenium.common.exceptions import WebDriverException
+
+
+FAILURE_TRACE_DIR = os.environ.get("FAILURE_TRACE_DIR", "failure-traces")
+
+# Background thread'e gönderilen kontrol mesajı
+_STOP = object()
+
+
+class FailureTraceWriter:
+    """
+    Writes failure traces on a background thread.
+
+    Only the browser round trips happen on the calling thread; decoding the screenshot,
+    compressing the DOM snapshot and writing the files are done by the worker so the
+    failing test's teardown is not blocked.
+
+    :param directory: Directory the traces are written under
+
+    """
+
+    def __init__(self, directory=FAILURE_TRACE_DIR):
+        self.directory = directory
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.written = []
+
+    def capture(self, driver, test_name, actions, error=None):
+        """
+        Grabs the screenshot, page source and URL of a failed test and queues the trace for writing.
+
+        :param driver: Selenium WebDriver instance, or None if the test had no browser
+        :param test_name: Name of the failed test
+        :param actions: Recent page-object spans, oldest first
+        :param error: Failure description from the pytest report
+        :return: Directory the trace will be written to
+        :rtype: str
+
+        """
+        trace = {
+            "test_name": test_name,
+            "failed_at": datetime.now(timezone.utc).isoformat(),
+            "error": error,
+            "url": None,
+            "actions": [span.as_dict() for span in actions],
+        }
+        screenshot, page_source = None, None
+        if driver is not None:
+            try:
+                trace["url"] = driver.current_url
+                screenshot = driver.get_screenshot_as_base64()
+                page_source = driver.page_source
+            except WebDriverException as e:
+                trace["capture_error"] = str(e)
+
+        safe_name = re.sub(r"[^\w.-]+", "_", test_name)
+        path = os.path.join(self.directory, f"{safe_name}-{datetime.now():%Y%m%d-%H%M%S-%f}")
+        self._start()
+        self._queue.put((path, trace, screenshot, page_source))
+        return path
+
+    def close(self, timeout=None):
+        """
+        Waits until every queued trace is written and stops the worker.
+
+        :param timeout: Seconds to wait for the worker
+
+        """
+        with self._lock:
+            if self._thread is None:
+                return
+            self._queue.put(_STOP)
+            thread, self._thread = self._thread, None
+        thread.join(timeout)
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="failure-trace-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            try:
+                self._write(*item)
+            except Exception as e:
+                print(f"❌ Writing the failure trace failed: {e}")
+
+    def _write(self, path, trace, screenshot, page_source):
+        os.makedirs(path, exist_ok=True)
+        if screenshot:
+            with open(os.path.join(path, "screenshot.png"), "wb") as screenshot_file:
+                screenshot_file.write(base64.b64decode(screenshot))
+        if page_source is not None:
+            with gzip.open(os.path.join(path, "dom.html.gz"), "wt", encoding="utf-8") as dom_file:
+                dom_file.write(page_source)
+        with open(os.path.join(path, "trace.json"), "w", encoding="utf-8") as trace_file:
+            json.dump(trace, trace_file, indent=2)
+        self.written.append(path)
+        print(f"🧾 Failure trace written: {path}")
+
+
+_trace_writer = None
+
+
+def get_trace_writer():
+    """
+    Returns the process-wide failure trace writer.
+
+    :rtype: FailureTraceWriter
+
+    """
+    global _trace_writer
+    if _trace_writer is None:
+        _trace_writer = FailureTraceWriter()
+    return _trace_writer
+
+
+def close_trace_writer():
+    """
+    Waits for the pending failure traces, if any writer was created.
+
+    """
+    if _trace_writer is not None:
+        _trace_writer.close()
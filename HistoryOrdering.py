@@ -0,0 +1,119 @@
+import json
+import os
+
+
+# TEST_HISTORY_ORDER=0 sıralamayı ve flaky rerun işaretlerini kapatır
+HISTORY_ORDER_ENABLED = os.environ.get("TEST_HISTORY_ORDER", "1") == "1"
+# 'auto' önce InfluxDB'yi dener, 'cache' sadece yerel dosyayı okur (paralel worker'lar)
+HISTORY_SOURCE = os.environ.get("TEST_HISTORY_SOURCE", "auto")
+HISTORY_CACHE_PATH = os.environ.get("TEST_HISTORY_CACHE", ".test-history.json")
+HISTORY_DAYS = int(os.environ.get("TEST_HISTORY_DAYS", "14"))
+# Geçmişte en az bu kadar durum değişimi (PASSED <-> FAIL) olan testler flaky sayılır
+FLAKY_MIN_FLIPS = int(os.environ.get("TEST_HISTORY_FLAKY_FLIPS", "2"))
+FLAKY_RERUNS = int(os.environ.get("TEST_HISTORY_RERUNS", "2"))
+
+# Sıralama katmanları: son koşusu düşenler, flaky'ler, geçmişi olmayanlar, stabil testler
+FAILING, FLAKY, UNKNOWN, STABLE = range(4)
+
+
+def summarize_history(rows, flaky_min_flips=FLAKY_MIN_FLIPS):
+    """
+    Summarizes ``ui_test_results`` rows per test.
+
+    :param rows: Dicts with 'time', 'test_name', 'status' and 'duration'
+    :param int flaky_min_flips: Status changes that make a test flaky
+    :return: ``{test_name: {"runs", "failures", "flips", "last_failed", "avg_duration", "flaky"}}``
+    :rtype: dict
+
+    """
+    history = {}
+    for row in sorted(rows, key=lambda row: row["time"]):
+        stats = history.setdefault(row["test_name"], {
+            "runs": 0, "failures": 0, "flips": 0, "last_failed": False, "total_duration": 0.0,
+        })
+        failed = row["status"] != "PASSED"
+        if stats["runs"] and failed != stats["last_failed"]:
+            stats["flips"] += 1
+        stats["runs"] += 1
+        stats["failures"] += failed
+        stats["last_failed"] = failed
+        stats["total_duration"] += row["duration"] or 0.0
+
+    for stats in history.values():
+        stats["avg_duration"] = stats.pop("total_duration") / stats["runs"]
+        stats["flaky"] = stats["flips"] >= flaky_min_flips
+    return history
+
+
+def load_history(source=HISTORY_SOURCE, cache_path=HISTORY_CACHE_PATH, days=HISTORY_DAYS):
+    """
+    Returns the summarized test history from InfluxDB, falling back to the local cache file.
+
+    A successful InfluxDB read refreshes the cache, so later runs and parallel workers can
+    order tests without a database.
+
+    :param source: 'auto' to try InfluxDB first, 'cache' to read only the cache file
+    :param cache_path: Local cache file
+    :param int days: History window in days
+    :return: Summary in the :func:`summarize_history` format, empty if nothing is available
+    :rtype: dict
+
+    """
+    if source == "auto":
+        try:
+            from DBController import fetch_test_history
+            history = summarize_history(fetch_test_history(days))
+            with open(cache_path + ".tmp", "w", encoding="utf-8") as cache_file:
+                json.dump(history, cache_file, indent=2, sort_keys=True)
+            os.replace(cache_path + ".tmp", cache_path)
+            return history
+        except Exception as e:
+            print(f"⚠️ Test history could not be read from InfluxDB, using {cache_path}: {e}")
+    try:
+        with open(cache_path, encoding="utf-8") as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def tier(stats):
+    """
+    Returns the scheduling tier of a test's history summary.
+
+    :param stats: Summary of one test, or None for a test without history
+    :rtype: int
+
+    """
+    if stats is None:
+        return UNKNOWN
+    if stats["last_failed"]:
+        return FAILING
+    return FLAKY if stats["flaky"] else STABLE
+
+
+def order_items(items, history):
+    """
+    Orders tests so recent failures and flaky tests run first and, within a tier, long tests start early.
+
+    :param items: pytest items, or anything with a ``name`` attribute
+    :param history: Summary from :func:`load_history`
+    :return: Items in scheduling order; the collection order breaks ties
+    :rtype: list
+
+    """
+    def key(item):
+        stats = history.get(item.name)
+        return tier(stats), -(stats["avg_duration"] if stats else 0.0)
+
+    return sorted(items, key=key)
+
+
+def flaky_tests(history):
+    """
+    Returns the names of the tests with a flaky history.
+
+    :param history: Summary from :func:`load_history`
+    :rtype: set
+
+    """
+    return {name for name, stats in history.items() if stats["flaky"]}
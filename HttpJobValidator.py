@@ -0,0 +1,159 @@
+import argparse
+import html
+import os
+import re
+import sys
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from pages.JobListings import JobFilter, JobRecord, JobSnapshot
+
+
+# Careers sayfasındaki iş listesi bu lever.co API'sinden gelir
+LEVER_API_URL = os.environ.get("LEVER_API_URL", "https://api.lever.co/v0/postings/useinsider?mode=json")
+LEVER_JOB_HOST = os.environ.get("LEVER_JOB_HOST", "jobs.lever.co")
+# JOB_VALIDATION=http iş listesi kontrollerini tarayıcısız yapar, tarayıcı akışı sadece etkileşimleri test eder
+JOB_VALIDATION = os.environ.get("JOB_VALIDATION", "browser")
+
+_TITLE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+
+class JobApiClient:
+    """
+    Pooled HTTP client for the lever.co postings behind the careers pages.
+
+    One ``requests.Session`` with a sized connection pool and retries is shared by every
+    request, including the concurrent job-page checks.
+
+    :param api_url: Lever postings API URL
+    :param job_host: Host the "View Role" links must lead to
+    :param int pool_size: Connections kept per host
+    :param float timeout: Timeout of each request in seconds
+
+    """
+
+    def __init__(self, api_url=LEVER_API_URL, job_host=LEVER_JOB_HOST, pool_size=10, timeout=10):
+        self.api_url = api_url
+        self.job_host = job_host
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                              max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["User-Agent"] = "insider-ui-tests/http-validator"
+
+    def fetch_postings(self):
+        """
+        Fetches every posting and returns them as job records.
+
+        Insider shows the lever ``team`` category as the department on the careers page.
+
+        :rtype: JobSnapshot
+        :raises requests.RequestException: If the API cannot be read
+
+        """
+        response = self.session.get(self.api_url, timeout=self.timeout)
+        response.raise_for_status()
+        records = []
+        for posting in response.json():
+            categories = posting.get("categories") or {}
+            records.append(JobRecord(
+                title=(posting.get("text") or "").strip(),
+                department=categories.get("team") or categories.get("department"),
+                location=categories.get("location"),
+                link=posting.get("hostedUrl"),
+            ))
+        return JobSnapshot(records)
+
+    def check_job_page(self, record):
+        """
+        Opens a job's "View Role" link and checks that it is a live lever.co page for that job.
+
+        :param record: Job record
+        :type record: JobRecord
+        :return: Dict with 'link', 'status', 'final_url', 'page_title' and 'ok'
+        :rtype: dict
+
+        """
+        try:
+            response = self.session.get(record.link, timeout=self.timeout)
+        except requests.RequestException as e:
+            return {"link": record.link, "status": None, "final_url": None, "page_title": None, "ok": False,
+                    "error": str(e)}
+        body = html.unescape(response.text)
+        match = _TITLE.search(body)
+        final_host = urllib.parse.urlsplit(response.url).hostname or ""
+        ok = (response.status_code == 200 and final_host.endswith(self.job_host)
+              and record.title.lower() in body.lower())
+        return {"link": record.link, "status": response.status_code, "final_url": response.url,
+                "page_title": match.group(1).strip() if match else None, "ok": ok}
+
+    def check_job_pages(self, records, workers=None):
+        """
+        Checks several job pages concurrently over the shared connection pool.
+
+        :param records: Job records
+        :param int workers: Concurrent requests, defaults to the pool size
+        :return: Results of :meth:`check_job_page` in record order
+        :rtype: list
+
+        """
+        with ThreadPoolExecutor(max_workers=workers or self.pool_size) as executor:
+            return list(executor.map(self.check_job_page, records))
+
+    def close(self):
+        self.session.close()
+
+
+def validate_job_listings(client, department="Quality Assurance", location="Istanbul", check_all_pages=False):
+    """
+    Checks the same criteria as ``QAPage.verify_job_listings`` and ``verify_view_role_redirects``
+    without a browser: jobs of the department exist in the location and their "View Role" links
+    lead to lever.co job pages.
+
+    :param client: Job API client
+    :type client: JobApiClient
+    :param department: Department the listing is filtered by
+    :param location: Location the listing is filtered by
+    :param bool check_all_pages: Check every matching job page instead of only the first one
+    :return: Dict with 'jobs', 'matching', 'pages', 'ok' and 'seconds'
+    :rtype: dict
+
+    """
+    started = time.perf_counter()
+    snapshot = client.fetch_postings()
+    matching = snapshot.evaluate({"match": JobFilter(department=department, location=location)})["match"]
+    pages = client.check_job_pages(matching if check_all_pages else matching[:1])
+    return {
+        "jobs": len(snapshot),
+        "matching": matching,
+        "pages": pages,
+        "ok": bool(matching) and all(page["ok"] for page in pages),
+        "seconds": time.perf_counter() - started,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Validate the QA job listings and lever.co links without a browser.")
+    parser.add_argument("--api-url", default=LEVER_API_URL)
+    parser.add_argument("--department", default="Quality Assurance")
+    parser.add_argument("--location", default="Istanbul")
+    parser.add_argument("--all-pages", action="store_true")
+    args = parser.parse_args()
+
+    job_client = JobApiClient(args.api_url)
+    try:
+        result = validate_job_listings(job_client, args.department, args.location, args.all_pages)
+    finally:
+        job_client.close()
+    for page in result["pages"]:
+        print(f"{'✅' if page['ok'] else '❌'} {page['status']} {page['final_url'] or page['link']}")
+    print(f"🎯 {len(result['matching'])}/{result['jobs']} jobs match, {result['seconds']:.2f}s")
+    sys.exit(0 if result["ok"] else 1)
@@ -0,0 +1,307 @@
+import argparse
+import heapq
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from DBController import RESULT_MODE, SPOOL_PATH, replay_spool
+from pages.AdaptiveTimeouts import timeout_model
+from pages.EventLog import EVENT_LOG_PATH, events
+
+
+DEFAULT_TARGET = "tests/tests.py"
+# Bir tarayıcı oturumu + pytest süreci için ayrılan tahmini bellek
+MEMORY_PER_WORKER_MB = 1024
+# ConfigTest hook'ları her süreçte plugin olarak yüklenir
+PYTEST_PLUGIN_ARGS = ["-p", "ConfigTest", "-p", "no:warnings", "--capture=tee-sys"]
+
+
+def _worker_env(**overrides):
+    env = dict(os.environ)
+    paths = [os.getcwd(), os.path.join(os.getcwd(), "tests"), env.get("PYTHONPATH")]
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, paths))
+    env.update(overrides)
+    return env
+
+
+def collect_tests(targets):
+    """
+    Collects the test node ids in the order ConfigTest sorted them.
+
+    :param targets: pytest paths or node ids
+    :type targets: list
+    :return: Node ids such as ``tests/tests.py::test_insider_career_page[chrome]``
+    :rtype: list
+    :raises subprocess.CalledProcessError: If collection fails, e.g. on an import error
+
+    """
+    command = [sys.executable, "-m", "pytest", "--collect-only", "-q", *PYTEST_PLUGIN_ARGS, *targets]
+    result = subprocess.run(command, capture_output=True, text=True, env=_worker_env())
+    # 5: hiç test toplanmadı, hata sayılmaz
+    if result.returncode not in (0, 5):
+        raise subprocess.CalledProcessError(result.returncode, command, result.stdout, result.stderr)
+    return [line.strip() for line in result.stdout.splitlines() if "::" in line]
+
+
+def collect_shards(node_ids):
+    """
+    Groups node ids into one shard per browser, keeping the collection order inside each shard.
+
+    A shard runs in one pytest process, so the session-scoped driver pool and driver cache are
+    shared by every test of that browser. Tests without a browser parameter form their own shard.
+
+    :param node_ids: Node ids returned by :func:`collect_tests`
+    :type node_ids: list
+    :return: ``(browser, node_ids)`` pairs in order of first appearance
+    :rtype: list
+
+    """
+    shards = {}
+    for node_id in node_ids:
+        shards.setdefault(shard_browser(node_id), []).append(node_id)
+    return list(shards.items())
+
+
+def shard_browser(node_id):
+    """
+    Returns the browser parameter of a node id, if any.
+
+    :param node_id: pytest node id
+    :rtype: str
+
+    """
+    match = re.search(r"\[(chrome|firefox)[\]-]", node_id)
+    return match.group(1) if match else "none"
+
+
+def available_memory_mb():
+    """
+    Returns the memory currently available for new processes, in MB.
+
+    :return: Available memory or None if it cannot be determined
+    :rtype: int
+
+    """
+    try:
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def worker_limit(shard_count, max_workers=None, memory_per_worker_mb=MEMORY_PER_WORKER_MB):
+    """
+    Caps concurrency by CPU cores, available memory, shard count and an optional explicit limit.
+
+    :param int shard_count: Number of shards to run
+    :param int max_workers: Explicit upper bound
+    :param int memory_per_worker_mb: Memory budget for one worker
+    :rtype: int
+
+    """
+    limits = [shard_count, os.cpu_count() or 1]
+    memory = available_memory_mb()
+    if memory is not None:
+        limits.append(memory // memory_per_worker_mb)
+    if max_workers:
+        limits.append(max_workers)
+    return max(1, min(limits))
+
+
+def run_shard(index, node_ids, work_dir, fail_fast=False):
+    """
+    Runs one shard in its own pytest process with private Allure and spool outputs.
+
+    :param int index: Shard index, used for output directory names
+    :param node_ids: pytest node ids to run
+    :type node_ids: list
+    :param work_dir: Directory holding every shard's outputs
+    :param bool fail_fast: Stop the shard at its first failure
+    :return: Shard index, node ids, exit code, duration and captured output
+    :rtype: tuple
+
+    """
+    env = _worker_env(
+        TEST_HISTORY_SOURCE="cache",
+        TIMEOUT_MODEL_SOURCE="cache",
+        INFLUXDB_RESULT_MODE="spool",
+        INFLUXDB_SPOOL_PATH=os.path.join(work_dir, "spool", f"{index}.lp"),
+        EVENT_LOG_PATH=os.path.join(work_dir, "events", f"{index}.jsonl"),
+    )
+    allure_dir = os.path.join(work_dir, "allure", str(index))
+    options = ["-x"] if fail_fast else []
+
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", *node_ids, *PYTEST_PLUGIN_ARGS, *options, f"--alluredir={allure_dir}"],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, env=env
+    )
+    return index, node_ids, result.returncode, time.perf_counter() - started, result.stdout
+
+
+def merge_allure_results(work_dir, alluredir):
+    """
+    Copies every shard's Allure result files into one directory.
+
+    Result files are uniquely named by Allure; identical files produced twice are copied once.
+
+    :param work_dir: Directory holding every shard's outputs
+    :param alluredir: Final Allure results directory
+    :return: Number of files copied
+    :rtype: int
+
+    """
+    os.makedirs(alluredir, exist_ok=True)
+    copied = 0
+    shard_root = os.path.join(work_dir, "allure")
+    for shard in sorted(os.listdir(shard_root)) if os.path.isdir(shard_root) else []:
+        shard_dir = os.path.join(shard_root, shard)
+        for name in sorted(os.listdir(shard_dir)):
+            target = os.path.join(alluredir, name)
+            if not os.path.exists(target):
+                shutil.copy2(os.path.join(shard_dir, name), target)
+                copied += 1
+    return copied
+
+
+def merge_spools(work_dir, spool_path=SPOOL_PATH):
+    """
+    Appends every shard spool, in shard order, to the main spool file.
+
+    :param work_dir: Directory holding every shard's outputs
+    :param spool_path: Main spool file
+    :return: Number of lines merged
+    :rtype: int
+
+    """
+    merged = 0
+    spool_root = os.path.join(work_dir, "spool")
+    shard_files = sorted(os.listdir(spool_root), key=lambda name: int(name.split(".")[0])) \
+        if os.path.isdir(spool_root) else []
+    with open(spool_path, "a", encoding="utf-8") as spool_file:
+        for name in shard_files:
+            with open(os.path.join(spool_root, name), encoding="utf-8") as shard_file:
+                for line in shard_file:
+                    spool_file.write(line)
+                    merged += 1
+    return merged
+
+
+def merge_event_logs(work_dir, event_log_path=EVENT_LOG_PATH):
+    """
+    Appends every shard's event log to the main one, interleaved by event time.
+
+    :param work_dir: Directory holding every shard's outputs
+    :param event_log_path: Main JSONL event log
+    :return: Number of events merged
+    :rtype: int
+
+    """
+    events_root = os.path.join(work_dir, "events")
+    shard_files = [open(os.path.join(events_root, name), encoding="utf-8")
+                   for name in sorted(os.listdir(events_root))] if os.path.isdir(events_root) else []
+    merged = 0
+    try:
+        # Her shard dosyası kendi içinde zaman sıralı; heapq.merge dosyaları belleğe almadan birleştirir
+        with open(event_log_path, "a", encoding="utf-8") as log_file:
+            for line in heapq.merge(*shard_files, key=lambda line: json.loads(line)["time"]):
+                log_file.write(line)
+                merged += 1
+    finally:
+        for shard_file in shard_files:
+            shard_file.close()
+    return merged
+
+
+def run_parallel(targets, alluredir="allure-results", max_workers=None, memory_per_worker_mb=MEMORY_PER_WORKER_MB,
+                 fail_fast=False):
+    """
+    Runs one shard per browser in parallel worker processes and merges their results.
+
+    Each shard runs its tests in collection order, which ConfigTest sorts by history: recent
+    failures and flaky tests first, long tests early. Shard output is printed as one block per
+    finished shard so logs do not interleave.
+    Allure files are merged into ``alluredir`` and InfluxDB points go through the main spool,
+    which is replayed once at the end unless the run itself is in spool mode. Each shard writes
+    its own event log, merged into ``EVENT_LOG_PATH`` in time order.
+    The adaptive timeout model is refreshed here once; workers only read its file.
+
+    :param targets: pytest paths or node ids
+    :type targets: list
+    :param alluredir: Final Allure results directory
+    :param int max_workers: Explicit concurrency limit
+    :param int memory_per_worker_mb: Memory budget for one worker
+    :param bool fail_fast: Do not start new shards once a shard has failed
+    :return: 0 if every shard passed, otherwise the collection or first non-zero shard exit code
+    :rtype: int
+
+    """
+    try:
+        shards = collect_shards(collect_tests(targets))
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Test collection failed (exit {e.returncode}):\n{e.stdout}{e.stderr}", file=sys.stderr)
+        return e.returncode
+    if not shards:
+        print("⚠️ No tests collected.")
+        return 5
+
+    timeout_model.load()
+    events.flush()
+    workers = worker_limit(len(shards), max_workers, memory_per_worker_mb)
+    print(f"🚀 {len(shards)} shards ({', '.join(browser for browser, _ in shards)}) on {workers} workers")
+    exit_code = 0
+    started = time.perf_counter()
+    slowest = 0.0
+
+    with tempfile.TemporaryDirectory(prefix="parallel-run-") as work_dir:
+        os.makedirs(os.path.join(work_dir, "spool"))
+        os.makedirs(os.path.join(work_dir, "events"))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_shard, index, node_ids, work_dir, fail_fast)
+                       for index, (browser, node_ids) in enumerate(shards)]
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                index, node_ids, returncode, duration, output = future.result()
+                slowest = max(slowest, duration)
+                status = "✅" if returncode == 0 else "❌"
+                print(f"\n{status} [{shards[index][0]}] {len(node_ids)} tests ({duration:.1f}s)\n{output}", flush=True)
+                if returncode and not exit_code:
+                    exit_code = returncode
+                    if fail_fast:
+                        skipped = sum(pending.cancel() for pending in futures)
+                        print(f"⛔ Fail-fast: {skipped} shards not started", flush=True)
+
+        print(f"🧾 Allure results merged: {merge_allure_results(work_dir, alluredir)} files")
+        merged_points = merge_spools(work_dir)
+        print(f"📥 Spooled InfluxDB points merged: {merged_points}")
+        print(f"🗒 Events merged into {EVENT_LOG_PATH}: {merge_event_logs(work_dir)}")
+
+    if merged_points and RESULT_MODE != "spool":
+        replay_spool()
+
+    print(f"⏱ Wall time {time.perf_counter() - started:.1f}s, slowest shard {slowest:.1f}s")
+    return exit_code
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the browser matrix in parallel worker processes.")
+    parser.add_argument("targets", nargs="*", default=[DEFAULT_TARGET])
+    parser.add_argument("--alluredir", default="allure-results")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--memory-per-worker-mb", type=int, default=MEMORY_PER_WORKER_MB)
+    parser.add_argument("--fail-fast", action="store_true")
+    args = parser.parse_args()
+    sys.exit(run_parallel(args.targets, args.alluredir, args.workers, args.memory_per_worker_mb, args.fail_fast))
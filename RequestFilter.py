@@ -0,0 +1,417 @@
+import argparse
+import http.client
+import os
+import select
+import socket
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# REQUEST_FILTER=1 üçüncü parti istekleri engeller (Chrome: DevTools, Firefox: yerel proxy)
+REQUEST_FILTER_ENABLED = os.environ.get("REQUEST_FILTER", "0") == "1"
+# Virgülle ayrılmış ek domainler ve resource type'lar: REQUEST_FILTER_DOMAINS=cdn.example.com
+REQUEST_FILTER_DOMAINS = [d for d in os.environ.get("REQUEST_FILTER_DOMAINS", "").split(",") if d]
+REQUEST_FILTER_TYPES = [t for t in os.environ.get("REQUEST_FILTER_TYPES", "").split(",") if t]
+
+DEFAULT_BLOCKED_DOMAINS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net", "googleadservices.com",
+    "facebook.net", "connect.facebook.net", "hotjar.com", "clarity.ms", "bat.bing.com",
+    "snap.licdn.com", "px.ads.linkedin.com", "widget.intercom.io", "js.driftt.com",
+    "js.hs-scripts.com", "js.hs-analytics.net", "js.hsadspixel.net", "cdn.heapanalytics.com",
+)
+
+# Chrome'da resource type engeli URL desenleriyle yapılır
+RESOURCE_TYPE_PATTERNS = {
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.mp3", "*.ogg"],
+}
+
+RESOURCE_SUMMARY_JS = """
+var entries = performance.getEntriesByType("resource");
+var navigation = performance.getEntriesByType("navigation")[0] || {};
+return {
+    requests: entries.length + 1,
+    transfer_bytes: entries.reduce(function (sum, e) { return sum + (e.transferSize || 0); }, navigation.transferSize || 0),
+    dom_content_loaded_ms: navigation.domContentLoadedEventEnd || 0,
+    load_ms: navigation.loadEventEnd || 0
+};
+"""
+
+
+class RequestFilterRules:
+    """
+    Domains and resource types to block.
+
+    :param domains: Blocked domains; subdomains are blocked too
+    :param resource_types: Any of the keys of ``RESOURCE_TYPE_PATTERNS``
+
+    """
+
+    def __init__(self, domains=DEFAULT_BLOCKED_DOMAINS, resource_types=()):
+        unknown = set(resource_types) - set(RESOURCE_TYPE_PATTERNS)
+        if unknown:
+            raise ValueError(f"Unknown resource types: {', '.join(sorted(unknown))}")
+        self.domains = tuple(domain.lower() for domain in domains)
+        self.resource_types = tuple(resource_types)
+
+    def blocks_host(self, host):
+        """
+        Checks whether a host is a blocked domain or one of its subdomains.
+
+        :param host: Host name, optionally with a port
+        :rtype: bool
+
+        """
+        host = host.split(":")[0].lower()
+        return any(host == domain or host.endswith("." + domain) for domain in self.domains)
+
+    def blocks_path(self, path):
+        """
+        Checks whether a URL path has the extension of a blocked resource type.
+
+        :param path: URL path
+        :rtype: bool
+
+        """
+        path = urllib.parse.urlsplit(path).path.lower()
+        return any(path.endswith(pattern[1:]) for kind in self.resource_types for pattern in RESOURCE_TYPE_PATTERNS[kind])
+
+    def url_patterns(self):
+        """
+        Returns the patterns for the DevTools ``Network.setBlockedURLs`` command.
+
+        :rtype: list
+
+        """
+        patterns = [f"*://{domain}/*" for domain in self.domains] + [f"*://*.{domain}/*" for domain in self.domains]
+        for kind in self.resource_types:
+            patterns.extend(RESOURCE_TYPE_PATTERNS[kind])
+        return patterns
+
+
+def block_urls(driver, patterns):
+    """
+    Adds URL patterns to the DevTools block list of a Chrome driver.
+
+    ``Network.setBlockedURLs`` replaces the whole list, so the patterns already set on the driver
+    (for example fonts blocked by a launch profile) are kept.
+
+    :param driver: Chrome WebDriver instance
+    :param patterns: URL patterns with ``*`` wildcards
+
+    """
+    current = list(getattr(driver, "blocked_url_patterns", []))
+    current.extend(pattern for pattern in patterns if pattern not in current)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": current})
+    driver.blocked_url_patterns = current
+
+
+def attach_request_filter(driver, rules):
+    """
+    Blocks the rule's domains and resource types in a running Chrome driver through DevTools.
+
+    Firefox has no DevTools network commands in Selenium; launch it with :class:`FilteringProxy` instead.
+
+    :param driver: Selenium WebDriver instance
+    :param rules: Filter rules
+    :type rules: RequestFilterRules
+    :return: True if the filter was attached
+    :rtype: bool
+
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return False
+    block_urls(driver, rules.url_patterns())
+    return True
+
+
+def resource_summary(driver):
+    """
+    Returns the request count, transferred bytes and load timings of the current page in one script call.
+
+    :param driver: Selenium WebDriver instance
+    :rtype: dict
+
+    """
+    return driver.execute_script(RESOURCE_SUMMARY_JS)
+
+
+class FilteringProxy:
+    """
+    Local HTTP proxy that drops requests to blocked domains, used for Firefox or any browser without DevTools.
+
+    HTTPS traffic is tunnelled with CONNECT, so it can only be filtered by host: blocked tunnels are
+    refused. Plain HTTP requests to blocked domains or resource types are stubbed with an empty
+    ``204`` response.
+
+    :param rules: Filter rules
+    :type rules: RequestFilterRules
+    :param int port: Local port, 0 picks a free one
+    :param bool cache_disabled: Also turn off the Firefox disk and memory cache, for measurements
+
+    """
+
+    def __init__(self, rules=None, port=0, cache_disabled=False):
+        self.rules = rules or RequestFilterRules()
+        self.cache_disabled = cache_disabled
+        self.enabled = True
+        self._lock = threading.Lock()
+        self.stats = {}
+        self.reset_stats()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_port
+        self.url = f"127.0.0.1:{self.port}"
+
+    def start(self):
+        """
+        Starts the proxy in a background thread.
+
+        :return: The proxy itself
+        :rtype: FilteringProxy
+
+        """
+        threading.Thread(target=self._httpd.serve_forever, name="filtering-proxy", daemon=True).start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def reset_stats(self):
+        """
+        Clears the counters, e.g. before loading the next page.
+
+        :return: The counters collected since the previous reset
+        :rtype: dict
+
+        """
+        with self._lock:
+            previous = self.stats
+            self.stats = {"blocked_requests": 0, "blocked_hosts": {}, "forwarded_requests": 0, "forwarded_bytes": 0}
+        return previous
+
+    def firefox_preferences(self):
+        """
+        Returns the Firefox preferences that route HTTP and HTTPS traffic through the proxy.
+
+        With ``cache_disabled`` the HTTP cache is turned off as well, so every load is fetched
+        through the proxy like Chrome's ``Network.setCacheDisabled``.
+
+        :rtype: dict
+
+        """
+        preferences = {
+            "network.proxy.type": 1,
+            "network.proxy.http": "127.0.0.1",
+            "network.proxy.http_port": self.port,
+            "network.proxy.ssl": "127.0.0.1",
+            "network.proxy.ssl_port": self.port,
+        }
+        if self.cache_disabled:
+            preferences.update({"browser.cache.disk.enable": False, "browser.cache.memory.enable": False})
+        return preferences
+
+    def _count(self, key, amount=1, host=None):
+        with self._lock:
+            self.stats[key] += amount
+            if host:
+                self.stats["blocked_hosts"][host] = self.stats["blocked_hosts"].get(host, 0) + 1
+
+    def _handler_class(self):
+        proxy = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_CONNECT(self):
+                host, _, port = self.path.partition(":")
+                if proxy.enabled and proxy.rules.blocks_host(host):
+                    proxy._count("blocked_requests", host=host)
+                    self.send_error(403, "Blocked by request filter")
+                    return
+                try:
+                    upstream = socket.create_connection((host, int(port or 443)), timeout=30)
+                except OSError:
+                    self.send_error(502)
+                    return
+                self.send_response(200, "Connection Established")
+                self.end_headers()
+                proxy._count("forwarded_requests")
+                proxy._count("forwarded_bytes", self._relay(self.connection, upstream))
+
+            def _relay(self, client, upstream):
+                transferred = 0
+                sockets = [client, upstream]
+                try:
+                    while True:
+                        readable, _, failed = select.select(sockets, [], sockets, 30)
+                        if failed or not readable:
+                            break
+                        for source in readable:
+                            data = source.recv(65536)
+                            if not data:
+                                return transferred
+                            (upstream if source is client else client).sendall(data)
+                            transferred += len(data)
+                finally:
+                    upstream.close()
+                return transferred
+
+            def _forward(self):
+                target = urllib.parse.urlsplit(self.path)
+                if proxy.enabled and (proxy.rules.blocks_host(target.netloc) or proxy.rules.blocks_path(self.path)):
+                    proxy._count("blocked_requests", host=target.hostname)
+                    self.send_response(204)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length) if length else None
+                headers = {name: value for name, value in self.headers.items()
+                           if name.lower() not in ("proxy-connection", "connection", "keep-alive")}
+                connection = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=30)
+                try:
+                    path = target.path or "/"
+                    connection.request(self.command, path + (f"?{target.query}" if target.query else ""), body, headers)
+                    response = connection.getresponse()
+                    payload = response.read()
+                except OSError:
+                    self.send_error(502)
+                    return
+                finally:
+                    connection.close()
+                # Sayaçlar cevaptan önce artar; sayfa yüklenir yüklenmez okunan istatistikler son isteği kaçırmaz
+                proxy._count("forwarded_requests")
+                proxy._count("forwarded_bytes", len(payload))
+                self.send_response(response.status, response.reason)
+                for name, value in response.getheaders():
+                    if name.lower() not in ("transfer-encoding", "connection", "content-length"):
+                        self.send_header(name, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = do_OPTIONS = _forward
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+_filter_rules = None
+_filtering_proxy = None
+
+
+def get_filter_rules():
+    """
+    Returns the process-wide filter rules: the default domains plus ``REQUEST_FILTER_DOMAINS``
+    and the ``REQUEST_FILTER_TYPES`` resource types.
+
+    :rtype: RequestFilterRules
+
+    """
+    global _filter_rules
+    if _filter_rules is None:
+        _filter_rules = RequestFilterRules(DEFAULT_BLOCKED_DOMAINS + tuple(REQUEST_FILTER_DOMAINS), REQUEST_FILTER_TYPES)
+    return _filter_rules
+
+
+def get_filtering_proxy():
+    """
+    Returns the process-wide filtering proxy, starting it on first use.
+
+    :rtype: FilteringProxy
+
+    """
+    global _filtering_proxy
+    if _filtering_proxy is None:
+        _filtering_proxy = FilteringProxy(get_filter_rules()).start()
+    return _filtering_proxy
+
+
+def measure_savings(driver, url, rules=None, proxy=None):
+    """
+    Loads a page without and with the request filter and reports what the filter saved.
+
+    Chrome is toggled through DevTools, which also disables its cache. Other browsers must
+    already use ``proxy``, created with ``cache_disabled=True`` so the filtered load is not
+    served from the cache the unfiltered load filled; the proxy is switched off for the
+    unfiltered load.
+
+    :param driver: Selenium WebDriver instance
+    :param url: Page to measure
+    :param rules: Filter rules
+    :type rules: RequestFilterRules
+    :param proxy: Running filtering proxy the browser was launched with
+    :type proxy: FilteringProxy
+    :return: Unfiltered and filtered summaries plus requests, bytes and load time saved
+    :rtype: dict
+    :raises ValueError: If a browser without DevTools uses a proxy that keeps the cache on
+
+    """
+    rules = rules or RequestFilterRules()
+    uses_devtools = hasattr(driver, "execute_cdp_cmd")
+    if not uses_devtools and proxy and not proxy.cache_disabled:
+        raise ValueError("Launch the browser with FilteringProxy(cache_disabled=True) to measure savings")
+    # Profilin kendi engelleri (ör. fontlar) iki ölçümde de kalır
+    current = list(getattr(driver, "blocked_url_patterns", []))
+    rule_patterns = rules.url_patterns()
+    base = [pattern for pattern in current if pattern not in rule_patterns]
+
+    def load(filtered):
+        if uses_devtools:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": base + rule_patterns if filtered else base})
+            driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
+        elif proxy:
+            proxy.enabled = filtered
+            proxy.reset_stats()
+        driver.get(url)
+        summary = resource_summary(driver)
+        if proxy and not uses_devtools:
+            summary["blocked_requests"] = proxy.stats["blocked_requests"]
+        return summary
+
+    try:
+        unfiltered = load(False)
+        filtered = load(True)
+    finally:
+        if uses_devtools:
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": current})
+            driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+        elif proxy:
+            proxy.enabled = True
+    return {
+        "url": url,
+        "unfiltered": unfiltered,
+        "filtered": filtered,
+        "requests_saved": unfiltered["requests"] - filtered["requests"],
+        "bytes_saved": unfiltered["transfer_bytes"] - filtered["transfer_bytes"],
+        "load_ms_saved": unfiltered["load_ms"] - filtered["load_ms"],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure what third-party request filtering saves on a page.")
+    parser.add_argument("urls", nargs="+")
+    parser.add_argument("--browser", default="chrome", choices=["chrome", "firefox"])
+    parser.add_argument("--block-types", nargs="*", default=[], choices=list(RESOURCE_TYPE_PATTERNS))
+    args = parser.parse_args()
+
+    from DriverPool import create_driver
+
+    filter_rules = RequestFilterRules(resource_types=args.block_types)
+    filtering_proxy = FilteringProxy(filter_rules, cache_disabled=True).start() if args.browser == "firefox" else None
+    browser_driver = create_driver(args.browser, proxy=filtering_proxy)
+    try:
+        for page_url in args.urls:
+            result = measure_savings(browser_driver, page_url, filter_rules, filtering_proxy)
+            print(f"🧹 {page_url}: {result['requests_saved']} requests, {result['bytes_saved'] / 1024:.0f} KB, "
+                  f"{result['load_ms_saved']:.0f} ms saved")
+    finally:
+        browser_driver.quit()
+        if filtering_proxy:
+            filtering_proxy.stop()
@@ -0,0 +1,326 @@
+import argparse
+import json
+import os
+import re
+import threading
+import time
+from influxdb import InfluxDBClient
+
+from DBController import INFLUXDB_HOST, INFLUXDB_PORT, INFLUXDB_DATABASE
+
+
+QUERY_CACHE_PATH = os.environ.get("INFLUXDB_QUERY_CACHE", ".influx-query-cache.json")
+QUERY_CACHE_TTL = float(os.environ.get("INFLUXDB_QUERY_CACHE_TTL", "300"))
+
+# Ham noktalar RAW_RETENTION kadar tutulur, saatlik özetler DOWNSAMPLED_RETENTION kadar
+RAW_POLICY = "autogen"
+RAW_RETENTION = "30d"
+DOWNSAMPLED_POLICY = "downsampled"
+DOWNSAMPLED_RETENTION = "52w"
+DOWNSAMPLED_MEASUREMENT = "ui_test_results_1h"
+CONTINUOUS_QUERY = "cq_ui_test_results_1h"
+
+_DURATION = re.compile(r"^(\d+)([smhdw])$")
+_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def duration_seconds(duration):
+    """
+    Converts an InfluxQL duration literal such as ``7d`` to seconds.
+
+    :param duration: Duration literal
+    :rtype: int
+    :raises ValueError: If the literal is not a single ``<number><s|m|h|d|w>`` duration
+
+    """
+    match = _DURATION.match(duration)
+    if not match:
+        raise ValueError(f"Invalid duration: {duration}")
+    return int(match.group(1)) * _UNIT_SECONDS[match.group(2)]
+
+
+class QueryCache:
+    """
+    Local JSON cache of query results with TTL-based eviction.
+
+    Expired entries are evicted whenever the cache file is written.
+
+    :param path: Cache file path
+    :param float ttl: Seconds a result stays valid
+
+    """
+
+    def __init__(self, path=QUERY_CACHE_PATH, ttl=QUERY_CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def get(self, key):
+        """
+        Returns the cached value for a key, or None if it is missing or expired.
+
+        :param key: Cache key
+        :rtype: list
+
+        """
+        entry = self._load().get(key)
+        if entry is None or time.time() - entry["stored_at"] > self.ttl:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return entry["value"]
+
+    def set(self, key, value):
+        """
+        Stores a value and evicts the expired entries.
+
+        :param key: Cache key
+        :param value: JSON-serializable value
+
+        """
+        with self._lock:
+            now = time.time()
+            entries = {k: entry for k, entry in self._load().items() if now - entry["stored_at"] <= self.ttl}
+            entries[key] = {"stored_at": now, "value": value}
+            with open(self.path + ".tmp", "w", encoding="utf-8") as cache_file:
+                json.dump(entries, cache_file)
+            os.replace(self.path + ".tmp", self.path)
+
+    def clear(self):
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+
+
+def compare_windows(current, previous, metric, threshold):
+    """
+    Computes the change of a metric per test and browser between two windows.
+
+    :param current: Rows of the recent window, each with 'test_name', 'browser' and the metric
+    :param previous: Rows of the window before it
+    :param metric: Field to compare, e.g. 'p95' or 'failure_rate'
+    :param float threshold: Relative increase flagged as a regression, e.g. 0.2 for 20 %
+    :return: Rows with 'previous', 'current', 'delta', 'ratio' and 'regression'
+    :rtype: list
+
+    """
+    before = {(row["test_name"], row["browser"]): row[metric] for row in previous}
+    trends = []
+    for row in current:
+        key = (row["test_name"], row["browser"])
+        old, new = before.get(key), row[metric]
+        if old is None or new is None:
+            continue
+        delta = new - old
+        ratio = delta / old if old else (float("inf") if delta > 0 else 0.0)
+        trends.append({
+            "test_name": key[0], "browser": key[1], "metric": metric,
+            "previous": old, "current": new, "delta": delta, "ratio": ratio,
+            "regression": ratio > threshold,
+        })
+    return sorted(trends, key=lambda trend: trend["ratio"], reverse=True)
+
+
+class ResultQueries:
+    """
+    Read side of ``ui_test_results``: windowed aggregates, trends and regression flags.
+
+    Windows that fit into the raw retention are computed from raw points. Longer windows read
+    the hourly points written by the continuous query from :meth:`setup_retention`; their p50
+    is the median of hourly medians and their p95 the highest hourly p95. Results are cached
+    in ``cache`` so dashboards and gating scripts do not scan InfluxDB on every request.
+
+    :param host: InfluxDB host
+    :param int port: InfluxDB HTTP port
+    :param database: Database name
+    :param cache: Result cache, or None to always query
+    :type cache: QueryCache
+    :param float timeout: HTTP timeout of each query
+
+    """
+
+    def __init__(self, host=INFLUXDB_HOST, port=INFLUXDB_PORT, database=INFLUXDB_DATABASE, cache=None, timeout=10):
+        self.client = InfluxDBClient(host=host, port=port, database=database, timeout=timeout)
+        self.database = database
+        self.cache = cache
+
+    def duration_percentiles(self, window="7d", offset=None):
+        """
+        Returns p50/p95 duration, run count and failure rate per test and browser.
+
+        :param window: Window length as an InfluxQL duration, e.g. '7d'
+        :param offset: Shift the window back by this duration, e.g. '7d' for the week before
+        :return: Rows with 'test_name', 'browser', 'p50', 'p95', 'runs' and 'failure_rate'
+        :rtype: list
+
+        """
+        if self._uses_raw(window, offset):
+            fields = ('MEDIAN("duration") AS p50, PERCENTILE("duration", 95) AS p95, '
+                      'COUNT("duration") AS runs, MEAN("failed") AS failure_rate')
+            source = f'"{RAW_POLICY}"."ui_test_results"'
+        else:
+            fields = ('MEDIAN("p50") AS p50, MAX("p95") AS p95, SUM("runs") AS runs, '
+                      'SUM("failures") / SUM("runs") AS failure_rate')
+            source = f'"{DOWNSAMPLED_POLICY}"."{DOWNSAMPLED_MEASUREMENT}"'
+        return self._query(f'SELECT {fields} FROM {source} WHERE {self._time_range(window, offset)} '
+                           f'GROUP BY "test_name", "browser"')
+
+    def failure_rate_by_day(self, window="30d"):
+        """
+        Returns the daily failure rate and run count per test and browser.
+
+        :param window: Window length as an InfluxQL duration
+        :return: Rows with 'time', 'test_name', 'browser', 'failure_rate' and 'runs'
+        :rtype: list
+
+        """
+        if self._uses_raw(window):
+            fields = 'MEAN("failed") AS failure_rate, COUNT("duration") AS runs'
+            source = f'"{RAW_POLICY}"."ui_test_results"'
+        else:
+            fields = 'SUM("failures") / SUM("runs") AS failure_rate, SUM("runs") AS runs'
+            source = f'"{DOWNSAMPLED_POLICY}"."{DOWNSAMPLED_MEASUREMENT}"'
+        rows = self._query(f'SELECT {fields} FROM {source} WHERE {self._time_range(window)} '
+                           f'GROUP BY time(1d), "test_name", "browser"')
+        return [row for row in rows if row["runs"]]
+
+    def trend(self, metric="p95", window="7d", threshold=0.2):
+        """
+        Compares a metric of the last window with the window before it.
+
+        :param metric: 'p50', 'p95' or 'failure_rate'
+        :param window: Window length as an InfluxQL duration
+        :param float threshold: Relative increase flagged as a regression
+        :return: Rows from :func:`compare_windows`, largest increase first
+        :rtype: list
+
+        """
+        current = self.duration_percentiles(window)
+        previous = self.duration_percentiles(window, offset=window)
+        return compare_windows(current, previous, metric, threshold)
+
+    def regressions(self, window="7d", threshold=0.2, min_runs=3):
+        """
+        Returns the tests whose p95 duration or failure rate rose beyond the threshold.
+
+        :param window: Window length as an InfluxQL duration
+        :param float threshold: Relative increase flagged as a regression
+        :param int min_runs: Runs a test needs in the last window to be judged
+        :return: Regressed trend rows
+        :rtype: list
+
+        """
+        judged = {(row["test_name"], row["browser"]) for row in self.duration_percentiles(window)
+                  if row["runs"] >= min_runs}
+        found = []
+        for metric in ("p95", "failure_rate"):
+            found.extend(trend for trend in self.trend(metric, window, threshold)
+                         if trend["regression"] and (trend["test_name"], trend["browser"]) in judged)
+        return found
+
+    def setup_retention(self, raw_retention=RAW_RETENTION, downsampled_retention=DOWNSAMPLED_RETENTION):
+        """
+        Creates the downsampled policy and its hourly continuous query, then limits the raw retention.
+
+        When the continuous query is new, the existing raw points are downsampled once before the
+        raw policy is shortened, so history older than the new raw retention is kept as hourly
+        aggregates instead of being dropped. Safe to run repeatedly.
+
+        :param raw_retention: How long raw points are kept
+        :param downsampled_retention: How long the hourly aggregates are kept
+
+        """
+        duration_seconds(raw_retention)
+        duration_seconds(downsampled_retention)
+        policies = {policy["name"] for policy in self.client.get_list_retention_policies(self.database)}
+        if DOWNSAMPLED_POLICY in policies:
+            self.client.alter_retention_policy(DOWNSAMPLED_POLICY, self.database, duration=downsampled_retention)
+        else:
+            self.client.create_retention_policy(DOWNSAMPLED_POLICY, downsampled_retention, 1, self.database)
+
+        select = (f'SELECT MEDIAN("duration") AS p50, PERCENTILE("duration", 95) AS p95, '
+                  f'COUNT("duration") AS runs, SUM("failed") AS failures '
+                  f'INTO "{DOWNSAMPLED_POLICY}"."{DOWNSAMPLED_MEASUREMENT}" FROM "{RAW_POLICY}"."ui_test_results"')
+        group_by = 'GROUP BY time(1h), "test_name", "browser"'
+        existing = {cq["name"] for database in self.client.get_list_continuous_queries()
+                    for name, queries in database.items() if name == self.database for cq in queries}
+        if CONTINUOUS_QUERY not in existing:
+            self.client.create_continuous_query(CONTINUOUS_QUERY, f"{select} {group_by}", self.database)
+            # Sürekli sorgu sadece yeni noktaları özetler; mevcut ham geçmiş bir kez elle özetlenir
+            if RAW_POLICY in policies:
+                self.client.query(f"{select} WHERE time <= now() {group_by}", database=self.database, method="POST")
+
+        if RAW_POLICY in policies:
+            self.client.alter_retention_policy(RAW_POLICY, self.database, duration=raw_retention)
+        else:
+            self.client.create_retention_policy(RAW_POLICY, raw_retention, 1, self.database, default=True)
+
+    def close(self):
+        self.client.close()
+
+    def _uses_raw(self, window, offset=None):
+        reach = duration_seconds(window) + (duration_seconds(offset) if offset else 0)
+        return reach <= duration_seconds(RAW_RETENTION)
+
+    def _time_range(self, window, offset=None):
+        duration_seconds(window)
+        if not offset:
+            return f"time > now() - {window}"
+        end = duration_seconds(offset)
+        return f"time > now() - {end + duration_seconds(window)}s AND time <= now() - {end}s"
+
+    def _query(self, query):
+        if self.cache is not None:
+            cached = self.cache.get(query)
+            if cached is not None:
+                return cached
+        result = self.client.query(query)
+        rows = []
+        for (_, tags), points in result.items():
+            for point in points:
+                row = {"test_name": None, "browser": None}
+                row.update(tags or {})
+                row["browser"] = row["browser"] or None
+                row.update(point)
+                rows.append(row)
+        if self.cache is not None:
+            self.cache.set(query, rows)
+        return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query aggregated UI test results.")
+    parser.add_argument("command", choices=["percentiles", "failures", "trend", "regressions", "setup"])
+    parser.add_argument("--window", default="7d")
+    parser.add_argument("--metric", default="p95", choices=["p50", "p95", "failure_rate"])
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--no-cache", action="store_true")
+    args = parser.parse_args()
+
+    queries = ResultQueries(cache=None if args.no_cache else QueryCache())
+    try:
+        if args.command == "setup":
+            queries.setup_retention()
+            print(f"✅ Retention policies and {CONTINUOUS_QUERY} are in place")
+        elif args.command == "percentiles":
+            print(json.dumps(queries.duration_percentiles(args.window), indent=2))
+        elif args.command == "failures":
+            print(json.dumps(queries.failure_rate_by_day(args.window), indent=2))
+        elif args.command == "trend":
+            print(json.dumps(queries.trend(args.metric, args.window, args.threshold), indent=2))
+        else:
+            found = queries.regressions(args.window, args.threshold)
+            for regression in found:
+                print(f"❌ Regression: {regression['test_name']} [{regression['browser']}] {regression['metric']} "
+                      f"{regression['previous']:.2f} -> {regression['current']:.2f} ({regression['ratio']:+.0%})")
+            raise SystemExit(1 if found else 0)
+    finally:
+        queries.close()
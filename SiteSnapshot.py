@@ -0,0 +1,306 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+SNAPSHOT_DIR = os.environ.get("SITE_SNAPSHOT_DIR", "site_snapshots")
+PRIMARY_HOST = "useinsider.com"
+# Mutlak URL'ler host fark etmeksizin yerel sunucuya çevrilir; bu host'lar URL değil isim alanı/şema kimliğidir
+NEVER_REWRITTEN_HOSTS = ("www.w3.org", "w3.org", "schema.org", "ogp.me", "purl.org", "xmlns.com")
+# Cache-busting parametreleri snapshot anahtarına dahil edilmez
+VOLATILE_QUERY_PARAMS = {"_", "t", "ts", "timestamp", "cb", "nocache"}
+REWRITTEN_CONTENT_TYPES = ("text/", "javascript", "json", "xml")
+HOST_PREFIX = "/__host__/"
+# Kayıtlı gövdelerde yerel sunucu adresi yerine bu işaretler tutulur, port her çalıştırmada değişebilir
+BASE_TOKEN = b"__snapshot_base__"
+ESCAPED_BASE_TOKEN = b"__snapshot_base_escaped__"
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class SnapshotStore:
+    """
+    Directory of recorded responses keyed by method, upstream URL and request body.
+
+    :param directory: Snapshot directory
+
+    """
+
+    def __init__(self, directory=SNAPSHOT_DIR):
+        self.directory = directory
+
+    @staticmethod
+    def key(method, url, body=b""):
+        """
+        Returns the snapshot key of a request, ignoring cache-busting query parameters.
+
+        :param method: HTTP method
+        :param url: Upstream URL
+        :param bytes body: Request body
+        :rtype: str
+
+        """
+        parts = urllib.parse.urlsplit(url)
+        query = sorted((k, v) for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+                       if k not in VOLATILE_QUERY_PARAMS)
+        normalized = urllib.parse.urlunsplit((parts.scheme, parts.netloc, parts.path, urllib.parse.urlencode(query), ""))
+        return hashlib.sha1(method.encode() + b" " + normalized.encode() + b"\n" + (body or b"")).hexdigest()
+
+    def save(self, key, url, status, headers, body):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, key + ".body"), "wb") as body_file:
+            body_file.write(body)
+        with open(os.path.join(self.directory, key + ".json"), "w", encoding="utf-8") as meta_file:
+            json.dump({"url": url, "status": status, "headers": headers}, meta_file, indent=2)
+
+    def load(self, key):
+        """
+        Returns a recorded response as ``(status, headers, body)``, or None if it was never recorded.
+
+        :param key: Snapshot key
+        :rtype: tuple
+
+        """
+        meta_path = os.path.join(self.directory, key + ".json")
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, encoding="utf-8") as meta_file:
+            meta = json.load(meta_file)
+        with open(os.path.join(self.directory, key + ".body"), "rb") as body_file:
+            body = body_file.read()
+        return meta["status"], meta["headers"], body
+
+
+class SnapshotServer:
+    """
+    Local HTTP server that records the Insider site (record mode) or serves it offline (replay mode).
+
+    The browser only talks to this server: the primary host is served from the root and every
+    other host from ``/__host__/<host>/``. Absolute and protocol-relative links to any host inside
+    text responses, including the lever.co job data behind the select2 filters and third-party
+    scripts, are rewritten to the local server, so nothing the page loads reaches the network
+    in replay mode. Namespace URIs such as ``http://www.w3.org/2000/svg`` are left alone.
+
+    ``Set-Cookie`` headers are recorded and replayed as host-only cookies of the local server:
+    ``Domain``, ``Secure`` and ``SameSite=None`` are dropped and the path of a non-primary host
+    gets its ``/__host__/<host>`` prefix. An upstream that cannot be reached in record mode is
+    answered with ``502`` and nothing is recorded.
+
+    :param mode: 'record' or 'replay'
+    :param store: Snapshot store
+    :type store: SnapshotStore
+    :param int port: Local port, 0 picks a free one
+
+    """
+
+    def __init__(self, mode="replay", store=None, port=0):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown snapshot mode: {mode}")
+        self.mode = mode
+        self.store = store or SnapshotStore()
+        self.stats = {"hits": 0, "misses": 0, "recorded": 0, "errors": 0}
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._thread = None
+        self.base_url = f"http://127.0.0.1:{self._httpd.server_port}"
+        self._url_pattern = re.compile(
+            rb"(?:https?:)?(\\?/\\?/)([A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}(?::\d+)?)(?![\w.:-])"
+        )
+        self._opener = urllib.request.build_opener(_NoRedirect)
+
+    def start(self):
+        """
+        Starts serving in a background thread.
+
+        :return: The server itself
+        :rtype: SnapshotServer
+
+        """
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="site-snapshot", daemon=True)
+        self._thread.start()
+        print(f"🎞 Site snapshot server ({self.mode}) on {self.base_url}")
+        return self
+
+    def stop(self):
+        """
+        Stops the server and prints the hit/miss counters.
+
+        """
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        print(f"📊 Site snapshot: {self.stats['hits']} served, {self.stats['recorded']} recorded, "
+              f"{self.stats['misses']} missing, {self.stats['errors']} unreachable")
+
+    def upstream_url(self, path):
+        """
+        Maps a local request path to the upstream URL it stands for.
+
+        :param path: Request path including the query string
+        :rtype: str
+
+        """
+        if path.startswith(HOST_PREFIX):
+            host, _, rest = path[len(HOST_PREFIX):].partition("/")
+            return f"https://{host}/{rest}"
+        return f"https://{PRIMARY_HOST}{path}"
+
+    def rewrite(self, body):
+        """
+        Rewrites absolute and protocol-relative links, including JSON-escaped ones, to base tokens
+        that :meth:`localize` later turns into this server's address.
+
+        :param bytes body: Response body
+        :rtype: bytes
+
+        """
+        def replace(match):
+            host = match.group(2).decode().lower()
+            if host in NEVER_REWRITTEN_HOSTS:
+                return match.group(0)
+            path = b"" if host in (PRIMARY_HOST, "www." + PRIMARY_HOST) else (HOST_PREFIX + host).encode()
+            if match.group(1).startswith(b"\\"):
+                return ESCAPED_BASE_TOKEN + path.replace(b"/", b"\\/")
+            return BASE_TOKEN + path
+
+        return self._url_pattern.sub(replace, body)
+
+    def rewrite_cookie(self, cookie, host):
+        """
+        Turns an upstream ``Set-Cookie`` value into a host-only cookie of the local server.
+
+        :param cookie: ``Set-Cookie`` header value
+        :param host: Upstream host that set the cookie
+        :rtype: str
+
+        """
+        prefix = "" if host in (PRIMARY_HOST, "www." + PRIMARY_HOST) else HOST_PREFIX + host
+        parts = [part.strip() for part in cookie.split(";")]
+        kept = [parts[0]]
+        for attribute in parts[1:]:
+            name, _, value = attribute.partition("=")
+            name = name.strip().lower()
+            # Yerel sunucu düz HTTP: Secure ve SameSite=None çerezleri tarayıcı reddeder
+            if name in ("domain", "secure") or (name == "samesite" and value.strip().lower() == "none"):
+                continue
+            if name == "path" and prefix:
+                attribute = f"Path={prefix}{value.strip()}"
+            kept.append(attribute)
+        return "; ".join(kept)
+
+    def localize(self, body):
+        """
+        Replaces the base tokens left by :meth:`rewrite` with this server's address.
+
+        :param bytes body: Recorded response body
+        :rtype: bytes
+
+        """
+        base = self.base_url.encode()
+        return body.replace(ESCAPED_BASE_TOKEN, base.replace(b"/", b"\\/")).replace(BASE_TOKEN, base)
+
+    def handle(self, method, path, headers, body):
+        """
+        Serves one request from the store, recording it first in record mode.
+
+        :return: ``(status, headers, body)``
+        :rtype: tuple
+
+        """
+        url = self.upstream_url(path)
+        key = SnapshotStore.key(method, url, body)
+        if self.mode == "record":
+            try:
+                recorded = self._fetch(method, url, headers, body)
+            except (urllib.error.URLError, OSError) as e:
+                self.stats["errors"] += 1
+                print(f"⚠️ Upstream unreachable: {method} {url} ({e})")
+                return 502, {"Content-Type": "text/plain"}, b"upstream unreachable"
+            self.store.save(key, url, *recorded)
+            self.stats["recorded"] += 1
+        else:
+            recorded = self.store.load(key)
+            if recorded is None:
+                self.stats["misses"] += 1
+                print(f"⚠️ Snapshot missing: {method} {url}")
+                return 404, {"Content-Type": "text/plain"}, b"not recorded"
+            self.stats["hits"] += 1
+
+        status, response_headers, response_body = recorded
+        response_headers = {
+            name: [self.localize(item.encode()).decode() for item in value] if isinstance(value, list)
+            else self.localize(value.encode()).decode()
+            for name, value in response_headers.items()
+        }
+        return status, response_headers, self.localize(response_body)
+
+    def _fetch(self, method, url, headers, body):
+        request_headers = {name: value for name, value in headers.items()
+                           if name.lower() in ("accept", "user-agent", "content-type", "x-requested-with")}
+        request_headers["Accept-Encoding"] = "identity"
+        request = urllib.request.Request(url, data=body or None, method=method, headers=request_headers)
+        try:
+            response = self._opener.open(request, timeout=30)
+        except urllib.error.HTTPError as e:
+            response = e
+
+        content_type = response.headers.get("Content-Type", "application/octet-stream")
+        response_body = response.read()
+        if any(kind in content_type for kind in REWRITTEN_CONTENT_TYPES):
+            response_body = self.rewrite(response_body)
+        response_headers = {"Content-Type": content_type}
+        location = response.headers.get("Location")
+        if location:
+            response_headers["Location"] = self.rewrite(urllib.parse.urljoin(url, location).encode()).decode()
+        cookies = response.headers.get_all("Set-Cookie")
+        if cookies:
+            host = urllib.parse.urlsplit(url).netloc
+            response_headers["Set-Cookie"] = [self.rewrite_cookie(cookie, host) for cookie in cookies]
+        return response.status, response_headers, response_body
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _serve(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length) if length else b""
+                status, headers, response_body = server.handle(self.command, self.path, dict(self.headers), body)
+                self.send_response(status)
+                for name, value in headers.items():
+                    for item in value if isinstance(value, list) else [value]:
+                        self.send_header(name, item)
+                self.send_header("Content-Length", str(len(response_body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(response_body)
+
+            do_GET = do_POST = do_HEAD = _serve
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record or replay the Insider site on a local HTTP server.")
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--dir", default=SNAPSHOT_DIR)
+    args = parser.parse_args()
+    snapshot_server = SnapshotServer(args.mode, SnapshotStore(args.dir), args.port).start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        snapshot_server.stop()
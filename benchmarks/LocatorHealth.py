@@ -0,0 +1,168 @@
+"""
+Resolves every registered locator against the local fixture pages and reports lookup time,
+match count and whether the translated CSS selector had to fall back to its XPath.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.LocatorHealth
+    python -m benchmarks.LocatorHealth --browsers chrome --slow-ms 0.5
+
+"""
+import argparse
+import sys
+
+from BrowserProfiles import get_profile
+from DriverPool import create_driver
+from benchmarks.PageObjectBenchmark import FIXTURE_DIR
+from pages.Locators import locators as registry
+
+
+# Registry bölümü -> locator'larının çözüldüğü fixture sayfası
+SECTION_FIXTURES = {
+    "common": "home.html",
+    "HomePage": "home.html",
+    "CareerPage": "careers.html",
+    "QAPage": "qa_jobs.html",
+}
+DEFAULT_SLOW_MS = 1.0
+
+# Her locator'ı tarayıcı içinde ``runs`` kez çözer; süreler WebDriver round trip'i içermez
+LOCATOR_HEALTH_JS = """
+var locators = arguments[0], runs = arguments[1];
+function find(by, locator) {
+    if (by === "xpath") {
+        var snapshot = document.evaluate(locator, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var nodes = [];
+        for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+        return nodes;
+    }
+    if (by === "id") { var node = document.getElementById(locator); return node ? [node] : []; }
+    if (by === "class name") { return Array.from(document.getElementsByClassName(locator)); }
+    if (by === "name") { return Array.from(document.getElementsByName(locator)); }
+    return Array.from(document.querySelectorAll(locator));
+}
+function measure(by, locator) {
+    var nodes = [], started = performance.now();
+    for (var i = 0; i < runs; i++) { nodes = find(by, locator); }
+    return {nodes: nodes, ms: (performance.now() - started) / runs};
+}
+return locators.map(function (locator) {
+    var primary = measure(locator[0], locator[1]);
+    var result = {count: primary.nodes.length, ms: primary.ms, fallback_count: null, fallback_ms: null, same: null};
+    if (locator[2]) {
+        var fallback = measure("xpath", locator[2]);
+        result.fallback_count = fallback.nodes.length;
+        result.fallback_ms = fallback.ms;
+        result.same = fallback.nodes.length === primary.nodes.length &&
+            fallback.nodes.every(function (node, i) { return node === primary.nodes[i]; });
+    }
+    return result;
+});
+"""
+
+
+def classify(locator, result, slow_ms=DEFAULT_SLOW_MS):
+    """
+    Returns the health status of one resolved locator.
+
+    'fallback': the CSS selector matched nothing but its XPath did, 'mismatch': both matched
+    different elements, 'missing': nothing matched, 'ambiguous': a single-element locator
+    matched several, 'slow': the lookup took longer than ``slow_ms``, else 'ok'.
+
+    :param locator: Registered locator
+    :type locator: pages.Locators.Locator
+    :param result: Measurement of :data:`LOCATOR_HEALTH_JS` for the locator
+    :param float slow_ms: Slowest acceptable lookup in milliseconds
+    :rtype: str
+
+    """
+    if not result["count"]:
+        return "fallback" if result["fallback_count"] else "missing"
+    if result["same"] is False:
+        return "mismatch"
+    if result["count"] > 1 and not locator.multiple:
+        return "ambiguous"
+    if result["ms"] > slow_ms:
+        return "slow"
+    return "ok"
+
+
+def check_locators(driver, locators, runs=50, slow_ms=DEFAULT_SLOW_MS):
+    """
+    Resolves the locators on the driver's current page with a single script execution.
+
+    :param driver: Selenium WebDriver instance
+    :param locators: Registered locators
+    :param int runs: Lookups per locator, the reported time is their average
+    :param float slow_ms: Slowest acceptable lookup in milliseconds
+    :return: One dict per locator with 'name', 'by', 'value', 'count', 'ms', 'fallback_count',
+        'fallback_ms' and 'status'
+    :rtype: list
+
+    """
+    locators = list(locators)
+    queries = [[locator.by, locator.value, locator.xpath if locator.translated else None] for locator in locators]
+    results = driver.execute_script(LOCATOR_HEALTH_JS, queries, runs)
+    return [
+        {
+            "name": locator.name,
+            "by": locator.by,
+            "value": locator.value,
+            "count": result["count"],
+            "ms": result["ms"],
+            "fallback_count": result["fallback_count"],
+            "fallback_ms": result["fallback_ms"],
+            "status": classify(locator, result, slow_ms),
+        }
+        for locator, result in zip(locators, results)
+    ]
+
+
+def run_health_check(browsers, runs=50, slow_ms=DEFAULT_SLOW_MS):
+    """
+    Checks every registered locator on its fixture page in each browser.
+
+    :param browsers: Browsers to check in
+    :param int runs: Lookups per locator
+    :param float slow_ms: Slowest acceptable lookup in milliseconds
+    :return: ``{browser: rows}`` with the rows of :func:`check_locators`
+    :rtype: dict
+
+    """
+    report = {}
+    for browser in browsers:
+        driver = create_driver(browser, get_profile("headless"))
+        report[browser] = []
+        try:
+            for section, fixture in SECTION_FIXTURES.items():
+                driver.get((FIXTURE_DIR / fixture).as_uri())
+                section_locators = [locator for locator in registry.all() if locator.name.startswith(f"{section}.")]
+                report[browser].extend(check_locators(driver, section_locators, runs, slow_ms))
+        finally:
+            driver.quit()
+    return report
+
+
+def print_report(report):
+    print(f"{'browser':<8} {'locator':<32} {'by':<13} {'count':>5} {'time':>9} {'xpath':>9}  status")
+    for browser, rows in report.items():
+        for row in rows:
+            fallback = f"{row['fallback_ms']:>7.3f}ms" if row["fallback_ms"] is not None else f"{'-':>9}"
+            print(f"{browser:<8} {row['name']:<32} {row['by']:<13} {row['count']:>5} {row['ms']:>7.3f}ms "
+                  f"{fallback}  {row['status']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the registered locators against the local fixture pages.")
+    parser.add_argument("--browsers", nargs="+", default=["chrome", "firefox"])
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--slow-ms", type=float, default=DEFAULT_SLOW_MS)
+    args = parser.parse_args()
+
+    health_report = run_health_check(args.browsers, args.runs, args.slow_ms)
+    print_report(health_report)
+    problems = [f"{browser} {row['name']}: {row['status']}"
+                for browser, rows in health_report.items() for row in rows if row["status"] != "ok"]
+    for problem in problems:
+        print(f"❌ {problem}")
+    sys.exit(1 if problems else 0)
@@ -0,0 +1,198 @@
+"""
+Benchmarks page-object operations against the local fixture pages in headless browsers.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.PageObjectBenchmark --save-baseline
+    python -m benchmarks.PageObjectBenchmark --threshold 0.2
+
+"""
+import argparse
+import json
+import os
+import pathlib
+import statistics
+import sys
+import time
+from selenium.webdriver.common.by import By
+
+from BrowserProfiles import get_profile
+from DriverPool import create_driver
+from pages.BasePage import BasePage
+from pages.CareerPage import CareerPage
+from pages.QAPage import QAPage
+
+
+FIXTURE_DIR = pathlib.Path(__file__).resolve().parent / "fixtures"
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_THRESHOLD = 0.2
+
+
+def _fixture_url(name):
+    return (FIXTURE_DIR / name).as_uri()
+
+
+# İşlem adı -> (fixture sayfası, sayfa sınıfı, ölçülen çağrı)
+OPERATIONS = {
+    "BasePage.wait_for_element": (
+        "careers.html", BasePage,
+        lambda page: page.wait_for_element(By.XPATH, "//h2[contains(text(), 'Life at Insider')]"),
+    ),
+    "BasePage.click_element": (
+        "careers.html", BasePage,
+        lambda page: page.click_element(By.ID, "counter"),
+    ),
+    "BasePage.scroll_to_element": (
+        "careers.html", BasePage,
+        lambda page: page.scroll_to_element(By.XPATH, "//a[contains(text(), 'See all teams')]"),
+    ),
+    "CareerPage.verify_sections": (
+        "careers.html", CareerPage,
+        lambda page: page.verify_sections(),
+    ),
+    "QAPage.verify_job_listings": (
+        "qa_jobs.html", QAPage,
+        lambda page: page.verify_job_listings(),
+    ),
+    "QAPage.job_snapshot": (
+        "qa_jobs.html", QAPage,
+        lambda page: page.job_snapshot().matrix(["Quality Assurance", "Software Development"],
+                                                ["Istanbul, Turkiye", "London, United Kingdom"]),
+    ),
+}
+
+
+class RoundTripCounter:
+    """
+    Counts the WebDriver commands a driver sends, including the ones issued through WebElements.
+
+    :param driver: Selenium WebDriver instance
+
+    """
+
+    def __init__(self, driver):
+        self.count = 0
+        original_execute = driver.execute
+
+        def counting_execute(driver_command, params=None):
+            self.count += 1
+            return original_execute(driver_command, params)
+
+        driver.execute = counting_execute
+
+
+def summarize(durations, round_trips):
+    """
+    Returns min/median/p95 in milliseconds and the median round-trip count.
+
+    :param durations: Run durations in seconds
+    :param round_trips: WebDriver commands per run
+    :rtype: dict
+
+    """
+    milliseconds = sorted(duration * 1000 for duration in durations)
+    p95 = statistics.quantiles(milliseconds, n=20, method="inclusive")[18] if len(milliseconds) > 1 else milliseconds[0]
+    return {
+        "min": round(milliseconds[0], 3),
+        "median": round(statistics.median(milliseconds), 3),
+        "p95": round(p95, 3),
+        "round_trips": statistics.median(round_trips),
+    }
+
+
+def run_benchmarks(browsers, runs=20, warmup=3, operations=None):
+    """
+    Runs every operation ``runs`` times per browser on a fresh page object and returns the summaries.
+
+    :param browsers: Browsers to benchmark
+    :param int runs: Measured runs per operation
+    :param int warmup: Unmeasured runs per operation
+    :param operations: Operation names to run, defaults to all
+    :return: ``{browser: {operation: summary}}``
+    :rtype: dict
+
+    """
+    results = {}
+    for browser in browsers:
+        driver = create_driver(browser, get_profile("headless"))
+        counter = RoundTripCounter(driver)
+        results[browser] = {}
+        try:
+            for name in operations or OPERATIONS:
+                fixture, page_class, operation = OPERATIONS[name]
+                driver.get(_fixture_url(fixture))
+                durations, round_trips = [], []
+                for run in range(warmup + runs):
+                    page = page_class(driver)
+                    counter.count = 0
+                    started = time.perf_counter()
+                    operation(page)
+                    if run >= warmup:
+                        durations.append(time.perf_counter() - started)
+                        round_trips.append(counter.count)
+                results[browser][name] = summarize(durations, round_trips)
+        finally:
+            driver.quit()
+    return results
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Lists the operations whose median time or round-trip count regressed beyond the threshold.
+
+    :param results: Current results from :func:`run_benchmarks`
+    :param baseline: Stored baseline in the same format
+    :param float threshold: Allowed relative slowdown, e.g. 0.2 for 20 %
+    :return: Human-readable regression descriptions
+    :rtype: list
+
+    """
+    regressions = []
+    for browser, operations in results.items():
+        for name, current in operations.items():
+            previous = baseline.get(browser, {}).get(name)
+            if not previous:
+                continue
+            if current["median"] > previous["median"] * (1 + threshold):
+                regressions.append(f"{browser} {name}: median {previous['median']:.1f}ms -> {current['median']:.1f}ms")
+            if current["round_trips"] > previous["round_trips"]:
+                regressions.append(f"{browser} {name}: round trips {previous['round_trips']} -> {current['round_trips']}")
+    return regressions
+
+
+def print_results(results):
+    print(f"{'browser':<8} {'operation':<30} {'min':>9} {'median':>9} {'p95':>9} {'trips':>6}")
+    for browser, operations in results.items():
+        for name, summary in operations.items():
+            print(f"{browser:<8} {name:<30} {summary['min']:>7.1f}ms {summary['median']:>7.1f}ms "
+                  f"{summary['p95']:>7.1f}ms {summary['round_trips']:>6}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark page-object operations against local fixture pages.")
+    parser.add_argument("--browsers", nargs="+", default=["chrome", "firefox"])
+    parser.add_argument("--operations", nargs="+", choices=list(OPERATIONS), default=None)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    benchmark_results = run_benchmarks(args.browsers, args.runs, args.warmup, args.operations)
+    print_results(benchmark_results)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump(benchmark_results, baseline_file, indent=2, sort_keys=True)
+        print(f"💾 Baseline saved: {args.baseline}")
+        sys.exit(0)
+
+    if not os.path.exists(args.baseline):
+        print("⚠️ No baseline found, run with --save-baseline first.")
+        sys.exit(0)
+    with open(args.baseline, encoding="utf-8") as baseline_file:
+        found = compare(benchmark_results, json.load(baseline_file), args.threshold)
+    for regression in found:
+        print(f"❌ Regression: {regression}")
+    sys.exit(1 if found else 0)
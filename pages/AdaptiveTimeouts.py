@@ -0,0 +1,250 @@
+import argparse
+import json
+import math
+import os
+import threading
+import time
+from .EventLog import events
+
+
+# ADAPTIVE_TIMEOUTS=0 sabit timeout'lara döner
+ADAPTIVE_TIMEOUTS_ENABLED = os.environ.get("ADAPTIVE_TIMEOUTS", "1") == "1"
+# 'auto' model dosyası eskiyse InfluxDB geçmişinden yeniler, 'cache' sadece dosyayı okur (paralel worker'lar)
+TIMEOUT_MODEL_SOURCE = os.environ.get("TIMEOUT_MODEL_SOURCE", "auto")
+TIMEOUT_MODEL_PATH = os.environ.get("TIMEOUT_MODEL_PATH", ".timeout-model.json")
+TIMEOUT_MODEL_MAX_AGE = float(os.environ.get("TIMEOUT_MODEL_MAX_AGE_HOURS", "24")) * 3600
+TIMEOUT_HISTORY_DAYS = int(os.environ.get("TIMEOUT_HISTORY_DAYS", "14"))
+# Timeout = persentil x marj, [floor, ceiling] aralığında; yeterli örneği olmayan locator'lar sabit timeout kullanır
+TIMEOUT_PERCENTILE = float(os.environ.get("TIMEOUT_PERCENTILE", "99"))
+TIMEOUT_MARGIN = float(os.environ.get("TIMEOUT_MARGIN", "2.0"))
+TIMEOUT_FLOOR = float(os.environ.get("TIMEOUT_FLOOR", "3"))
+TIMEOUT_CEILING = float(os.environ.get("TIMEOUT_CEILING", "30"))
+TIMEOUT_MIN_SAMPLES = int(os.environ.get("TIMEOUT_MIN_SAMPLES", "20"))
+TIMEOUT_MAX_SAMPLES = int(os.environ.get("TIMEOUT_MAX_SAMPLES", "200"))
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile of a list of numbers.
+
+    :param values: Non-empty list of numbers
+    :param float pct: Percentile between 0 and 100
+    :rtype: float
+
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class TimeoutModel:
+    """
+    Per-locator wait timeouts derived from how long each locator's waits have taken.
+
+    Waits are recorded per locator; once a locator has ``min_samples`` of them its timeout is
+    ``percentile(samples) * margin`` clamped to ``[floor, ceiling]``. A wait that timed out is a
+    censored sample at the timeout it ran into: the element took at least that long, so a slow
+    period raises the timeout instead of failing at the same one over and over. The samples
+    are kept in a local JSON file and replaced from the ``ui_test_steps`` history when the file
+    is older than ``max_age``; samples recorded by parallel workers are merged into it on save.
+
+    :param path: Model file
+    :param float pct: Percentile of the recorded wait times
+    :param float margin: Multiplier applied to the percentile
+    :param float floor: Shortest timeout in seconds
+    :param float ceiling: Longest timeout in seconds
+    :param int min_samples: Samples needed before a locator's timeout is adapted
+    :param int max_samples: Most recent samples kept per locator
+    :param source: 'auto' or 'cache', see ``TIMEOUT_MODEL_SOURCE``
+    :param float max_age: Model age in seconds after which 'auto' refreshes from history
+    :param bool enabled: Adapt timeouts at all
+
+    """
+
+    def __init__(self, path=TIMEOUT_MODEL_PATH, pct=TIMEOUT_PERCENTILE, margin=TIMEOUT_MARGIN,
+                 floor=TIMEOUT_FLOOR, ceiling=TIMEOUT_CEILING, min_samples=TIMEOUT_MIN_SAMPLES,
+                 max_samples=TIMEOUT_MAX_SAMPLES, source=TIMEOUT_MODEL_SOURCE, max_age=TIMEOUT_MODEL_MAX_AGE,
+                 enabled=ADAPTIVE_TIMEOUTS_ENABLED):
+        self.path = path
+        self.pct = pct
+        self.margin = margin
+        self.floor = floor
+        self.ceiling = ceiling
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.source = source
+        self.max_age = max_age
+        self.enabled = enabled
+        self.samples = {}
+        self.recorded = {}
+        self.timeouts = {}
+        self.updated = 0.0
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def timeout_for(self, locator, default):
+        """
+        Returns the timeout to use for a wait on the locator.
+
+        :param locator: The locator string
+        :param float default: Fixed timeout used until the locator has enough samples
+        :rtype: float
+
+        """
+        if not self.enabled or locator is None:
+            return default
+        self._ensure_loaded()
+        samples = self.samples.get(locator)
+        if not samples or len(samples) < self.min_samples:
+            return default
+        return min(max(percentile(samples, self.pct) * self.margin, self.floor), self.ceiling)
+
+    def record(self, locator, seconds, timed_out=False):
+        """
+        Records how long a wait on the locator took.
+
+        :param locator: The locator string
+        :param float seconds: Wait duration, the timeout for waits that timed out
+        :param bool timed_out: Whether the wait ended without the element
+
+        """
+        if not self.enabled or locator is None:
+            return
+        self._ensure_loaded()
+        with self._lock:
+            if timed_out:
+                self.timeouts[locator] = self.timeouts.get(locator, 0) + 1
+            self.recorded.setdefault(locator, []).append(round(seconds, 4))
+            self.samples[locator] = (self.samples.get(locator, []) + [round(seconds, 4)])[-self.max_samples:]
+
+    def refresh_from_history(self, rows):
+        """
+        Replaces the samples with wait times read from the step history.
+
+        :param rows: Dicts with 'locator', 'wait_time' and optionally 'timed_out', oldest first
+        :return: Number of locators with samples
+        :rtype: int
+
+        """
+        samples, timeouts = {}, {}
+        for row in rows:
+            if row.get("locator") and row.get("wait_time") is not None:
+                samples.setdefault(row["locator"], []).append(round(row["wait_time"], 4))
+                if row.get("timed_out"):
+                    timeouts[row["locator"]] = timeouts.get(row["locator"], 0) + 1
+        with self._lock:
+            self.samples = {locator: values[-self.max_samples:] for locator, values in samples.items()}
+            self.timeouts = timeouts
+            self.recorded = {}
+            self.updated = time.time()
+            self._loaded = True
+        return len(self.samples)
+
+    def load(self):
+        """
+        Reads the model file, refreshing it from InfluxDB first when the source is 'auto' and
+        the file is missing or older than ``max_age``.
+
+        """
+        with self._lock:
+            self._loaded = True
+        stored = self._read()
+        self.samples, self.updated = stored.get("samples", {}), stored.get("updated", 0.0)
+        if self.source == "auto" and time.time() - self.updated > self.max_age:
+            try:
+                from DBController import fetch_step_wait_times
+                self.refresh_from_history(fetch_step_wait_times(TIMEOUT_HISTORY_DAYS))
+                self.save()
+            except Exception as e:
+                events.warning("Wait history could not be read", path=self.path, error=e)
+
+    def save(self):
+        """
+        Adds the samples recorded since the last save to the model file.
+
+        The file is re-read under an exclusive lock, so the samples of parallel workers saving
+        the same model are merged instead of overwritten. If this model was refreshed from
+        history after the file was written, its samples replace the file's.
+
+        """
+        if not self._loaded:
+            return
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with self._lock, open(self.path + ".lock", "w") as lock_file:
+            _lock_exclusive(lock_file)
+            stored = self._read()
+            if stored.get("updated", 0.0) >= self.updated:
+                self.updated = stored.get("updated", 0.0)
+                self.samples = {
+                    locator: (values + self.recorded.get(locator, []))[-self.max_samples:]
+                    for locator, values in stored.get("samples", {}).items()
+                }
+                for locator, values in self.recorded.items():
+                    self.samples.setdefault(locator, values[-self.max_samples:])
+            self.recorded = {}
+            with open(temp_path, "w", encoding="utf-8") as model_file:
+                json.dump({"updated": self.updated, "samples": self.samples}, model_file, sort_keys=True)
+            os.replace(temp_path, self.path)
+
+    def report(self):
+        """
+        Returns the sample count, percentile and timeout of every locator in the model.
+
+        :rtype: dict
+
+        """
+        self._ensure_loaded()
+        return {
+            locator: {
+                "samples": len(samples),
+                "percentile": percentile(samples, self.pct),
+                "timeout": self.timeout_for(locator, None),
+                "timed_out": self.timeouts.get(locator, 0),
+            }
+            for locator, samples in sorted(self.samples.items()) if samples
+        }
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self.load()
+
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as model_file:
+                return json.load(model_file)
+        except (OSError, ValueError):
+            return {}
+
+
+def _lock_exclusive(lock_file):
+    try:
+        import fcntl
+    except ImportError:
+        # Windows'ta fcntl yok; msvcrt ilk baytı kilitler ve kilit alınana kadar yeniden dener
+        import msvcrt
+        while True:
+            try:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                pass
+    fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+
+timeout_model = TimeoutModel()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Show or refresh the adaptive locator timeout model.")
+    parser.add_argument("--refresh", action="store_true", help="Rebuild the model from the InfluxDB step history")
+    parser.add_argument("--days", type=int, default=TIMEOUT_HISTORY_DAYS)
+    args = parser.parse_args()
+
+    model = TimeoutModel(source="cache")
+    if args.refresh:
+        from DBController import fetch_step_wait_times
+        print(f"🔄 {model.refresh_from_history(fetch_step_wait_times(args.days))} locators refreshed")
+        model.save()
+    for name, entry in model.report().items():
+        timeout = f"{entry['timeout']:.1f}s" if entry["timeout"] is not None else "default"
+        print(f"{timeout:>8}  p{model.pct:g}={entry['percentile']:.2f}s  n={entry['samples']:<4} {name}")
@@ -0,0 +1,453 @@
+"""
+Asyncio variants of the page objects, driven by ``AsyncWebDriver.AsyncWebDriver``.
+
+Waits do not poll over WebDriver: one async script per wait resolves as soon as a
+MutationObserver sees the condition met, so a waiting session costs no round trips and no
+thread. The pages use the same locator registry and event log as the synchronous ones but
+are not recorded as step spans, since the step recorder tracks one test per thread.
+
+"""
+import asyncio
+import time
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
+from .BasePage import BULK_QUERY_JS, FIND_ELEMENTS_JS, PAGE_STATE_JS, ElementRecord, check_script_locator
+from .EventLog import events
+from .HomePage import INSIDER_URL
+from .JobListings import EXTRACT_JOBS_JS, JobRecord, JobSnapshot
+from .Locators import locators as registry
+
+
+# arguments: by, locator, ms cinsinden üst süre, koşul ('present', 'visible', 'clickable', 'text'), beklenen metin.
+# Koşul sağlandığında elemanı, süre dolduğunda null döner.
+WAIT_FOR_ELEMENT_JS = FIND_ELEMENTS_JS + """
+var done = arguments[arguments.length - 1];
+var by = arguments[0], locator = arguments[1], timeoutMs = arguments[2];
+var condition = arguments[3], expected = arguments[4];
+function find() { return findAll(by, locator)[0] || null; }
+function isVisible(el) {
+    var style = window.getComputedStyle(el);
+    return style.visibility !== "hidden" && style.display !== "none" &&
+        !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+}
+function satisfied(el) {
+    if (!el) { return false; }
+    if (condition === "text") { return (el.innerText || el.textContent || "").indexOf(expected) >= 0; }
+    if (condition === "visible") { return isVisible(el); }
+    if (condition === "clickable") { return isVisible(el) && !el.disabled; }
+    return true;
+}
+var finished = false, observer = null, timer = null, interval = null;
+function finish(result) {
+    if (finished) { return; }
+    finished = true;
+    if (observer) { observer.disconnect(); }
+    clearTimeout(timer);
+    clearInterval(interval);
+    done(result);
+}
+function check() {
+    var el = find();
+    if (satisfied(el)) { finish(el); }
+}
+check();
+if (!finished) {
+    observer = new MutationObserver(check);
+    observer.observe(document.documentElement,
+        {childList: true, subtree: true, attributes: true, characterData: true});
+    // Stil/animasyon kaynaklı görünürlük değişiklikleri mutation üretmez
+    interval = setInterval(check, 250);
+    timer = setTimeout(function () { finish(null); }, timeoutMs);
+}
+"""
+
+# arguments: kabul edilen readyState'ler, ms cinsinden üst süre
+WAIT_FOR_READY_STATE_JS = """
+var done = arguments[arguments.length - 1];
+var states = arguments[0], timer = null;
+function check() {
+    if (states.indexOf(document.readyState) >= 0) {
+        document.removeEventListener("readystatechange", check);
+        clearTimeout(timer);
+        done(true);
+        return true;
+    }
+    return false;
+}
+if (!check()) {
+    document.addEventListener("readystatechange", check);
+    timer = setTimeout(function () { document.removeEventListener("readystatechange", check); done(false); },
+                       arguments[1]);
+}
+"""
+
+SCROLL_INTO_VIEW_JS = "arguments[0].scrollIntoView({block: 'center'});"
+CLICK_JS = "arguments[0].click();"
+
+
+class AsyncBasePage:
+    """
+    Async counterpart of :class:`pages.BasePage.BasePage`.
+
+    Every wait is a single ``execute_async_script`` call; navigation can interrupt the
+    script, in which case it is started again on the new document until the deadline.
+
+    :param driver: ``AsyncWebDriver`` session
+    :param int timeout: Maximum wait time for element actions
+
+    """
+
+    locators = registry.page("BasePage")
+
+    def __init_subclass__(cls, page=None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.locators = registry.page(page or cls.__name__)
+
+    def __init__(self, driver, timeout=20):
+        self.driver = driver
+        self.timeout = timeout
+
+    async def execute_script(self, script, *args):
+        """
+        Runs a synchronous script in the page.
+
+        :return: The script's return value
+
+        """
+        return await self.driver.execute_script(script, *args)
+
+    async def wait_for_element(self, by, locator, timeout=None, condition="present", expected_text=None):
+        """
+        Waits until the element is present, or meets the given condition.
+
+        :param by: Selenium By strategy
+        :param locator: The locator string
+        :param int timeout: Optional timeout override
+        :param condition: 'present', 'visible', 'clickable' or 'text'
+        :param expected_text: Text the element must contain for the 'text' condition
+        :return: AsyncWebElement or None
+        :rtype: AsyncWebElement
+        :raises ValueError: If the locator uses a strategy the script cannot resolve
+
+        """
+        check_script_locator(by, locator)
+        deadline = time.monotonic() + (timeout or self.timeout)
+        while True:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                break
+            try:
+                element = await self.driver.execute_async_script(
+                    WAIT_FOR_ELEMENT_JS, by, locator, remaining_ms, condition, expected_text
+                )
+            except JavascriptException:
+                # Bekleme sırasında sayfa değişti; yeni dokümanda tekrar başlatılır
+                await asyncio.sleep(0.05)
+                continue
+            except TimeoutException:
+                break
+            if element is not None:
+                return element
+            break
+        events.error("Element not found", locator=locator, condition=condition)
+        return None
+
+    async def wait_for_element_to_be_clickable(self, by, locator, timeout=None):
+        """
+        Waits until the element is visible and enabled.
+
+        :rtype: AsyncWebElement
+
+        """
+        return await self.wait_for_element(by, locator, timeout, condition="clickable")
+
+    async def click_element(self, by, locator):
+        """
+        Waits for the element to be clickable and clicks it. Falls back to JS click.
+
+        :param by: Selenium By strategy
+        :param locator: The locator string
+
+        """
+        element = await self.wait_for_element_to_be_clickable(by, locator)
+        if element is None:
+            events.warning("Element could not be clicked", locator=locator)
+            return
+        try:
+            await element.click()
+            events.debug("Clicked", locator=locator)
+        except WebDriverException:
+            events.warning("Selenium click failed, clicking with JavaScript", locator=locator)
+            await self.driver.execute_script(CLICK_JS, element)
+
+    async def scroll_to_element(self, by, locator):
+        """
+        Scrolls the element into the middle of the viewport.
+
+        :param by: Selenium By strategy
+        :param locator: The locator string
+
+        """
+        element = await self.wait_for_element(by, locator)
+        if element is not None:
+            await self.driver.execute_script(SCROLL_INTO_VIEW_JS, element)
+        return element
+
+    async def accept_cookies(self, cookie_locator=None):
+        """
+        Clicks the cookie accept button if it shows up.
+
+        :param cookie_locator: ``(by, locator)`` of the cookie accept button, defaults to the
+            registered ``cookie_accept`` locator
+
+        """
+        by, locator = cookie_locator or self.locators.cookie_accept
+        button = await self.wait_for_element_to_be_clickable(by, locator)
+        if button is None:
+            events.warning("Cookie button not found", locator=locator)
+            return
+        await button.click()
+        events.info("Cookies accepted")
+
+    async def wait_for_page_to_load(self):
+        """
+        Waits for the ready state of the launch profile, 'complete' by default.
+
+        """
+        profile = getattr(self.driver, "launch_profile", None)
+        ready_states = list(profile.ready_states if profile else ("complete",))
+        deadline = time.monotonic() + self.timeout
+        while time.monotonic() < deadline:
+            try:
+                loaded = await self.driver.execute_async_script(
+                    WAIT_FOR_READY_STATE_JS, ready_states, int((deadline - time.monotonic()) * 1000)
+                )
+            except JavascriptException:
+                await asyncio.sleep(0.05)
+                continue
+            if loaded:
+                events.debug("Page loaded", ready_states=ready_states)
+                return True
+            break
+        events.warning("Page loading did not finish", ready_states=ready_states)
+        return False
+
+    async def wait_for_element_text_to_be(self, by, locator, expected_text, timeout=10):
+        """
+        Waits until the element's text contains the expected value.
+
+        :return: True if match, else False
+        :rtype: bool
+
+        """
+        element = await self.wait_for_element(by, locator, timeout, condition="text", expected_text=expected_text)
+        if element is None:
+            events.error("Element text did not match", locator=locator, expected=expected_text)
+            return False
+        events.debug("Element text matched", locator=locator, expected=expected_text)
+        return True
+
+    async def query_elements(self, queries, fields=("text",), attributes=()):
+        """
+        Extracts data for several locators with a single script execution.
+
+        :param queries: Mapping of result name to ``(by, locator)``
+        :type queries: dict
+        :param fields: Any of 'text', 'visible', 'rect', 'href'
+        :param attributes: Attribute names to read from every element
+        :return: Mapping of result name to the records of every matching element
+        :rtype: dict
+        :raises ValueError: If a locator uses a strategy the script cannot resolve
+
+        """
+        raw = await self.driver.execute_script(
+            BULK_QUERY_JS, {name: check_script_locator(*query) for name, query in queries.items()}, list(fields),
+            list(attributes)
+        )
+        return {
+            name: [ElementRecord(name=name, index=index, **values) for index, values in enumerate(raw.get(name, []))]
+            for name in queries
+        }
+
+    async def get_page_state(self):
+        """
+        Returns the page title, URL and ready state with a single script execution.
+
+        :rtype: dict
+
+        """
+        return await self.driver.execute_script(PAGE_STATE_JS)
+
+
+class AsyncHomePage(AsyncBasePage, page="HomePage"):
+    def __init__(self, driver, url=None):
+        """
+        AsyncHomePage constructor.
+
+        :param driver: ``AsyncWebDriver`` session
+        :param url: Site base URL; defaults to ``INSIDER_URL``
+
+        """
+        super().__init__(driver)
+        self.url = url or INSIDER_URL
+
+    async def open(self):
+        """
+        Opens the Insider homepage.
+
+        """
+        await self.driver.get(self.url)
+
+    async def is_accessible(self):
+        """
+        :return: True if title contains 'Insider', else False
+        :rtype: bool
+
+        """
+        return "Insider" in await self.driver.title()
+
+    async def navigate_to_careers(self):
+        """
+        Navigates to the Careers page through the Company menu.
+
+        """
+        await self.click_element(*self.locators.company_menu)
+        await self.click_element(*self.locators.careers_link)
+
+
+class AsyncCareerPage(AsyncBasePage, page="CareerPage"):
+    async def is_accessible(self):
+        """
+        :return: True if title or URL contains career-related keywords, else False
+        :rtype: bool
+
+        """
+        await self.wait_for_page_to_load()
+        state = await self.get_page_state()
+        title, url = state["title"].lower(), state["url"].lower()
+        return "careers" in title or "quality assurance" in title or "/careers" in url
+
+    async def verify_sections(self):
+        """
+        Verifies that the Locations, Teams and Life at Insider sections are present.
+
+        The waits run one after another: a session executes one command at a time, so other
+        sessions in the event loop, not these waits, run while one is pending.
+
+        :return: True if all sections are found, else False
+        :rtype: bool
+
+        """
+        sections = {
+            "Locations": self.locators.locations,
+            "Teams": self.locators.teams,
+            "Life at Insider": self.locators.life_at_insider,
+        }
+        names = [name for name, locator in sections.items() if await self.wait_for_element(*locator) is not None]
+        events.info("Career sections found", sections=names)
+        return len(names) == len(sections)
+
+    async def go_to_qa_careers(self):
+        """
+        Opens the QA careers page through "See all teams" and the QA "Open Positions" link.
+
+        """
+        see_all_teams = await self.scroll_to_element(*self.locators.see_all_teams)
+        if see_all_teams is None:
+            events.error("QA careers page could not be opened", locator=self.locators.see_all_teams.value)
+            return
+        await self.click_element(*self.locators.see_all_teams)
+        events.info("'See all teams' clicked")
+        await self.scroll_to_element(*self.locators.qa_open_positions)
+        await self.click_element(*self.locators.qa_open_positions)
+        events.info("QA 'Open Positions' clicked")
+        await self.wait_for_element(*registry.page("QAPage").see_all_qa_jobs)
+
+
+class AsyncQAPage(AsyncBasePage, page="QAPage"):
+    async def is_accessible(self):
+        """
+        :return: True if the QA jobs page is open, else False
+        :rtype: bool
+
+        """
+        await self.wait_for_page_to_load()
+        await self.wait_for_element(*self.locators.view_role_button)
+        url = (await self.get_page_state())["url"]
+        return "quality-assurance" in url or "QA" in url
+
+    async def click_see_all_qa_jobs(self):
+        """
+        Clicks on the 'See all QA jobs' button.
+
+        """
+        await self.scroll_to_element(*self.locators.see_all_qa_jobs)
+        await self.click_element(*self.locators.see_all_qa_jobs)
+
+    async def select_location_if_department_is_qa(self):
+        """
+        Selects 'Istanbul, Turkiye' once the department filter shows 'Quality Assurance'.
+
+        :return: True if the location was selected, else False
+        :rtype: bool
+
+        """
+        if not await self.wait_for_element_text_to_be(*self.locators.department_container, "Quality Assurance"):
+            return False
+        await self.click_element(*self.locators.location_container)
+        await self.click_element(*self.locators.location_istanbul)
+        events.info("Location selected", location="Istanbul, Turkiye")
+        return await self.wait_for_element(*self.locators.job_card) is not None
+
+    async def verify_job_listings(self):
+        """
+        Validates that the job listing includes jobs with both QA and Istanbul keywords.
+
+        :return: True if valid jobs exist, False otherwise
+        :rtype: bool
+
+        """
+        await self.wait_for_element(*self.locators.job_item)
+        jobs = (await self.query_elements({"jobs": self.locators.job_item}))["jobs"]
+        valid_jobs = sum("quality assurance" in job.text.lower() and "istanbul" in job.text.lower() for job in jobs)
+        events.info("Job listings verified", valid_jobs=valid_jobs, total_jobs=len(jobs))
+        return valid_jobs > 0
+
+    async def job_snapshot(self, batch_size=100):
+        """
+        Extracts every job card on the page.
+
+        :param int batch_size: Cards read per script call
+        :rtype: JobSnapshot
+
+        """
+        records, offset = [], 0
+        while True:
+            batch = await self.driver.execute_script(EXTRACT_JOBS_JS, offset, batch_size)
+            records.extend(JobRecord(*values) for values in batch["records"])
+            offset += len(batch["records"])
+            if not batch["records"] or offset >= batch["total"]:
+                return JobSnapshot(records)
+
+    async def verify_view_role_redirects(self):
+        """
+        Clicks the first 'View Role' button and verifies it opens a lever.co job page.
+
+        :return: True if redirected to lever.co, else False
+        :rtype: bool
+
+        """
+        windows = await self.driver.window_handles()
+        button = await self.scroll_to_element(*self.locators.view_role_button)
+        if button is None:
+            return False
+        await self.click_element(*self.locators.view_role_button)
+        for _ in range(50):
+            opened = [handle for handle in await self.driver.window_handles() if handle not in windows]
+            if opened:
+                await self.driver.switch_to_window(opened[0])
+                break
+            await asyncio.sleep(0.1)
+        await self.wait_for_page_to_load()
+        url = await self.driver.current_url()
+        events.info("View Role tab opened", url=url)
+        return "lever.co" in url
@@ -1,35 +1,297 @@
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, StaleElementReferenceException, JavascriptException
+)
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.wait import WebDriverWait
+from . import Checkpoints
+from .AdaptiveTimeouts import timeout_model
+from .EventLog import events
+from .Locators import locators as registry
+from .PageTelemetry import telemetry
+from .StepRecorder import TimedWebDriverWait, instrument_class, recorded_step, recorder
 
 
+# Önbellekteki elemanın tıklanabilir olması için beklenen en uzun süre; aşılırsa locator yeniden çözülür
+ELEMENT_CACHE_WAIT = float(os.environ.get("ELEMENT_CACHE_WAIT", "2"))
+
+# Aşağıdaki script'ler execute_async_script ile çalışır; son argüman Selenium callback'idir.
+# arguments[1] her zaman milisaniye cinsinden üst süre sınırıdır.
+SCROLL_FINISHED_JS = """
+var done = arguments[arguments.length - 1];
+var frames = arguments[0], deadline = performance.now() + arguments[1];
+var lastX = window.scrollX, lastY = window.scrollY, still = 0;
+function check() {
+    var x = window.scrollX, y = window.scrollY;
+    still = (x === lastX && y === lastY) ? still + 1 : 0;
+    lastX = x; lastY = y;
+    if (still >= frames) { return done(true); }
+    if (performance.now() > deadline) { return done(false); }
+    requestAnimationFrame(check);
+}
+requestAnimationFrame(check);
+"""
+
+ELEMENT_STABLE_JS = """
+var done = arguments[arguments.length - 1];
+var frames = arguments[0], deadline = performance.now() + arguments[1], element = arguments[2];
+function box() {
+    var r = element.getBoundingClientRect();
+    return [r.top, r.left, r.width, r.height].join(",");
+}
+var last = box(), still = 0;
+function check() {
+    if (!element.isConnected) { return done(false); }
+    var current = box();
+    still = current === last ? still + 1 : 0;
+    last = current;
+    if (still >= frames) { return done(true); }
+    if (performance.now() > deadline) { return done(false); }
+    requestAnimationFrame(check);
+}
+requestAnimationFrame(check);
+"""
+
+NETWORK_IDLE_JS = """
+var done = arguments[arguments.length - 1];
+var idleMs = arguments[0], deadline = performance.now() + arguments[1];
+if (window.__pendingRequests === undefined) {
+    window.__pendingRequests = 0;
+    var finish = function () { window.__pendingRequests = Math.max(0, window.__pendingRequests - 1); };
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            window.__pendingRequests++;
+            return originalFetch.apply(this, arguments).finally(finish);
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        window.__pendingRequests++;
+        this.addEventListener("loadend", finish);
+        return originalSend.apply(this, arguments);
+    };
+}
+var lastCount = performance.getEntriesByType("resource").length, idleSince = performance.now();
+(function check() {
+    var count = performance.getEntriesByType("resource").length, now = performance.now();
+    if (count !== lastCount || window.__pendingRequests > 0) { lastCount = count; idleSince = now; }
+    if (now - idleSince >= idleMs) { return done(true); }
+    if (now > deadline) { return done(false); }
+    setTimeout(check, 50);
+})();
+"""
+
+DOM_SETTLED_JS = """
+var done = arguments[arguments.length - 1];
+var quietMs = arguments[0], deadline = performance.now() + arguments[1];
+var lastMutation = performance.now();
+var observer = new MutationObserver(function () { lastMutation = performance.now(); });
+observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+(function check() {
+    var now = performance.now();
+    if (now - lastMutation >= quietMs || now > deadline) {
+        observer.disconnect();
+        return done(now - lastMutation >= quietMs);
+    }
+    setTimeout(check, 50);
+})();
+"""
+
+# Selenium By stratejilerinin tarayıcı içi karşılığı; script'lere önden eklenir, findAll(by, locator) dizi döner.
+# Listede olmayan strateji Python tarafında reddedilir (check_script_locator)
+FIND_ELEMENTS_JS = """
+function findAll(by, locator) {
+    if (by === "xpath") {
+        var snapshot = document.evaluate(locator, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var nodes = [];
+        for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+        return nodes;
+    }
+    if (by === "id") { var node = document.getElementById(locator); return node ? [node] : []; }
+    if (by === "class name") { return Array.from(document.getElementsByClassName(locator)); }
+    if (by === "name") { return Array.from(document.getElementsByName(locator)); }
+    if (by === "tag name") { return Array.from(document.getElementsByTagName(locator)); }
+    if (by === "link text" || by === "partial link text") {
+        return Array.from(document.querySelectorAll("a")).filter(function (link) {
+            var text = (link.innerText || link.textContent || "").trim();
+            return by === "link text" ? text === locator : text.indexOf(locator) >= 0;
+        });
+    }
+    if (by === "css selector") { return Array.from(document.querySelectorAll(locator)); }
+    throw new Error("Unsupported locator strategy: " + by);
+}
+"""
+SCRIPT_LOCATOR_STRATEGIES = frozenset({
+    "css selector", "xpath", "id", "class name", "name", "tag name", "link text", "partial link text"
+})
+
+BULK_QUERY_JS = FIND_ELEMENTS_JS + """
+var queries = arguments[0], fields = arguments[1], attributeNames = arguments[2];
+function find(query) { return findAll(query[0], query[1]); }
+function isVisible(el) {
+    var style = window.getComputedStyle(el);
+    return style.visibility !== "hidden" && style.display !== "none" &&
+        !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+}
+var result = {};
+Object.keys(queries).forEach(function (name) {
+    result[name] = find(queries[name]).map(function (el) {
+        var record = {};
+        if (fields.indexOf("text") >= 0) { record.text = (el.innerText || el.textContent || "").trim(); }
+        if (fields.indexOf("visible") >= 0) { record.visible = isVisible(el); }
+        if (fields.indexOf("rect") >= 0) {
+            var r = el.getBoundingClientRect();
+            record.rect = {x: r.x, y: r.y, width: r.width, height: r.height};
+        }
+        if (fields.indexOf("href") >= 0) { record.href = el.href || el.getAttribute("href"); }
+        if (attributeNames.length) {
+            record.attributes = {};
+            attributeNames.forEach(function (attr) { record.attributes[attr] = el.getAttribute(attr); });
+        }
+        return record;
+    });
+});
+return result;
+"""
+
+PAGE_STATE_JS = "return {title: document.title, url: location.href, ready_state: document.readyState};"
+
+
+def check_script_locator(by, locator):
+    """
+    Rejects locator strategies that :data:`FIND_ELEMENTS_JS` cannot resolve in the page.
+
+    :param by: Selenium By strategy
+    :param locator: The locator string
+    :return: The locator as a ``[by, locator]`` script argument
+    :rtype: list
+    :raises ValueError: If the strategy is not supported
+
+    """
+    if by not in SCRIPT_LOCATOR_STRATEGIES:
+        raise ValueError(f"Unsupported locator strategy for in-page lookups: {by!r} ({locator})")
+    return [by, locator]
+
+
+@dataclass(frozen=True)
+class ElementRecord:
+    """
+    Data extracted from one element by :meth:`BasePage.query_elements`.
+
+    Fields that were not requested stay None.
+
+    """
+
+    name: str
+    index: int
+    text: Optional[str] = None
+    visible: Optional[bool] = None
+    rect: Optional[dict] = None
+    href: Optional[str] = None
+    attributes: Optional[dict] = None
+
 
 class BasePage:
     """
     Initialize BasePage with driver and default timeout.
 
+    Every public method of BasePage and its subclasses is recorded as a step span, see
+    :mod:`pages.StepRecorder`.
+
+    Elements resolved by the helpers are cached per page object by ``(by, locator)`` so
+    follow-up actions on the same locator skip the WebDriver lookup. The cache is cleared on
+    navigation and entries are re-resolved when they turn stale.
+
+    Locator waits use the per-locator timeouts of :mod:`pages.AdaptiveTimeouts` once a locator
+    has enough recorded waits; ``timeout`` and the per-call overrides are the fallback.
+
+    Locators come from :mod:`pages.Locators`; :attr:`locators` holds the ones registered under
+    the class name plus the common ones.
+
     :param driver: Selenium WebDriver instance
     :param int timeout: Maximum wait time for element actions
 
     """
 
+    locators = registry.page("BasePage")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrument_class(cls)
+        cls.locators = registry.page(cls.__name__)
+
     def __init__(self, driver, timeout=20):
         self.driver = driver
-        self.wait = WebDriverWait(driver, timeout)
+        self.timeout = timeout
+        self.wait = TimedWebDriverWait(driver, timeout)
+        self._element_cache = {}
+        self.element_cache_stats = {"hits": 0, "misses": 0, "invalidations": 0}
 
     def wait_for_element(self, by, locator, timeout=None):
+        """
+        Waits until the element is present in the DOM and caches it.
 
+        :param by: Selenium By strategy
+        :param locator: The locator string
+        :param int timeout: Optional timeout override
+        :return: WebElement or None
+        :rtype: WebElement
+
+        """
         try:
-            wait = WebDriverWait(self.driver, timeout) if timeout else self.wait
-            return wait.until(EC.presence_of_element_located((by, locator)))
+            element = self._locator_wait(by, locator, timeout, EC.presence_of_element_located((by, locator)))
+            self._element_cache[(by, locator)] = element
+            return element
         except TimeoutException:
-            print(f"❌ Error: {locator} element not found.")
+            events.error("Element not found", locator=locator)
             return None
 
+    def find_cached_element(self, by, locator, timeout=None):
+        """
+        Returns the cached element for the locator, resolving it with a presence wait on a miss.
+
+        The cached element is not re-validated; callers that act on it should go through
+        :meth:`_with_cached_element` so a stale entry is re-resolved.
+
+        :param by: Selenium By strategy
+        :param locator: The locator string
+        :param int timeout: Optional timeout override
+        :return: WebElement or None
+        :rtype: WebElement
+
+        """
+        element = self._element_cache.get((by, locator))
+        if element is not None:
+            self.element_cache_stats["hits"] += 1
+            return element
+        self.element_cache_stats["misses"] += 1
+        return self.wait_for_element(by, locator, timeout)
+
+    def invalidate_element_cache(self, by=None, locator=None):
+        """
+        Drops one cached locator, or the whole cache when no locator is given.
+
+        :param by: Selenium By strategy
+        :param locator: The locator string
+
+        """
+        if locator is None:
+            self.element_cache_stats["invalidations"] += len(self._element_cache)
+            self._element_cache.clear()
+        elif self._element_cache.pop((by, locator), None) is not None:
+            self.element_cache_stats["invalidations"] += 1
+
     def wait_for_element_to_be_clickable(self, by, locator, timeout=None):
         """
-        Waits until the element is clickable.
+        Waits until the element is clickable, trying the cached element first.
+
+        A cached element counts as a hit only if it becomes clickable within
+        ``ELEMENT_CACHE_WAIT``; a stale or still unclickable one is dropped and the locator is
+        resolved again, which counts as a miss.
 
         :param by: Selenium By strategy
         :param locator: The locator string
@@ -38,11 +300,29 @@ class BasePage:
         :rtype: WebElement
 
         """
+        cached = self._element_cache.get((by, locator))
+        if cached is not None:
+            # Önbellekten gelen eleman bekleme örneği sayılmaz; p99'u aşağı çekip timeout'u kısaltırdı
+            recorder.mark_cached()
+            started = time.perf_counter()
+            try:
+                element = WebDriverWait(self.driver, min(timeout or self.timeout, ELEMENT_CACHE_WAIT)).until(
+                    EC.element_to_be_clickable(cached))
+                self.element_cache_stats["hits"] += 1
+                return element
+            except (StaleElementReferenceException, TimeoutException):
+                # Eski ya da yerine yenisi çizilmiş eleman; locator'dan yeniden çözülür
+                self.invalidate_element_cache(by, locator)
+            finally:
+                recorder.add_wait_time(time.perf_counter() - started)
+
+        self.element_cache_stats["misses"] += 1
         try:
-            wait = WebDriverWait(self.driver, timeout) if timeout else self.wait
-            return wait.until(EC.element_to_be_clickable((by, locator)))
+            element = self._locator_wait(by, locator, timeout, EC.element_to_be_clickable((by, locator)))
+            self._element_cache[(by, locator)] = element
+            return element
         except TimeoutException:
-            print(f"❌ Error: {locator} element is not clickable.")
+            events.error("Element is not clickable", locator=locator)
             return None
 
     def click_element(self, by, locator):
@@ -57,56 +337,69 @@ class BasePage:
         if element:
             try:
                 element.click()
-                print(f"✅ Click Success: {locator}")
+                events.debug("Clicked", locator=locator)
             except Exception:
-                print(f"⚠️ Selenium could not clicked, Clicking with JavaScript: {locator}")
+                events.warning("Selenium click failed, clicking with JavaScript", locator=locator)
                 self.driver.execute_script("arguments[0].click();", element)
         else:
-            print(f"⚠️ Warning: {locator} element could not clicked.")
+            events.warning("Element could not be clicked", locator=locator)
 
     def scroll_to_element(self, by, locator):
         """
-        Scrolls to the specified element on the page.
+        Scrolls to the specified element on the page and waits until the smooth scroll has finished.
 
         :param by: Selenium By strategy
         :param locator: The locator string
 
         """
-        element = self.wait_for_element(by, locator)
-        if element:
+        def scroll(element):
             self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
-            print(f"🔽 Page scrolled: {locator}")
+            self._run_wait_script(ELEMENT_STABLE_JS, 3, None, element)
+            return True
+
+        if self._with_cached_element(by, locator, scroll):
+            events.debug("Scrolled to element", locator=locator)
         else:
-            print(f"⚠️ Warning: {locator} couldnt scroll, element not found.")
+            events.warning("Could not scroll, element not found", locator=locator)
 
-    def accept_cookies(self, cookie_xpath):
+    def accept_cookies(self, cookie_locator=None):
         """
         Clicks the cookie accept button if it's visible and clickable.
 
-        :param cookie_xpath: XPath locator for the cookie accept button
+        :param cookie_locator: ``(by, locator)`` of the cookie accept button, defaults to the
+            registered ``cookie_accept`` locator
 
         """
+        by, locator = cookie_locator or self.locators.cookie_accept
         try:
-            print("🔄 Cookies")
-            cookie_button = self.wait_for_element_to_be_clickable(By.XPATH, cookie_xpath)
+            cookie_button = self.wait_for_element_to_be_clickable(by, locator)
             if cookie_button:
                 cookie_button.click()
-                print("✅ Cookies accepted!")
+                events.info("Cookies accepted")
             else:
-                print("⚠️ Cookies not found.")
+                events.warning("Cookie button not found", locator=locator)
         except NoSuchElementException:
-            print("⚠️ Cookie skipped.")
+            events.warning("Cookie banner skipped", locator=locator)
 
     def wait_for_page_to_load(self):
         """
-        Waits until the page's document.readyState is 'complete'.
+        Waits until the page's document.readyState is 'complete'. Clears the element cache.
+
+        Drivers launched with a launch profile use its ready states instead, e.g. 'interactive'
+        for eager page loading, followed by a DOM settle wait when the profile asks for it.
 
         """
+        self.invalidate_element_cache()
+        profile = getattr(self.driver, "launch_profile", None)
+        ready_states = profile.ready_states if profile else ("complete",)
         try:
-            self.wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
-            print("✅ Page done")
+            self.wait.until(lambda d: d.execute_script("return document.readyState") in ready_states)
+            events.debug("Page loaded", ready_states=ready_states)
         except TimeoutException:
-            print("⚠️ Page loading could not finish.")
+            events.warning("Page loading did not finish", ready_states=ready_states)
+            return
+        if profile and profile.wait_for_dom_settled:
+            self.wait_for_dom_to_settle()
 
     def get_element_text(self, by, locator):
         """
@@ -118,10 +411,8 @@ class BasePage:
         :rtype: str
 
         """
-        element = self.wait_for_element(by, locator)
-        if element:
-            return element.text.strip()
-        return ""
+        text = self._with_cached_element(by, locator, lambda element: element.text.strip())
+        return text or ""
 
     def wait_for_element_text_to_be(self, by, locator, expected_text, timeout=10):
         """
@@ -136,12 +427,254 @@ class BasePage:
 
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.text_to_be_present_in_element((by, locator), expected_text)
-            )
-            print(f"✅ Element text changed as '{expected_text}'.")
+            self._locator_wait(by, locator, timeout, EC.text_to_be_present_in_element((by, locator), expected_text))
+            events.debug("Element text matched", locator=locator, expected=expected_text)
             return True
         except TimeoutException:
             actual_text = self.get_element_text(by, locator)
-            print(f"❌ Error: Element text could not changed '{expected_text}'. Last change: '{actual_text}'")
-            return False
\ No newline at end of file
+            events.error("Element text did not match", locator=locator, expected=expected_text, actual=actual_text)
+            return False
+
+    def wait_for_scroll_to_finish(self, frames=3, timeout=None):
+        """
+        Waits until the window scroll position stays the same for the given number of animation frames.
+
+        :param int frames: Consecutive unchanged frames required
+        :param int timeout: Optional timeout override
+        :return: True if scrolling finished, else False
+        :rtype: bool
+
+        """
+        return self._report_wait(self._run_wait_script(SCROLL_FINISHED_JS, frames, timeout), "Scroll")
+
+    def wait_for_element_to_be_stable(self, by, locator, frames=3, timeout=None):
+        """
+        Waits until the element's bounding box stays the same for the given number of animation frames.
+
+        :param by: Selenium By strategy
+        :param locator: The locator string
+        :param int frames: Consecutive unchanged frames required
+        :param int timeout: Optional timeout override
+        :return: True if the element stopped moving, else False
+        :rtype: bool
+
+        """
+        settled = self._with_cached_element(
+            by, locator, lambda element: self._run_wait_script(ELEMENT_STABLE_JS, frames, timeout, element)
+        )
+        return self._report_wait(bool(settled), locator)
+
+    def wait_for_network_idle(self, idle_time=0.5, timeout=None):
+        """
+        Waits until no fetch/XHR request is in flight and no new resource was loaded for ``idle_time`` seconds.
+
+        :param float idle_time: Quiet period in seconds
+        :param int timeout: Optional timeout override
+        :return: True if the network went idle, else False
+        :rtype: bool
+
+        """
+        return self._report_wait(self._run_wait_script(NETWORK_IDLE_JS, int(idle_time * 1000), timeout), "Network")
+
+    def wait_for_dom_to_settle(self, quiet_time=0.3, timeout=None):
+        """
+        Waits until a MutationObserver sees no DOM changes for ``quiet_time`` seconds.
+
+        :param float quiet_time: Quiet period in seconds
+        :param int timeout: Optional timeout override
+        :return: True if the DOM settled, else False
+        :rtype: bool
+
+        """
+        return self._report_wait(self._run_wait_script(DOM_SETTLED_JS, int(quiet_time * 1000), timeout), "DOM")
+
+    def query_elements(self, queries, fields=("text",), attributes=()):
+        """
+        Extracts data for several locators with a single script execution.
+
+        :param queries: Mapping of result name to ``(by, locator)``
+        :type queries: dict
+        :param fields: Any of 'text', 'visible', 'rect', 'href'
+        :param attributes: Attribute names to read from every element
+        :return: Mapping of result name to the records of every matching element
+        :rtype: dict
+        :raises ValueError: If a locator uses a strategy the script cannot resolve
+
+        """
+        raw = self.driver.execute_script(
+            BULK_QUERY_JS, {name: check_script_locator(*query) for name, query in queries.items()}, list(fields),
+            list(attributes)
+        )
+        return {
+            name: [ElementRecord(name=name, index=index, **values) for index, values in enumerate(raw.get(name, []))]
+            for name in queries
+        }
+
+    def wait_for_elements(self, queries, fields=("text",), attributes=(), timeout=None, visible=False):
+        """
+        Polls :meth:`query_elements` until every locator matches at least one element.
+
+        Each poll is one WebDriver round trip regardless of the number of locators.
+
+        :param queries: Mapping of result name to ``(by, locator)``
+        :type queries: dict
+        :param fields: Any of 'text', 'visible', 'rect', 'href'
+        :param attributes: Attribute names to read from every element
+        :param int timeout: Optional timeout override
+        :param bool visible: Wait for a visible match instead of any match; adds the 'visible' field
+        :return: The last records; names that never matched have an empty list
+        :rtype: dict
+
+        """
+        last = {}
+        if visible and "visible" not in fields:
+            fields = (*fields, "visible")
+
+        def matched(name):
+            return any(record.visible for record in last.get(name, ())) if visible else bool(last.get(name))
+
+        def all_found(driver):
+            last.update(self.query_elements(queries, fields, attributes))
+            return all(matched(name) for name in queries)
+
+        try:
+            wait = TimedWebDriverWait(self.driver, timeout) if timeout else self.wait
+            wait.until(all_found)
+        except TimeoutException:
+            missing = [name for name in queries if not matched(name)]
+            events.error("Elements not found", missing=missing)
+        return last
+
+    def get_page_state(self):
+        """
+        Returns the page title, URL and ready state with a single script execution.
+
+        :return: Dict with 'title', 'url' and 'ready_state'
+        :rtype: dict
+
+        """
+        state = self.driver.execute_script(PAGE_STATE_JS)
+        recorder.note_url(state["url"])
+        return state
+
+    def save_checkpoint(self, stage, origin=None):
+        """
+        Saves the cookies, localStorage and URL of the current page as the checkpoint of a flow stage.
+
+        :param stage: Stage name, e.g. 'careers'
+        :param origin: Site origin the flow started from, defaults to the current page's origin
+        :rtype: Checkpoints.Checkpoint
+
+        """
+        checkpoint = Checkpoints.save_checkpoint(self.driver, stage, Checkpoints.checkpoints, origin)
+        events.debug("Checkpoint saved", stage=stage, url=checkpoint.url)
+        return checkpoint
+
+    def restore_checkpoint(self, stage, origin):
+        """
+        Jumps to the page of a saved flow stage with its cookies and localStorage restored.
+
+        :param stage: Stage name
+        :param origin: Site origin the flow started from
+        :return: True if the checkpoint was restored and its markup hash still matches
+        :rtype: bool
+
+        """
+        restored = Checkpoints.restore_checkpoint(
+            self.driver, stage, origin, Checkpoints.checkpoints, self.wait_for_page_to_load
+        )
+        if restored:
+            events.info("Checkpoint restored", stage=stage)
+        else:
+            events.info("No usable checkpoint, navigating normally", stage=stage)
+        return restored
+
+    def collect_page_metrics(self, page, previous_url=None):
+        """
+        Records the load metrics of the current page and logs its budget violations.
+
+        After a click-triggered navigation pass the URL the click was made on; collection then
+        waits for the new page to load first.
+
+        :param page: Page name the budgets are keyed by, e.g. 'careers'
+        :param previous_url: URL of the page the navigation started from
+        :return: The metrics, or None if telemetry is disabled or the page did not change
+        :rtype: PageTelemetry.PageMetrics
+
+        """
+        if not telemetry.enabled:
+            return None
+        if previous_url:
+            try:
+                self.wait.until(EC.url_changes(previous_url))
+            except TimeoutException:
+                events.warning("Page did not change, metrics skipped", page=page, url=previous_url)
+                return None
+            self.wait_for_page_to_load()
+        metrics = telemetry.collect(self.driver, page)
+        if metrics and metrics.violations:
+            events.warning("Page budget exceeded", page=page, violations=metrics.violations)
+        elif metrics:
+            events.debug("Page metrics collected", page=page, lcp=metrics.values.get("lcp"))
+        return metrics
+
+    def element_cache_report(self):
+        """
+        Returns the element cache counters; every hit is one WebDriver lookup saved.
+
+        :return: Hits, misses, invalidations and hit ratio
+        :rtype: dict
+
+        """
+        stats = dict(self.element_cache_stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def _with_cached_element(self, by, locator, action):
+        # Her çağrı tek sonuç sayar: eski eleman yeniden çözülürse isabet değil ıska olur
+        element = self._element_cache.get((by, locator))
+        if element is not None:
+            try:
+                result = action(element)
+                self.element_cache_stats["hits"] += 1
+                return result
+            except StaleElementReferenceException:
+                self.invalidate_element_cache(by, locator)
+        self.element_cache_stats["misses"] += 1
+        element = self.wait_for_element(by, locator)
+        return action(element) if element is not None else None
+
+    @recorded_step
+    def _locator_wait(self, by, locator, timeout, condition):
+        # Timeout, locator'ın geçmiş bekleme sürelerinden türetilir; yeterli örnek yoksa verilen/sabit değer
+        # kullanılır. Kendi adımı olarak kaydedilir, ui_test_steps geçmişi bu adımlardan okunur (WAIT_STEPS)
+        timeout = timeout_model.timeout_for(locator, timeout or self.timeout)
+        started = time.perf_counter()
+        try:
+            result = TimedWebDriverWait(self.driver, timeout).until(condition)
+        except TimeoutException:
+            timeout_model.record(locator, timeout, timed_out=True)
+            raise
+        timeout_model.record(locator, time.perf_counter() - started)
+        return result
+
+    def _run_wait_script(self, script, value, timeout, *args):
+        deadline_ms = int((timeout or self.timeout) * 1000)
+        started = time.perf_counter()
+        try:
+            return bool(self.driver.execute_async_script(script, value, deadline_ms, *args))
+        except (TimeoutException, JavascriptException):
+            return False
+        finally:
+            recorder.add_wait_time(time.perf_counter() - started)
+
+    def _report_wait(self, settled, subject):
+        if settled:
+            events.debug("Settled", subject=subject)
+        else:
+            events.warning("Did not settle in time, continuing", subject=subject)
+        return settled
+
+
+instrument_class(BasePage)
@@ -1,7 +1,6 @@
-import time
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from .EventLog import events
+from .Locators import locators as registry
 from .BasePage import BasePage
 
 class CareerPage(BasePage):
@@ -13,13 +12,6 @@ class CareerPage(BasePage):
 
         """
         super().__init__(driver)
-        self.cookie_accept_id = "//*[@id='wt-cli-accept-all-btn']"
-        self.LOCATIONS_XPATH = "//*[@id='career-our-location']/div/div/div/div[1]"
-        self.TEAMS_PATH = "//*[@id='career-find-our-calling']/div/div/a"
-        self.life_at_insider_xpath = "//h2[contains(text(), 'Life at Insider')]"
-        self.see_all_teams_xpath = "//a[contains(text(), 'See all teams')]"
-        self.qa_careers_xpath = "//h3[contains(text(), 'Quality Assurance')]"
-        self.qa_open_positions_xpath = "//h3[contains(text(), 'Quality Assurance')]/following-sibling::a[contains(text(), 'Open Positions')]"
 
     def is_accessible(self):
         """
@@ -30,40 +22,38 @@ class CareerPage(BasePage):
 
         """
         try:
-            print("🔍 QA page title check")
             self.wait_for_page_to_load()
-            title = self.driver.title.lower()
-            url = self.driver.current_url.lower()
-            print(f"📄 QA Page Title: {title}")
-            print(f"🌐 QA Page URL: {url}")
+            state = self.get_page_state()
+            title = state["title"].lower()
+            url = state["url"].lower()
+            events.info("Careers page opened", title=title, url=url)
             return "careers" in title or "quality assurance" in title or "/careers" in url
         except Exception as e:
-            print(f"❌ QA page error: {e}")
+            events.error("Careers page not found", error=e)
             return False
 
     def verify_sections(self):
         """
-        Verifies the presence of key sections: Locations, Teams, and Life at Insider.
+        Verifies that the key sections Locations, Teams and Life at Insider are visible.
+
+        All three sections are checked with one script execution per poll.
 
         :return: True if all sections are found, else False
         :rtype: bool
 
         """
         try:
-            print("🔄 Waiting for Location part..")
-            self.wait_for_element(By.XPATH, self.LOCATIONS_XPATH)
-            print("✅ Locations part found!")
-
-            print("🔄 Waiting for Teams part..")
-            self.wait_for_element(By.XPATH, self.TEAMS_PATH)
-            print("✅ Teams part found!")
-
-            self.wait_for_element(By.XPATH, self.life_at_insider_xpath)
-            print("✅ Life at Insider part found!")
-
-            return True
+            sections = self.wait_for_elements({
+                "Locations": self.locators.locations,
+                "Teams": self.locators.teams,
+                "Life at Insider": self.locators.life_at_insider,
+            }, fields=(), visible=True)
+
+            found = [name for name, records in sections.items() if any(record.visible for record in records)]
+            events.info("Career sections found", sections=found)
+            return len(found) == len(sections)
         except Exception as e:
-            print(f"❌ Error: Element could not found: {e}")
+            events.error("Career sections could not be checked", error=e)
             return False
 
     def go_to_qa_careers(self):
@@ -74,42 +64,37 @@ class CareerPage(BasePage):
 
         """
         try:
-            print("🔄 Waiting for 'See All Teams' button...")
-            see_all_teams_button = self.wait_for_element_to_be_clickable(By.XPATH, self.see_all_teams_xpath)
+            see_all_teams_button = self.wait_for_element_to_be_clickable(*self.locators.see_all_teams)
 
-            self.scroll_to_element(By.XPATH, self.see_all_teams_xpath)
-            time.sleep(1)
-            self.scroll_to_element(By.XPATH, self.see_all_teams_xpath)
-            time.sleep(1)
+            self.scroll_to_element(*self.locators.see_all_teams)
+            # Lazy-load edilen bölümler layout'u kaydırabilir, DOM durulunca tekrar hizalanır
+            self.wait_for_dom_to_settle()
+            self.scroll_to_element(*self.locators.see_all_teams)
 
             see_all_teams_button.click()
-            print("✅ 'See All Teams' button clicked.")
+            events.info("'See all teams' clicked")
 
-            print("🔄 Waiting for page load...")
             self.wait_for_page_to_load()
-            time.sleep(2)
+            self.wait_for_dom_to_settle()
 
-            print("🔄 'QA Careers' button checked...")
-            self.scroll_to_element(By.XPATH, self.qa_careers_xpath)
-            time.sleep(1)
+            self.scroll_to_element(*self.locators.qa_careers)
 
-            qa_careers_section = self.wait_for_element(By.XPATH, self.qa_careers_xpath)
+            qa_careers_section = self.wait_for_element(*self.locators.qa_careers)
 
-            qa_open_link = self.wait_for_element_to_be_clickable(By.XPATH, self.qa_open_positions_xpath)
+            qa_open_link = self.wait_for_element_to_be_clickable(*self.locators.qa_open_positions)
+            careers_url = self.driver.current_url
 
             if qa_open_link:
-                print("🖱 Clicking on the 'Open Positions' button ")
-                self.scroll_to_element(By.XPATH, self.qa_open_positions_xpath)
-                time.sleep(1)
+                self.scroll_to_element(*self.locators.qa_open_positions)
                 qa_open_link.click()
-                print("✅ Changed to the 'QA Careers' page.")
+                events.info("QA 'Open Positions' clicked")
             else:
-                print("⚠️ Link could not found, clicking with the JavaScript")
+                events.warning("QA 'Open Positions' link not found, clicking with JavaScript",
+                               locator=self.locators.qa_open_positions.value)
                 self.driver.execute_script("arguments[0].click();", qa_careers_section)
-                print("✅ 'QA Careers' button clicked.")
 
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//a[contains(text(), 'See all QA jobs')]"))
-            )
+            self.collect_page_metrics("qa_jobs", careers_url)
+            see_all_qa_jobs = registry.page("QAPage").see_all_qa_jobs
+            self._locator_wait(*see_all_qa_jobs, 10, EC.presence_of_element_located(tuple(see_all_qa_jobs)))
         except Exception as e:
-            print(f"❌ Error: 'QA Careers' page could not found: {e}")
\ No newline at end of file
+            events.error("QA careers page could not be opened", error=e)
\ No newline at end of file
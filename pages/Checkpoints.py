@@ -0,0 +1,203 @@
+import hashlib
+import json
+import os
+import re
+import time
+import urllib.parse
+from dataclasses import dataclass, asdict, field
+from selenium.common.exceptions import WebDriverException
+
+
+CHECKPOINT_DIR = os.environ.get("CHECKPOINT_DIR", ".checkpoints")
+# Bu süreden eski checkpoint'ler kullanılmaz (cookie'ler ve oturum verisi eskir)
+CHECKPOINT_MAX_AGE = float(os.environ.get("CHECKPOINT_MAX_AGE_HOURS", "12")) * 3600
+
+# URL, localStorage ve sayfa iskeleti tek script çağrısında okunur.
+# İskelet id'li elementlerden oluşur; select2 gibi üretilmiş sayısal id'ler dışarıda bırakılır.
+CAPTURE_STATE_JS = """
+var storage = {};
+try {
+    for (var i = 0; i < localStorage.length; i++) {
+        var key = localStorage.key(i);
+        storage[key] = localStorage.getItem(key);
+    }
+} catch (e) {}
+var skeleton = Array.from(document.querySelectorAll("[id]"))
+    .filter(function (el) { return !/\\d{3,}/.test(el.id); })
+    .map(function (el) { return el.tagName + "#" + el.id; })
+    .sort();
+return {url: location.href, local_storage: storage, skeleton: skeleton.join("|")};
+"""
+
+RESTORE_STORAGE_JS = """
+var storage = arguments[0];
+Object.keys(storage).forEach(function (key) { localStorage.setItem(key, storage[key]); });
+"""
+
+
+@dataclass
+class Checkpoint:
+    """
+    Browser state saved after a flow stage.
+
+    :param stage: Stage name, e.g. 'careers'
+    :param url: Page URL at the end of the stage
+    :param cookies: Cookies as returned by ``driver.get_cookies()``
+    :param local_storage: localStorage of the page origin
+    :param markup_hash: Hash of the page skeleton when the checkpoint was saved
+    :param saved_at: Unix time of the save
+
+    """
+
+    stage: str
+    url: str
+    cookies: list = field(default_factory=list)
+    local_storage: dict = field(default_factory=dict)
+    markup_hash: str = ""
+    saved_at: float = 0.0
+
+
+def markup_hash(skeleton):
+    """
+    Hashes a page skeleton string from ``CAPTURE_STATE_JS``.
+
+    :param skeleton: ``|``-joined ``TAG#id`` entries
+    :rtype: str
+
+    """
+    return hashlib.sha256(skeleton.encode("utf-8")).hexdigest()[:16]
+
+
+class CheckpointStore:
+    """
+    JSON files of flow checkpoints, one per stage and site origin.
+
+    :param directory: Directory holding the checkpoint files
+    :param float max_age: Seconds after which a checkpoint is ignored
+
+    """
+
+    def __init__(self, directory=CHECKPOINT_DIR, max_age=CHECKPOINT_MAX_AGE):
+        self.directory = directory
+        self.max_age = max_age
+
+    def path(self, stage, origin):
+        digest = hashlib.sha1(origin.encode("utf-8")).hexdigest()[:10]
+        safe_stage = re.sub(r"[^\w-]+", "_", stage)
+        return os.path.join(self.directory, f"{safe_stage}-{digest}.json")
+
+    def save(self, checkpoint, origin):
+        """
+        Writes a checkpoint, replacing the previous one of the same stage and origin.
+
+        :param checkpoint: Checkpoint to store
+        :type checkpoint: Checkpoint
+        :param origin: Site origin the flow started from
+
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(checkpoint.stage, origin)
+        with open(path + ".tmp", "w", encoding="utf-8") as checkpoint_file:
+            json.dump(asdict(checkpoint), checkpoint_file, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def load(self, stage, origin):
+        """
+        Returns the stored checkpoint, or None if there is none or it is too old.
+
+        :param stage: Stage name
+        :param origin: Site origin, e.g. 'https://useinsider.com'
+        :rtype: Checkpoint
+
+        """
+        try:
+            with open(self.path(stage, origin), encoding="utf-8") as checkpoint_file:
+                checkpoint = Checkpoint(**json.load(checkpoint_file))
+        except (OSError, ValueError, TypeError):
+            return None
+        if time.time() - checkpoint.saved_at > self.max_age:
+            return None
+        return checkpoint
+
+    def invalidate(self, stage, origin):
+        """
+        Removes the checkpoint of a stage.
+
+        :param stage: Stage name
+        :param origin: Site origin
+
+        """
+        try:
+            os.remove(self.path(stage, origin))
+        except FileNotFoundError:
+            pass
+
+
+checkpoints = CheckpointStore()
+
+
+def origin_of(url):
+    parts = urllib.parse.urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def save_checkpoint(driver, stage, store, origin=None):
+    """
+    Saves the cookies, localStorage, URL and markup hash of the current page.
+
+    :param driver: Selenium WebDriver instance
+    :param stage: Stage name
+    :param store: Checkpoint store
+    :type store: CheckpointStore
+    :param origin: Site origin the flow started from, defaults to the origin of the current page
+    :rtype: Checkpoint
+
+    """
+    state = driver.execute_script(CAPTURE_STATE_JS)
+    checkpoint = Checkpoint(
+        stage=stage, url=state["url"], cookies=driver.get_cookies(), local_storage=state["local_storage"],
+        markup_hash=markup_hash(state["skeleton"]), saved_at=time.time(),
+    )
+    store.save(checkpoint, origin or origin_of(checkpoint.url))
+    return checkpoint
+
+
+def restore_checkpoint(driver, stage, origin, store, wait_for_page=None):
+    """
+    Restores a checkpoint and opens its URL, skipping the navigation that led there.
+
+    Cookies and localStorage are set on a lightweight same-origin URL first so the target page
+    loads with them. The restored page is verified against the stored markup hash; on a
+    mismatch the checkpoint is invalidated and the caller has to navigate normally.
+
+    :param driver: Selenium WebDriver instance
+    :param stage: Stage name
+    :param origin: Site origin the flow started from, e.g. 'https://useinsider.com'
+    :param store: Checkpoint store
+    :type store: CheckpointStore
+    :param wait_for_page: Callable run after the target URL is opened, e.g. a page-load wait
+    :return: True if the page is in the checkpointed state
+    :rtype: bool
+
+    """
+    checkpoint = store.load(stage, origin)
+    if checkpoint is None:
+        return False
+
+    driver.get(origin_of(checkpoint.url) + "/robots.txt")
+    for cookie in checkpoint.cookies:
+        try:
+            driver.add_cookie(cookie)
+        except WebDriverException:
+            # Başka domain'e ait cookie'ler bu origin'de eklenemez
+            pass
+    driver.execute_script(RESTORE_STORAGE_JS, checkpoint.local_storage)
+
+    driver.get(checkpoint.url)
+    if wait_for_page:
+        wait_for_page()
+    state = driver.execute_script(CAPTURE_STATE_JS)
+    if markup_hash(state["skeleton"]) != checkpoint.markup_hash:
+        store.invalidate(stage, origin)
+        return False
+    return True
@@ -0,0 +1,154 @@
+import argparse
+import fnmatch
+import json
+import os
+import sys
+import threading
+import time
+from .StepRecorder import recorder
+
+
+DEBUG, INFO, WARNING, ERROR = 10, 20, 30, 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+LEVELS = {name: level for level, name in LEVEL_NAMES.items()}
+LEVEL_ICONS = {DEBUG: "🔹", INFO: "✅", WARNING: "⚠️", ERROR: "❌"}
+
+# EVENT_LOG_LEVEL dosyaya yazılan, EVENT_LOG_STDOUT_LEVEL konsola basılan en düşük seviye
+EVENT_LOG_PATH = os.environ.get("EVENT_LOG_PATH", "events.jsonl")
+EVENT_LOG_LEVEL = os.environ.get("EVENT_LOG_LEVEL", "INFO")
+EVENT_LOG_STDOUT_LEVEL = os.environ.get("EVENT_LOG_STDOUT_LEVEL", "WARNING")
+# Her olayda bulunan alanlar; aynı isimli çağıran alanları "field_" önekiyle saklanır
+RESERVED_FIELDS = ("time", "level", "test", "step", "message")
+
+
+class EventLog:
+    """
+    Buffered structured event sink for page objects.
+
+    Events below ``level`` are dropped with a single comparison. The rest are appended to an
+    in-memory buffer, tagged with the running test and page-object step, and written in batches
+    to a JSONL file. Events at ``stdout_level`` or above are echoed to stdout right away, so a
+    warning shows up next to the output of the step that raised it. Caller fields named like a
+    reserved field (:data:`RESERVED_FIELDS`) are stored with a ``field_`` prefix.
+
+    :param path: JSONL file the events are appended to
+    :param level: Lowest recorded level name
+    :param stdout_level: Lowest level name echoed to stdout
+    :param int batch_size: Buffered events that trigger a flush
+
+    """
+
+    def __init__(self, path=EVENT_LOG_PATH, level=EVENT_LOG_LEVEL, stdout_level=EVENT_LOG_STDOUT_LEVEL,
+                 batch_size=500):
+        self.path = path
+        self.level = LEVELS[level.upper()]
+        self.stdout_level = LEVELS[stdout_level.upper()]
+        self.batch_size = batch_size
+        self.test = None
+        self._buffer = []
+        self._lock = threading.Lock()
+
+    def start_test(self, test_name):
+        """
+        Flushes the previous test's events and tags the following ones with ``test_name``.
+
+        :param test_name: Name of the test that starts
+
+        """
+        self.flush()
+        self.test = test_name
+
+    def debug(self, message, **fields):
+        if self.level <= DEBUG:
+            self._record(DEBUG, message, fields)
+
+    def info(self, message, **fields):
+        if self.level <= INFO:
+            self._record(INFO, message, fields)
+
+    def warning(self, message, **fields):
+        if self.level <= WARNING:
+            self._record(WARNING, message, fields)
+
+    def error(self, message, **fields):
+        if self.level <= ERROR:
+            self._record(ERROR, message, fields)
+
+    def flush(self):
+        """
+        Writes the buffered events to the JSONL file.
+
+        :return: Number of events written
+        :rtype: int
+
+        """
+        with self._lock:
+            events, self._buffer = self._buffer, []
+        if not events:
+            return 0
+        with open(self.path, "a", encoding="utf-8") as log_file:
+            log_file.write("".join(json.dumps(event, default=str) + "\n" for event in events))
+        return len(events)
+
+    def _record(self, level, message, fields):
+        event = {"time": time.time(), "level": LEVEL_NAMES[level], "test": self.test,
+                 "step": recorder.current_step(), "message": message}
+        for key, value in fields.items():
+            event[f"field_{key}" if key in RESERVED_FIELDS else key] = value
+        if level >= self.stdout_level:
+            sys.stdout.write(format_event(event) + "\n")
+        self._buffer.append(event)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+
+events = EventLog()
+
+
+def format_event(event):
+    """
+    Formats an event as a console line.
+
+    :param event: Event dict
+    :rtype: str
+
+    """
+    extra = {key: value for key, value in event.items() if key not in RESERVED_FIELDS}
+    details = " ".join(f"{key}={value}" for key, value in extra.items())
+    return f"{LEVEL_ICONS[LEVELS[event['level']]]} {event['message']}" + (f" ({details})" if details else "")
+
+
+def read_events(path=EVENT_LOG_PATH, test=None, step=None, level="DEBUG"):
+    """
+    Reads events back from a JSONL file.
+
+    :param path: JSONL file written by :class:`EventLog`
+    :param test: Only events of this test
+    :param step: Only events of matching steps, shell-style wildcards allowed (e.g. ``QAPage.*``)
+    :param level: Lowest level name to return
+    :return: Matching events in write order
+    :rtype: generator
+
+    """
+    minimum = LEVELS[level.upper()]
+    with open(path, encoding="utf-8") as log_file:
+        for line in log_file:
+            event = json.loads(line)
+            if test is not None and event["test"] != test:
+                continue
+            if step is not None and not fnmatch.fnmatchcase(event["step"] or "", step):
+                continue
+            if LEVELS[event["level"]] >= minimum:
+                yield event
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query the structured page-object event log.")
+    parser.add_argument("path", nargs="?", default=EVENT_LOG_PATH)
+    parser.add_argument("--test")
+    parser.add_argument("--step")
+    parser.add_argument("--level", default="DEBUG", choices=list(LEVELS))
+    args = parser.parse_args()
+
+    for found in read_events(args.path, args.test, args.step, args.level):
+        print(f"{found['test']} {found['step']} {format_event(found)}")
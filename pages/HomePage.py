@@ -1,19 +1,20 @@
-from selenium.webdriver.common.by import By
+import os
 from .BasePage import BasePage
+from .Checkpoints import origin_of
+
+INSIDER_URL = os.environ.get("INSIDER_BASE_URL", "https://useinsider.com")
 
 class HomePage(BasePage):
-    def __init__(self, driver):
+    def __init__(self, driver, url=None):
         """
         HomePage constructor.
 
         :param driver: Selenium WebDriver instance
+        :param url: Site base URL, e.g. a local snapshot server; defaults to ``INSIDER_URL``
 
         """
         super().__init__(driver)
-        self.url = "https://useinsider.com"
-        self.cookie_button_xpath = "//*[@id='wt-cli-accept-all-btn']"
-        self.careers_link_xpath = "//*[@id='navbarNavDropdown']/ul[1]/li[6]/div/div[2]/a[2]"
-        self.company_menu_xpath = "(//*[@id='navbarDropdownMenuLink'])[5]"
+        self.url = url or INSIDER_URL
 
     def open(self):
         """
@@ -21,6 +22,8 @@ class HomePage(BasePage):
 
         """
         self.driver.get(self.url)
+        self.invalidate_element_cache()
+        self.collect_page_metrics("home")
 
     def is_accessible(self):
         """
@@ -32,17 +35,23 @@ class HomePage(BasePage):
         """
         return "Insider" in self.driver.title
 
-    def accept_cookies(self):
+    def fast_forward(self, stage):
         """
-        Accepts cookies using BasePage method.
+        Restores the checkpoint of a later flow stage instead of navigating through the menus.
+
+        :param stage: Stage name, e.g. 'careers' or 'qa_jobs'
+        :return: True if the browser is now on the stage's page, False if the flow must be navigated
+        :rtype: bool
 
         """
-        super().accept_cookies(self.cookie_button_xpath)
+        return self.restore_checkpoint(stage, origin_of(self.url))
 
     def navigate_to_careers(self):
         """
         Navigates to the Careers page through the Company menu.
 
         """
-        self.click_element(By.XPATH, self.company_menu_xpath)
-        self.click_element(By.XPATH, self.careers_link_xpath)
\ No newline at end of file
+        home_url = self.driver.current_url
+        self.click_element(*self.locators.company_menu)
+        self.click_element(*self.locators.careers_link)
+        self.collect_page_metrics("careers", home_url)
\ No newline at end of file
@@ -0,0 +1,146 @@
+from dataclasses import dataclass
+
+
+# arguments[0]: başlangıç index'i, arguments[1]: en fazla kayıt sayısı
+EXTRACT_JOBS_JS = """
+var start = arguments[0], limit = arguments[1];
+var items = document.querySelectorAll(".position-list-item");
+function text(item, selector) {
+    var el = item.querySelector(selector);
+    return el ? (el.innerText || el.textContent || "").trim() : null;
+}
+var records = [];
+for (var i = start; i < Math.min(items.length, start + limit); i++) {
+    var item = items[i], link = item.querySelector("a[href]");
+    records.push([
+        text(item, ".position-title"),
+        text(item, ".position-department") || item.getAttribute("data-team"),
+        text(item, ".position-location") || item.getAttribute("data-location"),
+        link ? link.href : null
+    ]);
+}
+return {records: records, total: items.length};
+"""
+
+# Listenin sonuna kaydırır, varsa "load more"/sonraki sayfa butonuna tıklar ve
+# kart sayısı artana ya da ilk kart değişene (sayfalama) kadar bekler.
+LOAD_MORE_JS = """
+var done = arguments[arguments.length - 1];
+var known = arguments[0], deadline = performance.now() + arguments[1], buttonSelector = arguments[2];
+function state() {
+    var items = document.querySelectorAll(".position-list-item");
+    var link = items.length ? items[0].querySelector("a[href]") : null;
+    return {count: items.length, first: link ? link.href : null};
+}
+var before = state();
+if (before.count) {
+    document.querySelectorAll(".position-list-item")[before.count - 1].scrollIntoView({block: "end"});
+}
+window.scrollTo(0, document.body.scrollHeight);
+var button = buttonSelector ? document.querySelector(buttonSelector) : null;
+if (button && !button.disabled) { button.click(); }
+(function check() {
+    var now = state();
+    now.replaced = now.first !== before.first;
+    if (now.count > known || now.replaced || performance.now() > deadline) { return done(now); }
+    setTimeout(check, 100);
+})();
+"""
+
+
+@dataclass(frozen=True)
+class JobRecord:
+    """
+    One open position read from a ``.position-list-item`` card.
+
+    """
+
+    # dataclass(slots=True) Python 3.10 ister; alanların varsayılanı olmadığı için __slots__ elle tanımlanır
+    __slots__ = ("title", "department", "location", "link")
+
+    title: str
+    department: str
+    location: str
+    link: str
+
+
+@dataclass(frozen=True)
+class JobFilter:
+    """
+    Case-insensitive predicate over job records; None fields match everything.
+
+    :param department: Text the department must contain
+    :param location: Text the location must contain
+    :param title: Text the title must contain
+
+    """
+
+    department: str = None
+    location: str = None
+    title: str = None
+
+    def matches(self, record):
+        """
+        :param record: Job record
+        :type record: JobRecord
+        :rtype: bool
+
+        """
+        for expected, actual in ((self.department, record.department), (self.location, record.location),
+                                 (self.title, record.title)):
+            if expected is not None and expected.lower() not in (actual or "").lower():
+                return False
+        return True
+
+
+class JobSnapshot:
+    """
+    Job records extracted from one page load, evaluated against any number of filters.
+
+    :param records: Extracted job records
+    :type records: list
+
+    """
+
+    def __init__(self, records):
+        self.records = list(records)
+
+    def __len__(self):
+        return len(self.records)
+
+    def evaluate(self, filters):
+        """
+        Applies every filter to the snapshot.
+
+        :param filters: Mapping of name to :class:`JobFilter`
+        :type filters: dict
+        :return: Mapping of name to the matching records
+        :rtype: dict
+
+        """
+        return {name: [record for record in self.records if job_filter.matches(record)]
+                for name, job_filter in filters.items()}
+
+    def matrix(self, departments, locations):
+        """
+        Counts the records of every department x location combination.
+
+        :param departments: Department names
+        :param locations: Location names
+        :return: ``{(department, location): count}``
+        :rtype: dict
+
+        """
+        filters = {(department, location): JobFilter(department=department, location=location)
+                   for department in departments for location in locations}
+        return {key: len(records) for key, records in self.evaluate(filters).items()}
+
+    def values(self, field):
+        """
+        Returns the distinct values of a record field, e.g. every location on the page.
+
+        :param field: 'title', 'department', 'location' or 'link'
+        :rtype: list
+
+        """
+        return sorted({getattr(record, field) for record in self.records if getattr(record, field)})
@@ -0,0 +1,284 @@
+"""
+Locator registry of the page objects.
+
+Locators are written once in :data:`LOCATOR_SOURCES`, mostly as XPaths. When the registry is
+loaded every XPath that has an equivalent CSS selector is translated, since browsers resolve
+CSS selectors faster; the original XPath is kept on the locator as the fallback the health
+check compares against (see ``benchmarks/LocatorHealth.py``).
+
+"""
+import re
+from dataclasses import dataclass
+from selenium.webdriver.common.by import By
+
+
+# Sayfa adı -> locator adı -> XPath ya da (by, locator); "common" bölümü her sayfada geçerlidir
+LOCATOR_SOURCES = {
+    "common": {
+        "cookie_accept": "//*[@id='wt-cli-accept-all-btn']",
+    },
+    "HomePage": {
+        "company_menu": "(//*[@id='navbarDropdownMenuLink'])[5]",
+        "careers_link": "//*[@id='navbarNavDropdown']/ul[1]/li[6]/div/div[2]/a[2]",
+    },
+    "CareerPage": {
+        "locations": "//*[@id='career-our-location']/div/div/div/div[1]",
+        "teams": "//*[@id='career-find-our-calling']/div/div/a",
+        "life_at_insider": "//h2[contains(text(), 'Life at Insider')]",
+        "see_all_teams": "//a[contains(text(), 'See all teams')]",
+        "qa_careers": "//h3[contains(text(), 'Quality Assurance')]",
+        "qa_open_positions": "//h3[contains(text(), 'Quality Assurance')]"
+                             "/following-sibling::a[contains(text(), 'Open Positions')]",
+    },
+    "QAPage": {
+        "department_container": (By.ID, "select2-filter-by-department-container"),
+        "department_dropdown": "//select[@id='department']",
+        "location_container": (By.ID, "select2-filter-by-location-container"),
+        "location_dropdown": "//select[@id='location']",
+        "location_istanbul": "//li[contains(@class, 'select2-results__option') "
+                             "and normalize-space(text())='Istanbul, Turkiye']",
+        "see_all_qa_jobs": "//a[contains(text(), 'See all QA jobs')]",
+        "view_role_button": "//a[contains(text(), 'View Role')]",
+        "job_item": (By.CSS_SELECTOR, ".position-list-item"),
+        "job_card": "//div[contains(@class, 'position-list-item')]",
+        "job_list": "//div[@id='jobs-list']//div[contains(@class, 'position-list-item')]",
+    },
+}
+# Birden fazla elemanla eşleşmesi beklenen locator'lar; diğerleri tek eleman bulmalı
+MULTIPLE_MATCHES = frozenset({
+    "CareerPage.teams", "QAPage.view_role_button", "QAPage.job_item", "QAPage.job_card", "QAPage.job_list",
+})
+
+_IDENTIFIER = re.compile(r"^-?[A-Za-z_][\w-]*$")
+_NAME = r"[A-Za-z_][\w.-]*"
+_STRING = r"""(?:'([^']*)'|"([^"]*)")"""
+_PREDICATES = [
+    (re.compile(rf"^@({_NAME})\s*=\s*{_STRING}$"), "="),
+    (re.compile(rf"^contains\(\s*@({_NAME})\s*,\s*{_STRING}\s*\)$"), "*="),
+    (re.compile(rf"^starts-with\(\s*@({_NAME})\s*,\s*{_STRING}\s*\)$"), "^="),
+]
+
+
+@dataclass(frozen=True)
+class Locator:
+    """
+    One registered locator.
+
+    Unpacks to ``(by, value)`` so it can be passed straight to the ``BasePage`` helpers,
+    e.g. ``page.click_element(*locator)``.
+
+    :param name: ``Page.name`` of the locator
+    :param by: Selenium By strategy
+    :param value: The locator string, a CSS selector when the XPath could be translated
+    :param xpath: The XPath it was written as, None if it was not an XPath
+    :param bool multiple: Whether it is expected to match more than one element
+
+    """
+
+    name: str
+    by: str
+    value: str
+    xpath: str = None
+    multiple: bool = False
+
+    def __iter__(self):
+        yield self.by
+        yield self.value
+
+    @property
+    def translated(self):
+        return self.xpath is not None and self.by == By.CSS_SELECTOR
+
+    @property
+    def fallback(self):
+        """
+        The original XPath as a ``(by, locator)`` pair when the locator was translated, else None.
+
+        """
+        return (By.XPATH, self.xpath) if self.translated else None
+
+
+def _split_top_level(text, separator):
+    """
+    Splits on a separator outside quotes, brackets and parentheses.
+
+    """
+    parts, depth, quote, start, i = [], 0, None, 0, 0
+    while i < len(text):
+        char = text[i]
+        if quote:
+            quote = None if char == quote else quote
+        elif depth == 0 and text.startswith(separator, i):
+            parts.append(text[start:i])
+            i += len(separator)
+            start = i
+            continue
+        elif char in "'\"":
+            quote = char
+        elif char in "[(":
+            depth += 1
+        elif char in "])":
+            depth -= 1
+        i += 1
+    parts.append(text[start:])
+    return parts
+
+
+def _predicate_to_css(predicate, tag, first=True):
+    predicate = predicate.strip()
+    if predicate.isdigit():
+        # Pozisyon sadece ilk predicate'te kardeşler arası sıradır, sonrakilerde filtrelenmiş sonuç içindedir
+        return f":nth-of-type({predicate})" if tag != "*" and first else None
+    conditions = _split_top_level(predicate, " and ")
+    if len(conditions) > 1:
+        parts = [_predicate_to_css(condition, tag, first=False) for condition in conditions]
+        return None if None in parts else "".join(parts)
+    if re.fullmatch(rf"@{_NAME}", predicate):
+        return f"[{predicate[1:]}]"
+    for pattern, operator in _PREDICATES:
+        match = pattern.match(predicate)
+        if not match:
+            continue
+        attribute, value = match.group(1), match.group(2) if match.group(2) is not None else match.group(3)
+        if attribute == "id" and operator == "=" and _IDENTIFIER.match(value):
+            return f"#{value}"
+        if attribute == "class" and operator == "=":
+            return None
+        quoted = value.replace("\\", "\\\\").replace("'", "\\'")
+        return f"[{attribute}{operator}'{quoted}']"
+    return None
+
+
+def _step_to_css(step):
+    match = re.fullmatch(rf"(\*|{_NAME})((?:\[.*\])?)", step, re.DOTALL)
+    if not match or ":" in match.group(1):
+        return None
+    tag, predicates = match.groups()
+    css = "" if tag == "*" else tag
+    rest = predicates
+    while rest:
+        closing = _split_top_level(rest[1:], "]")
+        if not rest.startswith("[") or len(closing) < 2:
+            return None
+        predicate = closing[0]
+        part = _predicate_to_css(predicate, tag, first=rest is predicates)
+        if part is None:
+            return None
+        css += part
+        rest = rest[len(predicate) + 2:]
+    return css or "*"
+
+
+def xpath_to_css(xpath):
+    """
+    Translates an XPath to an equivalent CSS selector, or returns None if there is none.
+
+    Handles descendant (``//``) and child (``/``) steps below the document, tag names, ``*``,
+    attribute presence, ``@attr='value'``, ``contains(@attr, ...)``, ``starts-with(@attr, ...)``,
+    ``and`` and positions on named tags (``:nth-of-type``). Text matching, axes, unions,
+    ``@class='...'`` (a token list in CSS) and positions over a whole result set such as
+    ``(//a)[5]`` stay XPath.
+
+    :param xpath: XPath expression
+    :rtype: str
+
+    """
+    xpath = xpath.strip()
+    if not xpath.startswith("//"):
+        return None
+    steps = []
+    combinator = " "
+    for index, part in enumerate(_split_top_level(xpath[2:], "/")):
+        if part == "":
+            if index == 0 or combinator == " ":
+                return None
+            combinator = " "
+            continue
+        css = _step_to_css(part)
+        if css is None:
+            return None
+        steps.append(css if index == 0 else f"{combinator}{css}")
+        combinator = " > "
+    return "".join(steps) if steps else None
+
+
+def build_locator(page, name, source):
+    """
+    Builds the registry entry of one locator source, translating XPaths where possible.
+
+    :param page: Page section the locator belongs to
+    :param name: Locator name
+    :param source: XPath string or ``(by, locator)`` pair
+    :rtype: Locator
+
+    """
+    full_name = f"{page}.{name}"
+    multiple = full_name in MULTIPLE_MATCHES
+    if not isinstance(source, str):
+        by, value = source
+        return Locator(full_name, by, value, None, multiple)
+    css = xpath_to_css(source)
+    if css is None:
+        return Locator(full_name, By.XPATH, source, source, multiple)
+    return Locator(full_name, By.CSS_SELECTOR, css, source, multiple)
+
+
+class PageLocators:
+    """
+    Locators of one page, read as attributes, e.g. ``locators.view_role_button``.
+
+    Names that the page does not define are looked up in the "common" section.
+
+    """
+
+    def __init__(self, page, entries, common=None):
+        self.page = page
+        self._entries = dict(common or {})
+        self._entries.update(entries)
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__["_entries"][name]
+        except KeyError:
+            raise AttributeError(f"{self.__dict__.get('page')} has no locator named {name!r}") from None
+
+    def __iter__(self):
+        return iter(self._entries.values())
+
+
+class LocatorRegistry:
+    """
+    Every locator of the page objects, built once from the source mapping.
+
+    :param sources: Mapping in the format of :data:`LOCATOR_SOURCES`
+    :type sources: dict
+
+    """
+
+    def __init__(self, sources=LOCATOR_SOURCES):
+        self._pages = {
+            page: {name: build_locator(page, name, source) for name, source in entries.items()}
+            for page, entries in sources.items()
+        }
+
+    def page(self, page):
+        """
+        Returns the locators of a page, including the common ones.
+
+        :param page: Page object class name
+        :rtype: PageLocators
+
+        """
+        return PageLocators(page, self._pages.get(page, {}), self._pages.get("common"))
+
+    def all(self):
+        """
+        Returns every registered locator, each one once.
+
+        :rtype: list
+
+        """
+        return [locator for entries in self._pages.values() for locator in entries.values()]
+
+
+locators = LocatorRegistry()
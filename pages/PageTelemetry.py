@@ -0,0 +1,239 @@
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from selenium.common.exceptions import WebDriverException
+
+
+# PAGE_TELEMETRY=0 toplamayı kapatır; PERF_BUDGET_MODE=enforce bütçe aşımında koşuyu başarısız sayar
+PAGE_TELEMETRY_ENABLED = os.environ.get("PAGE_TELEMETRY", "1") == "1"
+PERF_BUDGET_MODE = os.environ.get("PERF_BUDGET_MODE", "warn")
+# Varsayılan bütçeleri sayfa bazında ezen JSON dosyası: {"home": {"lcp": 3000}, ...}
+PERF_BUDGETS_PATH = os.environ.get("PERF_BUDGETS_PATH", "perf-budgets.json")
+
+# Sayfa adı -> metrik -> üst sınır (süreler ms, boyutlar byte)
+DEFAULT_BUDGETS = {
+    "home": {"ttfb": 1500, "load_event": 8000, "lcp": 4000, "transfer_size": 6_000_000, "resource_count": 250},
+    "careers": {"ttfb": 1500, "load_event": 8000, "lcp": 4000, "transfer_size": 6_000_000, "resource_count": 250},
+    "qa_jobs": {"ttfb": 1500, "load_event": 8000, "lcp": 4000, "transfer_size": 6_000_000, "resource_count": 250},
+    "lever_job": {"ttfb": 2000, "load_event": 6000, "lcp": 4000},
+}
+
+# Navigation Timing, Resource Timing, paint ve LCP tek script çağrısında okunur.
+# LCP girdileri buffered observer'dan takeRecords ile senkron alınır; desteklemeyen tarayıcıda null kalır.
+PAGE_METRICS_JS = """
+function ms(value) { return value > 0 ? value : null; }
+var nav = performance.getEntriesByType("navigation")[0];
+var resources = performance.getEntriesByType("resource");
+var paints = {};
+performance.getEntriesByType("paint").forEach(function (entry) { paints[entry.name] = entry.startTime; });
+var lcp = null;
+try {
+    var observer = new PerformanceObserver(function () {});
+    observer.observe({type: "largest-contentful-paint", buffered: true});
+    var entries = observer.takeRecords();
+    observer.disconnect();
+    if (entries.length) { lcp = entries[entries.length - 1].startTime; }
+} catch (e) {}
+var transfer = 0, slowest = null;
+resources.forEach(function (entry) {
+    transfer += entry.transferSize || 0;
+    if (!slowest || entry.duration > slowest.duration) { slowest = entry; }
+});
+return {
+    url: location.href,
+    ttfb: nav ? ms(nav.responseStart) : null,
+    dom_content_loaded: nav ? ms(nav.domContentLoadedEventEnd) : null,
+    load_event: nav ? ms(nav.loadEventEnd) : null,
+    document_size: nav ? (nav.transferSize || null) : null,
+    first_paint: paints["first-paint"] || null,
+    first_contentful_paint: paints["first-contentful-paint"] || null,
+    lcp: lcp,
+    resource_count: resources.length,
+    transfer_size: transfer + (nav ? nav.transferSize || 0 : 0),
+    slowest_resource: slowest ? slowest.duration : null,
+    slowest_resource_url: slowest ? slowest.name : null,
+    js_heap_used: performance.memory ? performance.memory.usedJSHeapSize : null
+};
+"""
+
+
+@dataclass
+class PageMetrics:
+    """
+    Metrics of one page load collected after a navigation.
+
+    ``values`` holds the numeric metrics, None when the browser does not report one; the
+    browser process memory and CPU seconds since the previous collection are included on Linux.
+
+    """
+
+    page: str
+    url: str
+    time_ns: int
+    values: dict
+    violations: list = field(default_factory=list)
+
+
+def load_budgets(path=PERF_BUDGETS_PATH, defaults=DEFAULT_BUDGETS):
+    """
+    Returns the per-page budgets, the defaults overridden metric by metric from a JSON file.
+
+    :param path: Budget override file, ignored if it does not exist
+    :param defaults: Default budgets
+    :rtype: dict
+
+    """
+    budgets = {page: dict(limits) for page, limits in defaults.items()}
+    if path and os.path.exists(path):
+        with open(path, encoding="utf-8") as budget_file:
+            for page, limits in json.load(budget_file).items():
+                budgets.setdefault(page, {}).update(limits)
+    return budgets
+
+
+def check_budget(values, limits):
+    """
+    Lists the metrics that exceed their limit.
+
+    :param values: Collected metric values
+    :param limits: Metric limits of the page
+    :return: Descriptions like ``'lcp 5200 > 4000'``
+    :rtype: list
+
+    """
+    return [
+        f"{metric} {values[metric]:.0f} > {limit}"
+        for metric, limit in limits.items()
+        if values.get(metric) is not None and values[metric] > limit
+    ]
+
+
+def _child_pids():
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", encoding="utf-8") as stat_file:
+                parent = int(stat_file.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(parent, []).append(int(entry))
+    return children
+
+
+def browser_process_usage(driver):
+    """
+    Sums the resident memory and CPU time of the browser processes below the driver service.
+
+    Read from ``/proc``, so it costs no WebDriver command; returns None where that is not
+    available, e.g. on remote or non-Linux drivers.
+
+    :param driver: Selenium WebDriver instance
+    :return: Dict with 'rss_bytes' and 'cpu_seconds', or None
+    :rtype: dict
+
+    """
+    process = getattr(getattr(driver, "service", None), "process", None)
+    if process is None or not os.path.isdir("/proc"):
+        return None
+    children = _child_pids()
+    pending, pids = list(children.get(process.pid, [])), []
+    while pending:
+        pid = pending.pop()
+        pids.append(pid)
+        pending.extend(children.get(pid, []))
+    page_size, ticks = os.sysconf("SC_PAGE_SIZE"), os.sysconf("SC_CLK_TCK")
+    rss = cpu = 0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/statm", encoding="utf-8") as statm_file:
+                rss += int(statm_file.read().split()[1]) * page_size
+            with open(f"/proc/{pid}/stat", encoding="utf-8") as stat_file:
+                fields = stat_file.read().rsplit(")", 1)[1].split()
+            cpu += (int(fields[11]) + int(fields[12])) / ticks
+        except (OSError, IndexError, ValueError):
+            continue
+    return {"rss_bytes": rss, "cpu_seconds": cpu}
+
+
+class PageTelemetry:
+    """
+    Collects page-load metrics after the page objects' navigations and checks them against budgets.
+
+    :param budgets: Per-page budgets, see :func:`load_budgets`
+    :param bool enabled: Collect at all
+
+    """
+
+    def __init__(self, budgets=None, enabled=PAGE_TELEMETRY_ENABLED):
+        self.budgets = load_budgets() if budgets is None else budgets
+        self.enabled = enabled
+        self.records = []
+        self.violations = []
+        self._cpu_seconds = {}
+        self._lock = threading.Lock()
+
+    def start_test(self):
+        """
+        Drops the records of the previous test; budget violations are kept for the whole run.
+
+        """
+        self.records = []
+
+    def finish_test(self):
+        """
+        Returns the records collected since :meth:`start_test`.
+
+        :rtype: list
+
+        """
+        records, self.records = self.records, []
+        return records
+
+    def collect(self, driver, page):
+        """
+        Reads the metrics of the current page with one script call and checks the page budget.
+
+        :param driver: Selenium WebDriver instance
+        :param page: Page name the budgets are keyed by, e.g. 'careers'
+        :return: The metrics, or None if collection is disabled or failed
+        :rtype: PageMetrics
+
+        """
+        if not self.enabled:
+            return None
+        try:
+            raw = driver.execute_script(PAGE_METRICS_JS)
+        except WebDriverException:
+            return None
+        url = raw.pop("url")
+        values = {name: value for name, value in raw.items() if value is not None}
+        usage = browser_process_usage(driver)
+        if usage:
+            previous = self._cpu_seconds.get(id(driver), usage["cpu_seconds"])
+            values["browser_rss"] = usage["rss_bytes"]
+            values["browser_cpu"] = usage["cpu_seconds"] - previous
+            self._cpu_seconds[id(driver)] = usage["cpu_seconds"]
+
+        metrics = PageMetrics(page, url, time.time_ns(), values)
+        metrics.violations = check_budget(values, self.budgets.get(page, {}))
+        with self._lock:
+            self.records.append(metrics)
+            self.violations.extend(f"{page}: {violation} ({url})" for violation in metrics.violations)
+        return metrics
+
+    def budget_failed(self, mode=PERF_BUDGET_MODE):
+        """
+        Whether the run must fail because of budget violations.
+
+        :param mode: 'enforce' fails on any violation, other modes only report them
+        :rtype: bool
+
+        """
+        return mode == "enforce" and bool(self.violations)
+
+
+telemetry = PageTelemetry()
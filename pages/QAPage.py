@@ -1,10 +1,26 @@
+import collections
 import time
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, JavascriptException
+from .EventLog import events
+from .JobListings import EXTRACT_JOBS_JS, LOAD_MORE_JS, JobRecord, JobSnapshot
+from .StepRecorder import recorder
 from .BasePage import BasePage
 
 
+# Yeni sekmede beklemeden navigasyon başlatır; driver.get sayfa yüklenene kadar bloklardı
+NAVIGATE_JS = "window.location.href = arguments[0];"
+TAB_STATE_JS = """
+var navigation = performance.getEntriesByType("navigation")[0];
+return {
+    url: location.href,
+    ready_state: document.readyState,
+    title: document.title,
+    status: navigation && navigation.responseStatus ? navigation.responseStatus : null
+};
+"""
+
+
 class QAPage(BasePage):
     def __init__(self, driver):
         """
@@ -14,15 +30,6 @@ class QAPage(BasePage):
 
         """
         super().__init__(driver)
-        self.department_container_id = "select2-filter-by-department-container"
-        self.department_dropdown_xpath = "//select[@id='department']"
-        self.view_role_button_xpath = "//a[contains(text(), 'View Role')]"
-        self.see_all_qa_jobs_xpath = "//a[contains(text(), 'See all QA jobs')]"
-        self.job_card_xpath = "//div[contains(@class, 'position-list-item')]"
-        self.job_list_xpath = "//div[@id='jobs-list']//div[contains(@class, 'position-list-item')]"
-        self.location_container_id = "select2-filter-by-location-container"
-        self.location_istanbul_xpath = "//li[contains(@class, 'select2-results__option') and normalize-space(text())='Istanbul, Turkiye']"
-        self.location_dropdown_xpath = "//select[@id='location']"
 
     def is_accessible(self):
         """
@@ -33,14 +40,13 @@ class QAPage(BasePage):
 
         """
         try:
-            print("🔍 QA page title checked")
             self.wait_for_page_to_load()
-            self.wait_for_element(By.XPATH, self.view_role_button_xpath)
-            current_url = self.driver.current_url
-            print("🌐 QA Page URL:", current_url)
+            self.wait_for_element(*self.locators.view_role_button)
+            current_url = self.get_page_state()["url"]
+            events.info("QA page opened", url=current_url)
             return "quality-assurance" in current_url or "QA" in current_url
         except Exception as e:
-            print(f"❌ QA page not found: {e}")
+            events.error("QA page not found", error=e)
             return False
 
     def filter_jobs(self, location, department):
@@ -51,11 +57,11 @@ class QAPage(BasePage):
         :param department: Department to filter (e.g., 'Quality Assurance')
 
         """
-        location_dropdown = self.wait_for_element_to_be_clickable(By.XPATH, self.location_dropdown_xpath)
+        location_dropdown = self.wait_for_element_to_be_clickable(*self.locators.location_dropdown)
         if location_dropdown:
             location_dropdown.send_keys(location)
 
-        department_dropdown = self.wait_for_element_to_be_clickable(By.XPATH, self.department_dropdown_xpath)
+        department_dropdown = self.wait_for_element_to_be_clickable(*self.locators.department_dropdown)
         if department_dropdown:
             department_dropdown.send_keys(department)
 
@@ -65,28 +71,24 @@ class QAPage(BasePage):
         Retries up to 3 times if department is not loaded properly.
 
         """
-        print("⏳ Waiting for department filtering as 'Quality Assurance'")
-
         for attempt in range(3):
-            self.scroll_to_element(By.ID, self.department_container_id)
-            success = self.wait_for_element_text_to_be(By.ID, self.department_container_id, "Quality Assurance",
+            self.scroll_to_element(*self.locators.department_container)
+            success = self.wait_for_element_text_to_be(*self.locators.department_container, "Quality Assurance",
                                                        timeout=10)
 
             if success:
-                print("✅ Department success")
+                events.debug("Department filtered", department="Quality Assurance")
                 self.wait_for_job_cards_to_be_replaced()
-                self.click_element(By.ID, self.location_container_id)
-                print("⏳ 'Istanbul, Turkiye' selection checked")
-                self.click_element(By.XPATH, self.location_istanbul_xpath)
-                print("✅ 'Istanbul, Turkiye' selection clicked")
-                print("⏳ Job-listing page checked")
-                self.wait_for_element(By.XPATH, self.job_card_xpath)
+                self.click_element(*self.locators.location_container)
+                self.click_element(*self.locators.location_istanbul)
+                events.info("Location selected", location="Istanbul, Turkiye")
+                self.wait_for_element(*self.locators.job_card)
                 return
             else:
-                print(f"⚠️ 'Quality Assurance' could not found on {attempt + 1}. attempt ")
-                time.sleep(2)
+                events.warning("Department filter not applied yet", attempt=attempt + 1)
+                self.wait_for_network_idle()
 
-        print("❌ Error: Department value could not selected as 'Quality Assurance'.")
+        events.error("Department could not be filtered", department="Quality Assurance")
 
     def wait_for_job_cards_to_load(self, timeout=15):
         """
@@ -95,11 +97,9 @@ class QAPage(BasePage):
         :param timeout: Maximum wait time in seconds
 
         """
-        print("⏳ Job carts loading")
-        WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located((By.XPATH, self.job_list_xpath))
-        )
-        print("✅ Job carts completed.")
+        job_list = self.locators.job_list
+        self._locator_wait(*job_list, timeout, EC.presence_of_element_located(tuple(job_list)))
+        events.debug("Job cards loaded")
 
     def wait_for_job_cards_to_be_replaced(self):
         """
@@ -108,14 +108,13 @@ class QAPage(BasePage):
         """
 
         try:
-            print("⏳ Old job carts disappearing.")
-            self.wait.until(EC.invisibility_of_element_located((By.XPATH, self.job_card_xpath)))
-            print("✅ Old job carts disappeared.")
+            self.wait.until(EC.invisibility_of_element_located(tuple(self.locators.job_card)))
+            events.debug("Old job cards disappeared")
         except:
-            print("⚠️ Old job carts could be still visible, continue to process.")
+            events.warning("Old job cards may still be visible, continuing")
 
-        self.wait.until(lambda d: len(d.find_elements(By.XPATH, self.job_card_xpath)) > 0)
-        print("✅ New job carts loaded to the DOM.")
+        self.wait.until(lambda d: len(d.find_elements(*self.locators.job_card)) > 0)
+        events.debug("New job cards loaded")
 
     def verify_job_listings(self):
         """
@@ -125,25 +124,101 @@ class QAPage(BasePage):
         :rtype: bool
 
         """
-        print("🧪 On the QA page + searching for Istanbul job.")
-
-        job_texts = self.driver.execute_script("""
-            return Array.from(document.querySelectorAll(".position-list-item")).map(el => el.innerText);
-        """)
+        jobs = self.query_elements({"jobs": self.locators.job_item}, fields=("text", "visible"))
 
         valid_jobs = 0
-        for i, text in enumerate(job_texts, 1):
-            print(f"📋 JS Job {i}:\n{text}\n")
-            lower_text = text.lower()
+        for i, job in enumerate(jobs["jobs"], 1):
+            lower_text = job.text.lower()
             if "quality assurance" in lower_text and "istanbul" in lower_text:
-                print(f"✅ Job {i} FOUND: QA + Istanbul")
+                events.debug("Job matches QA + Istanbul", job=i)
                 valid_jobs += 1
             else:
-                print(f"⚠️ Job {i} Not Found")
+                events.warning("Job does not match QA + Istanbul", job=i, text=job.text)
 
-        print(f"🎯 Job offers: {valid_jobs}")
+        events.info("Job listings verified", valid_jobs=valid_jobs, total_jobs=len(jobs["jobs"]))
         return valid_jobs > 0
 
+    def iter_job_records(self, batch_size=25, lazy=False, load_more_selector=None, max_loads=20, load_timeout=3):
+        """
+        Streams the job cards of the page as :class:`JobRecord` objects, one script call per batch.
+
+        With ``lazy`` or a ``load_more_selector`` the generator scrolls to the end of the list,
+        clicks the load-more/next button if there is one and keeps going while new cards appear.
+        Paginated lists that replace the cards are read from the top again; records already
+        yielded are skipped by link.
+
+        :param int batch_size: Cards read per script call
+        :param bool lazy: Trigger lazy loading by scrolling once the known cards are read
+        :param load_more_selector: CSS selector of a load-more or next-page button
+        :param int max_loads: Maximum lazy-load or pagination rounds
+        :param float load_timeout: Seconds to wait for new cards after each round
+        :return: Job records in page order
+        :rtype: generator
+
+        """
+        seen = set()
+        offset = 0
+        loads = 0
+        while True:
+            batch = self.driver.execute_script(EXTRACT_JOBS_JS, offset, batch_size)
+            for title, department, location, link in batch["records"]:
+                offset += 1
+                key = link or (title, department, location)
+                if key in seen:
+                    continue
+                seen.add(key)
+                yield JobRecord(title, department, location, link)
+            if offset < batch["total"]:
+                continue
+            if not (lazy or load_more_selector) or loads >= max_loads:
+                return
+
+            loads += 1
+            started = time.perf_counter()
+            try:
+                state = self.driver.execute_async_script(
+                    LOAD_MORE_JS, offset, int(load_timeout * 1000), load_more_selector
+                )
+            except (TimeoutException, JavascriptException):
+                return
+            finally:
+                recorder.add_wait_time(time.perf_counter() - started)
+            if state["replaced"]:
+                offset = 0
+            elif state["count"] <= offset:
+                return
+
+    def job_snapshot(self, **options):
+        """
+        Extracts every job card once so many filters can be checked without reloading the list.
+
+        :param options: Keyword arguments of :meth:`iter_job_records`
+        :rtype: JobSnapshot
+
+        """
+        snapshot = JobSnapshot(self.iter_job_records(**options))
+        events.info("Job listings extracted", jobs=len(snapshot))
+        return snapshot
+
+    def verify_job_filters(self, filters, snapshot=None):
+        """
+        Checks that every filter matches at least one job, using a single extracted snapshot.
+
+        :param filters: Mapping of name to ``JobListings.JobFilter``
+        :type filters: dict
+        :param snapshot: Snapshot to reuse, extracted from the current page if omitted
+        :type snapshot: JobSnapshot
+        :return: Mapping of name to True if the filter matched a job
+        :rtype: dict
+
+        """
+        snapshot = snapshot or self.job_snapshot()
+        results = {name: bool(records) for name, records in snapshot.evaluate(filters).items()}
+        missing = [name for name, found in results.items() if not found]
+        if missing:
+            events.warning("Job filters without matches", filters=missing)
+        return results
+
     def verify_view_role_redirects(self):
         """
         Clicks the first 'View Role' button and verifies it redirects to lever.co job detail page.
@@ -152,47 +227,129 @@ class QAPage(BasePage):
         :rtype: bool
 
         """
-        print("🔍 View Role button checked.")
         try:
-            self.wait_for_element(By.XPATH, self.job_card_xpath, timeout=15)
-            print("✅ Positions checked.")
+            self.wait_for_element(*self.locators.job_card, timeout=15)
 
             for attempt in range(3):
                 try:
-                    view_role_buttons = self.driver.find_elements(By.XPATH, self.view_role_button_xpath)
+                    view_role_buttons = self.driver.find_elements(*self.locators.view_role_button)
                     if view_role_buttons:
                         view_role_button = view_role_buttons[0]
                         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", view_role_button)
-                        time.sleep(1)
+                        self.wait_for_element_to_be_stable(*self.locators.view_role_button)
 
                         try:
                             view_role_button.click()
-                            print("✅ Click success.")
+                            events.debug("View Role clicked")
                         except Exception as e:
-                            print(f"⚠️ Click failed: {e}, JS fallback on.")
+                            events.warning("View Role click failed, clicking with JavaScript", error=e)
                             self.driver.execute_script("arguments[0].click();", view_role_button)
 
                         break
                     else:
-                        print("❌ View Role button not found.")
+                        events.error("View Role button not found", locator=self.locators.view_role_button.value)
                         return False
 
                 except Exception as e:
-                    print(f"⚠️ {attempt + 1}. attempt failed: {e}")
-                    time.sleep(2)
+                    events.warning("View Role attempt failed", attempt=attempt + 1, error=e)
+                    self.wait_for_dom_to_settle()
 
             windows = self.driver.window_handles
             if len(windows) > 1:
                 self.driver.switch_to.window(windows[1])
-                print("🔄 New tab opened:", self.driver.current_url)
+                events.info("View Role tab opened", url=self.driver.current_url)
 
             self.wait_for_page_to_load()
+            self.collect_page_metrics("lever_job")
             return "lever.co" in self.driver.current_url
 
         except Exception as e:
-            print(f"❌ View Role error: {e}")
+            events.error("View Role check failed", error=e)
             return False
 
+    def verify_all_view_role_links(self, max_tabs=4, timeout=20, expected_host="lever.co", links=None):
+        """
+        Opens every "View Role" link in parallel tabs and checks where each one ends up.
+
+        Up to ``max_tabs`` tabs load at the same time; finished tabs are closed and replaced by
+        the next link, so checking every posting takes about as long as the slowest pages.
+        Tabs only load in parallel in sessions with the 'none' page load strategy: otherwise the
+        driver waits for each tab's navigation before the next command, so the links are checked
+        concurrently over HTTP with :class:`HttpJobValidator.JobApiClient` instead.
+
+        :param int max_tabs: Tabs loading (or requests running) at the same time
+        :param float timeout: Seconds a tab may take to finish loading
+        :param expected_host: Text the final URL must contain
+        :param links: Links to check, defaults to every job card on the page
+        :return: Dicts with 'link', 'final_url', 'status', 'title', 'seconds' and 'ok', in finish
+            order; 'seconds' is None for links checked over HTTP
+        :rtype: list
+
+        """
+        if links is None:
+            links = [record.link for record in self.job_snapshot().records if record.link]
+        if self.driver.capabilities.get("pageLoadStrategy", "normal") == "none":
+            results = self._check_links_in_tabs(links, max_tabs, timeout, expected_host)
+        else:
+            results = self._check_links_over_http(links, max_tabs, timeout, expected_host)
+
+        failed = [result["link"] for result in results if not result["ok"]]
+        if failed:
+            events.error("View Role links did not open a job page", links=failed)
+        events.info("View Role links checked", links=len(results), failed=len(failed))
+        return results
+
+    def _check_links_in_tabs(self, links, max_tabs, timeout, expected_host):
+        pending = collections.deque(links)
+        original = self.driver.current_window_handle
+        loading = {}
+        results = []
+        try:
+            while pending or loading:
+                while pending and len(loading) < max_tabs:
+                    link = pending.popleft()
+                    self.driver.switch_to.new_window("tab")
+                    self.driver.execute_script(NAVIGATE_JS, link)
+                    loading[self.driver.current_window_handle] = (link, time.perf_counter())
+
+                finished = 0
+                for handle, (link, started) in list(loading.items()):
+                    self.driver.switch_to.window(handle)
+                    state = self.driver.execute_script(TAB_STATE_JS)
+                    elapsed = time.perf_counter() - started
+                    loaded = state["ready_state"] == "complete" and state["url"] != "about:blank"
+                    if not loaded and elapsed < timeout:
+                        continue
+                    ok = loaded and expected_host in state["url"] and (state["status"] or 200) < 400
+                    results.append({"link": link, "final_url": state["url"], "status": state["status"],
+                                    "title": state["title"], "seconds": elapsed, "ok": ok})
+                    self.driver.close()
+                    # Kapanan sekme geçerli bağlam olarak kalır; yeni sekme oradan açılamaz
+                    self.driver.switch_to.window(original)
+                    del loading[handle]
+                    finished += 1
+                if loading and not finished:
+                    time.sleep(0.1)
+                    recorder.add_wait_time(0.1)
+        finally:
+            for handle in loading:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            self.driver.switch_to.window(original)
+        return results
+
+    def _check_links_over_http(self, links, workers, timeout, expected_host):
+        from HttpJobValidator import JobApiClient
+
+        events.info("Page load strategy is not 'none', checking View Role links over HTTP")
+        client = JobApiClient(job_host=expected_host, pool_size=workers, timeout=timeout)
+        try:
+            pages = client.check_job_pages([JobRecord("", "", "", link) for link in links])
+        finally:
+            client.close()
+        return [{"link": page["link"], "final_url": page["final_url"], "status": page["status"],
+                 "title": page["page_title"], "seconds": None, "ok": page["ok"]} for page in pages]
+
     def click_see_all_qa_jobs(self):
         """
         Clicks on the 'See all QA jobs' button.
@@ -200,11 +357,10 @@ class QAPage(BasePage):
         :return: None
 
         """
-        print("🔍 'See all QA jobs' button checked...")
-        button = self.wait_for_element_to_be_clickable(By.XPATH, self.see_all_qa_jobs_xpath)
+        button = self.wait_for_element_to_be_clickable(*self.locators.see_all_qa_jobs)
         if button:
-            self.scroll_to_element(By.XPATH, self.see_all_qa_jobs_xpath)
+            self.scroll_to_element(*self.locators.see_all_qa_jobs)
             button.click()
-            print("✅ 'See all QA jobs' clicked.")
+            events.info("'See all QA jobs' clicked")
         else:
-            print("❌ HATA: 'See all QA jobs' could not found.")
\ No newline at end of file
+            events.error("'See all QA jobs' button not found", locator=self.locators.see_all_qa_jobs.value)
\ No newline at end of file
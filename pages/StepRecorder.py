@@ -0,0 +1,245 @@
+import collections
+import functools
+import inspect
+import os
+import threading
+import time
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.wait import WebDriverWait
+
+
+BY_STRATEGIES = frozenset(value for name, value in vars(By).items() if name.isupper())
+# Hata durumunda döküm için saklanan son adım sayısı
+TRACE_SIZE = int(os.environ.get("FAILURE_TRACE_SIZE", "50"))
+
+
+class Span:
+    """
+    Timing of one page-object method call.
+
+    ``wait_time`` is the time spent polling in WebDriverWait or in the async wait scripts,
+    including the waits of nested steps. ``url`` is the last page URL seen while the step ran
+    (see :meth:`StepRecorder.note_url`), ``error`` the name of the exception the call raised and
+    ``timed_out`` whether one of its own waits ran into its timeout. ``cached`` marks waits on an
+    element taken from the page's element cache, which say nothing about how long the locator
+    takes to resolve.
+
+    """
+
+    __slots__ = ("step", "locator", "started_ns", "wall_time", "wait_time", "depth", "url", "error", "timed_out",
+                 "cached")
+
+    def __init__(self, step, locator, started_ns, depth, url=None):
+        self.step = step
+        self.locator = locator
+        self.started_ns = started_ns
+        self.wall_time = 0.0
+        self.wait_time = 0.0
+        self.depth = depth
+        self.url = url
+        self.error = None
+        self.timed_out = False
+        self.cached = False
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class StepRecorder:
+    """
+    Collects spans for the page-object methods of the running test.
+
+    The last ``trace_size`` finished spans are also kept in :attr:`trace`, a ring buffer that is
+    dumped when a test fails.
+
+    :param int trace_size: Ring buffer length
+
+    """
+
+    def __init__(self, trace_size=TRACE_SIZE):
+        self._local = threading.local()
+        self.spans = []
+        self.trace = collections.deque(maxlen=trace_size)
+
+    def start_test(self):
+        """
+        Drops the spans and the trace of the previous test.
+
+        """
+        self.spans = []
+        self.trace.clear()
+        self._local.stack = []
+        self._local.url = None
+        self._local.failure = None
+
+    def finish_test(self):
+        """
+        Returns the spans recorded since :meth:`start_test`, in start order.
+
+        :rtype: list
+
+        """
+        spans, self.spans = self.spans, []
+        return sorted(spans, key=lambda span: span.started_ns)
+
+    def add_wait_time(self, seconds):
+        """
+        Adds polling time to the innermost running span.
+
+        :param float seconds: Time spent waiting
+
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack:
+            stack[-1].wait_time += seconds
+
+    def mark_timed_out(self):
+        """
+        Marks the innermost running span as having hit a wait timeout.
+
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack:
+            stack[-1].timed_out = True
+
+    def mark_cached(self):
+        """
+        Marks the innermost running span as a wait on a cached element.
+
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack:
+            stack[-1].cached = True
+
+    def note_url(self, url):
+        """
+        Records the URL of the current page on every running span; later steps start with it.
+
+        Called by the page-state reads, which fetch the URL anyway, and when a step fails.
+
+        :param url: Current page URL
+
+        """
+        self._local.url = url
+        for span in getattr(self._local, "stack", None) or ():
+            span.url = url
+
+    def note_failure(self, span, error, driver):
+        """
+        Records the error of a failed span and reads the URL of the page it failed on.
+
+        The URL is read once per exception, the outer spans it propagates through reuse it.
+
+        :param span: Span of the failed call
+        :param error: Raised exception
+        :param driver: Selenium WebDriver instance of the page object, if any
+
+        """
+        span.error = type(error).__name__
+        if getattr(self._local, "failure", None) is error:
+            return
+        self._local.failure = error
+        try:
+            self.note_url(driver.current_url)
+        except (AttributeError, WebDriverException):
+            # Driver'sız sayfa ya da kopmuş oturum; son bilinen URL kalır
+            pass
+
+    def current_step(self):
+        """
+        Returns the name of the innermost running step, or None outside page-object methods.
+
+        :rtype: str
+
+        """
+        stack = getattr(self._local, "stack", None)
+        return stack[-1].step if stack else None
+
+    def _enter(self, step, locator):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        span = Span(step, locator, time.time_ns(), len(stack), getattr(self._local, "url", None))
+        stack.append(span)
+        return span, time.perf_counter()
+
+    def _exit(self, span, started):
+        span.wall_time = time.perf_counter() - started
+        stack = self._local.stack
+        stack.pop()
+        if stack:
+            stack[-1].wait_time += span.wait_time
+        self.spans.append(span)
+        self.trace.append(span)
+
+
+recorder = StepRecorder()
+
+
+class TimedWebDriverWait(WebDriverWait):
+    """
+    WebDriverWait that reports its polling time to the running span.
+
+    """
+
+    def until(self, method, message=""):
+        started = time.perf_counter()
+        try:
+            return super().until(method, message)
+        except TimeoutException:
+            recorder.mark_timed_out()
+            raise
+        finally:
+            recorder.add_wait_time(time.perf_counter() - started)
+
+    def until_not(self, method, message=""):
+        started = time.perf_counter()
+        try:
+            return super().until_not(method, message)
+        finally:
+            recorder.add_wait_time(time.perf_counter() - started)
+
+
+def recorded_step(func):
+    """
+    Wraps a page-object method so every call is recorded as a span.
+
+    The locator is taken from a leading ``(by, locator)`` argument pair, if any.
+
+    """
+    step = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        locator = args[1] if len(args) > 1 and isinstance(args[0], str) and args[0] in BY_STRATEGIES else None
+        span, started = recorder._enter(step, locator)
+        try:
+            return func(self, *args, **kwargs)
+        except BaseException as e:
+            recorder.note_failure(span, e, getattr(self, "driver", None))
+            raise
+        finally:
+            recorder._exit(span, started)
+
+    wrapper.__recorded_step__ = True
+    return wrapper
+
+
+def instrument_class(cls):
+    """
+    Wraps every public method defined directly on the class with :func:`recorded_step`.
+
+    Generator methods are left alone, their work happens while the caller iterates.
+
+    :param cls: Page object class
+    :return: The same class
+
+    """
+    for name, value in list(vars(cls).items()):
+        if name.startswith("_") or not callable(value) or isinstance(value, (staticmethod, classmethod, type)):
+            continue
+        if getattr(value, "__recorded_step__", False) or inspect.isgeneratorfunction(value):
+            continue
+        setattr(cls, name, recorded_step(value))
+    return cls
@@ -1,7 +1,35 @@
 import pytest
-import os
 from datetime import datetime
-from DBController import insert_test_result_to_influxdb
+from DBController import insert_test_result_to_influxdb, close_result_writer
+from FailureTrace import get_trace_writer, close_trace_writer
+from HistoryOrdering import HISTORY_ORDER_ENABLED, FLAKY_RERUNS, load_history, order_items, flaky_tests
+from pages.AdaptiveTimeouts import timeout_model
+from pages.EventLog import events
+from pages.PageTelemetry import PERF_BUDGET_MODE, telemetry
+from pages.StepRecorder import recorder
+
+
+def pytest_collection_modifyitems(session, config, items):
+    """
+    Pytest hook that schedules tests from their InfluxDB history:
+    - Recently failing and flaky tests first, long tests first within each group
+    - Reruns through pytest-rerunfailures only for tests with a flaky history
+
+    :param session: pytest session
+    :param config: pytest config
+    :param items: Collected test items, reordered in place
+
+    """
+    if not HISTORY_ORDER_ENABLED:
+        return
+    history = load_history()
+    if not history:
+        return
+    items[:] = order_items(items, history)
+    flaky = flaky_tests(history)
+    for item in items:
+        if item.name in flaky and item.get_closest_marker("flaky") is None:
+            item.add_marker(pytest.mark.flaky(reruns=FLAKY_RERUNS))
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -9,7 +37,7 @@ def pytest_runtest_makereport(item):
     """
     Pytest hook to handle test result reporting:
     - Inserts test result to InfluxDB
-    - Captures screenshot on test failure
+    - Dumps the recent page-object actions, a screenshot and the DOM on test failure
 
     :param item: pytest test item
 
@@ -17,7 +45,7 @@ def pytest_runtest_makereport(item):
     outcome = yield
     report = outcome.get_result()
 
-    if report.when == "CALL":
+    if report.when == "call":
         test_name = item.name
         status = "PASSED" if report.passed else "FAIL"
         duration = getattr(report, 'duration', 0)
@@ -28,16 +56,33 @@ def pytest_runtest_makereport(item):
                 test_name=test_name,
                 status=status,
                 duration=duration,
-                timestamp=timestamp
+                timestamp=timestamp,
+                browser=item.callspec.params.get("driver") if hasattr(item, "callspec") else None
             )
         except Exception as e:
             print(f"❌ Writing to the InfluxDB failed: {e}")
 
         if report.failed:
             driver = item.funcargs.get("driver", None)
-            if driver:
-                screenshot_dir = "screenshots"
-                os.makedirs(screenshot_dir, exist_ok=True)
-                screenshot_path = os.path.join(screenshot_dir, f"{test_name}.png")
-                driver.save_screenshot(screenshot_path)
-                print(f"🖼 Screenshot done: {screenshot_path}")
\ No newline at end of file
+            trace_path = get_trace_writer().capture(driver, test_name, list(recorder.trace), report.longreprtext)
+            print(f"🖼 Failure trace queued: {trace_path}")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Pytest hook that flushes queued InfluxDB points, page-object events and failure traces before the session ends.
+    Page budget violations are listed, and fail the run with ``PERF_BUDGET_MODE=enforce``.
+    The wait times recorded by the page objects are saved to the adaptive timeout model.
+
+    :param session: pytest session
+    :param exitstatus: Exit status of the test run
+
+    """
+    close_result_writer()
+    events.flush()
+    close_trace_writer()
+    timeout_model.save()
+    for violation in telemetry.violations:
+        print(f"🐢 Page budget exceeded: {violation}")
+    if telemetry.budget_failed(PERF_BUDGET_MODE) and session.exitstatus == 0:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
@@ -0,0 +1,173 @@
+import json
+import sys
+import types
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
+
+from pages.AdaptiveTimeouts import TimeoutModel, percentile
+from pages.BasePage import BasePage
+from pages.StepRecorder import recorder
+
+
+def _model(tmp_path, **kwargs):
+    options = dict(path=str(tmp_path / "model.json"), pct=90, margin=2.0, floor=1.0, ceiling=10.0,
+                   min_samples=5, max_samples=50, source="cache", enabled=True)
+    options.update(kwargs)
+    return TimeoutModel(**options)
+
+
+class _Element(WebElement):
+    def __init__(self):
+        pass
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+
+class _WaitDriver:
+    """
+    Driver stand-in for WebDriverWait; ``find_element`` fails until ``found_after`` calls.
+
+    """
+
+    def __init__(self, found_after):
+        self.found_after = found_after
+        self.calls = 0
+
+    def find_element(self, by, value):
+        self.calls += 1
+        if self.calls < self.found_after:
+            raise NoSuchElementException(value)
+        return _Element()
+
+
+def test_percentile_uses_nearest_rank():
+    values = list(range(1, 101))
+
+    assert percentile(values, 99) == 99
+    assert percentile(values, 50) == 50
+    assert percentile([4.0], 99) == 4.0
+
+
+def test_timeout_is_percentile_times_margin_within_floor_and_ceiling(tmp_path):
+    model = _model(tmp_path)
+    for seconds in (0.5, 0.6, 0.7, 0.8, 2.0):
+        model.record("#careers", seconds)
+    for _ in range(5):
+        model.record("#fast", 0.01)
+        model.record("#slow", 9.0)
+
+    assert model.timeout_for("#careers", 15) == 4.0
+    assert model.timeout_for("#fast", 15) == 1.0
+    assert model.timeout_for("#slow", 15) == 10.0
+
+
+def test_default_is_kept_until_enough_waits_are_recorded(tmp_path):
+    model = _model(tmp_path)
+    for _ in range(4):
+        model.record("#jobs", 0.5)
+
+    assert model.timeout_for("#jobs", 15) == 15
+    assert _model(tmp_path, enabled=False).timeout_for("#jobs", 15) == 15
+
+
+def test_timed_out_waits_raise_the_timeout_as_censored_samples(tmp_path):
+    model = _model(tmp_path, ceiling=30.0)
+    for _ in range(20):
+        model.record("#jobs", 0.5)
+    assert model.timeout_for("#jobs", 15) == 1.0
+
+    # Yavaş bir dönem: her seferinde o anki timeout'a takılan beklemeler timeout'u adım adım büyütür
+    for expected in (2.0, 4.0):
+        timeout = model.timeout_for("#jobs", 15)
+        for _ in range(3):
+            model.record("#jobs", timeout, timed_out=True)
+        assert model.timeout_for("#jobs", 15) == expected
+    assert model.report()["#jobs"]["timed_out"] == 6
+
+    history = [{"locator": "#jobs", "wait_time": 0.5, "timed_out": 0}] * 20
+    history += [{"locator": "#jobs", "wait_time": 4.0, "timed_out": 1}] * 3
+    model.refresh_from_history(history)
+    assert model.timeout_for("#jobs", 15) == 8.0 and model.timeouts == {"#jobs": 3}
+
+
+def test_model_round_trips_through_its_file_and_refreshes_from_history(tmp_path):
+    model = _model(tmp_path)
+    for _ in range(5):
+        model.record("#careers", 1.0)
+    model.save()
+
+    reloaded = _model(tmp_path)
+    assert reloaded.timeout_for("#careers", 15) == 2.0
+
+    rows = [{"locator": "#jobs", "wait_time": 3.0}] * 5 + [{"locator": None, "wait_time": 1.0}]
+    assert reloaded.refresh_from_history(rows) == 1
+    reloaded.save()
+
+    stored = json.loads((tmp_path / "model.json").read_text())
+    assert list(stored["samples"]) == ["#jobs"] and stored["updated"] > 0
+    assert reloaded.timeout_for("#careers", 15) == 15
+
+
+def test_page_waits_use_and_feed_the_model(tmp_path, monkeypatch):
+    model = _model(tmp_path, floor=0.2, ceiling=0.5)
+    for _ in range(5):
+        model.record("#missing", 0.1)
+    monkeypatch.setattr("pages.BasePage.timeout_model", model)
+
+    page = BasePage(_WaitDriver(found_after=1), timeout=30)
+    assert page.wait_for_element("css selector", "#found") is not None
+    assert len(model.samples["#found"]) == 1
+
+    page = BasePage(_WaitDriver(found_after=10 ** 6), timeout=30)
+    with pytest.raises(TimeoutException):
+        page._locator_wait("css selector", "#missing", None,
+                           lambda driver: driver.find_element("css selector", "#missing"))
+    assert model.timeouts["#missing"] == 1 and model.samples["#missing"][-1] == 0.2
+
+
+def test_parallel_saves_merge_their_samples(tmp_path):
+    _model(tmp_path).refresh_from_history([{"locator": "#careers", "wait_time": 1.0}])
+    first, second = _model(tmp_path), _model(tmp_path)
+    first.record("#careers", 2.0)
+    second.record("#jobs", 3.0)
+
+    first.save()
+    second.save()
+
+    stored = json.loads((tmp_path / "model.json").read_text())["samples"]
+    assert stored == {"#careers": [2.0], "#jobs": [3.0]}
+    second.save()
+    assert json.loads((tmp_path / "model.json").read_text())["samples"] == stored
+
+
+def test_cached_clicks_are_not_recorded_as_waits(tmp_path, monkeypatch):
+    model = _model(tmp_path)
+    monkeypatch.setattr("pages.BasePage.timeout_model", model)
+    page = BasePage(_WaitDriver(found_after=1))
+    recorder.start_test()
+
+    for _ in range(3):
+        assert page.wait_for_element_to_be_clickable("css selector", "#apply") is not None
+
+    spans = recorder.finish_test()
+    assert page.element_cache_stats["hits"] == 2
+    assert len(model.samples["#apply"]) == 1 and model.recorded == {"#apply": [model.samples["#apply"][0]]}
+    # Geçmişe sadece gerçek çözümlemeler girer: tek _locator_wait adımı, önbellek beklemeleri işaretli
+    assert [span.locator for span in spans if span.step == "BasePage._locator_wait"] == ["#apply"]
+    assert [span.cached for span in spans if span.step.endswith("clickable")] == [False, True, True]
+
+
+def test_model_saves_without_fcntl(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "fcntl", None)
+    monkeypatch.setitem(sys.modules, "msvcrt", types.SimpleNamespace(LK_LOCK=1, locking=lambda fd, mode, size: None))
+    model = _model(tmp_path)
+    model.refresh_from_history([{"locator": "#careers", "wait_time": 1.0}])
+
+    model.save()
+    assert json.loads((tmp_path / "model.json").read_text())["samples"] == {"#careers": [1.0]}
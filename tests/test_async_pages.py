@@ -0,0 +1,171 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+import AsyncWebDriver as async_webdriver
+from AsyncWebDriver import ELEMENT_KEY, AsyncWebDriver, AsyncWebElement, run_sessions
+from pages.AsyncPages import WAIT_FOR_ELEMENT_JS, AsyncHomePage
+
+
+class _DriverServerStub(BaseHTTPRequestHandler):
+    """
+    Stand-in for a W3C driver server; element waits take ``wait_seconds`` to resolve and
+    clicks on ``stale`` elements fail. A click on ``dropped`` is performed but its connection
+    is dropped before the response, a click on ``closing`` is answered and then the idle
+    keep-alive connection is closed.
+
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])) or b"null")
+        server = self.server
+        if self.path == "/session":
+            with server.lock:
+                server.sessions += 1
+                session = f"session-{server.sessions}"
+            return self._send(200, {"sessionId": session, "capabilities": body["capabilities"]["alwaysMatch"]})
+        session = self.path.split("/")[2]
+        if self.path.endswith("/execute/async") and body["script"] == WAIT_FOR_ELEMENT_JS:
+            time.sleep(server.wait_seconds)
+            locator = body["args"][1]
+            found = locator in server.elements
+            return self._send(200, {ELEMENT_KEY: server.elements[locator]} if found else None)
+        if self.path.endswith("/click"):
+            element = self.path.split("/")[4]
+            if element == "stale":
+                return self._send(404, {"error": "stale element reference", "message": "gone"})
+            server.clicks.setdefault(session, []).append(element)
+            if element == "dropped":
+                self.close_connection = True
+                return None
+            self._send(200, None)
+            self.close_connection = element == "closing"
+            return None
+        if self.path.endswith("/execute/sync"):
+            server.clicks.setdefault(session, []).append(f"js:{body['args'][0][ELEMENT_KEY]}")
+            return self._send(200, None)
+        if self.path.endswith("/elements"):
+            return self._send(404, {"error": "no such element", "message": body["value"]})
+        return self._send(200, None)
+
+    def do_DELETE(self):
+        self._send(200, None)
+
+    def _send(self, status, value):
+        data = json.dumps({"value": value}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def driver_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _DriverServerStub)
+    server.lock = threading.Lock()
+    server.sessions = 0
+    server.wait_seconds = 0.2
+    server.clicks = {}
+    server.elements = {}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_sessions_wait_concurrently_in_one_event_loop(driver_server):
+    locators = AsyncHomePage.locators
+    driver_server.elements = {locators.company_menu.value: "company", locators.careers_link.value: "careers"}
+    server_url = f"http://127.0.0.1:{driver_server.server_port}"
+
+    async def flow(driver):
+        await AsyncHomePage(driver).navigate_to_careers()
+        return driver.session_id
+
+    started = time.perf_counter()
+    results = asyncio.run(run_sessions(flow, 20, concurrency=20, server_url=server_url))
+    elapsed = time.perf_counter() - started
+
+    assert [result["error"] for result in results] == [None] * 20
+    assert len({result["result"] for result in results}) == 20
+    assert all(clicks == ["company", "careers"] for clicks in driver_server.clicks.values())
+    # Sırayla çalışsaydı 20 oturum x 2 bekleme x 0.2 s = 8 s sürerdi
+    assert elapsed < 3
+
+
+def test_w3c_errors_raise_selenium_exceptions_and_failed_clicks_fall_back_to_js(driver_server):
+    driver_server.wait_seconds = 0
+    driver_server.elements = {"#cookie": "stale"}
+
+    async def scenario():
+        driver = await AsyncWebDriver.start(f"http://127.0.0.1:{driver_server.server_port}", {})
+        try:
+            with pytest.raises(NoSuchElementException):
+                await driver.find_elements("css selector", "#missing")
+            page = AsyncHomePage(driver)
+            await page.click_element("css selector", "#cookie")
+            assert await page.wait_for_element("css selector", "#missing") is None
+            return driver.session_id
+        finally:
+            await driver.quit()
+
+    session = asyncio.run(scenario())
+
+    assert driver_server.clicks[session] == ["js:stale"]
+
+
+def test_sent_commands_are_not_retried_but_closed_idle_connections_are_reopened(driver_server):
+    async def scenario():
+        driver = await AsyncWebDriver.start(f"http://127.0.0.1:{driver_server.server_port}", {})
+        try:
+            await AsyncWebElement(driver, "closing").click()
+            await asyncio.sleep(0.1)
+            await AsyncWebElement(driver, "after-close").click()
+            with pytest.raises(ConnectionError):
+                await AsyncWebElement(driver, "dropped").click()
+            return driver.session_id
+        finally:
+            await driver.quit()
+
+    session = asyncio.run(scenario())
+
+    assert driver_server.clicks[session] == ["closing", "after-close", "dropped"]
+
+
+class _Service:
+    def __init__(self, url):
+        self.service_url = url
+        self.stopped = False
+
+    def stop(self):
+        self.stopped = True
+
+
+@pytest.mark.parametrize("browser, services", [("chrome", 1), ("firefox", 3)])
+def test_geckodriver_is_started_per_session(driver_server, monkeypatch, browser, services):
+    started = []
+
+    def start_driver_service(name):
+        started.append(_Service(f"http://127.0.0.1:{driver_server.server_port}"))
+        return started[-1]
+
+    monkeypatch.setattr(async_webdriver, "start_driver_service", start_driver_service)
+
+    async def flow(driver):
+        return driver.session_id
+
+    results = asyncio.run(run_sessions(flow, 3, browser=browser, concurrency=3))
+
+    assert [result["error"] for result in results] == [None] * 3
+    assert len(started) == services and all(service.stopped for service in started)
@@ -0,0 +1,79 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+import BrowserProfiles
+from BrowserProfiles import acquire_profile_dir, build_options, get_profile, release_profile_dir
+
+
+class _Proxy:
+    url = "127.0.0.1:8899"
+
+    def firefox_preferences(self):
+        return {"network.proxy.type": 1, "network.proxy.http_port": 8899}
+
+
+@pytest.fixture
+def profile_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(BrowserProfiles, "PROFILE_ROOT", str(tmp_path))
+    return tmp_path
+
+
+def test_chrome_options_follow_the_profile():
+    options = build_options("chrome", get_profile("fast"), "/profiles/chrome-0", _Proxy())
+
+    assert options.arguments == ["--headless=new", "--window-size=1920,1080", "--user-data-dir=/profiles/chrome-0",
+                                 "--proxy-server=http://127.0.0.1:8899"]
+    assert options.experimental_options["prefs"] == {"profile.managed_default_content_settings.images": 2}
+    assert options.page_load_strategy == "eager"
+    assert build_options("chrome", get_profile("default")).arguments == []
+
+
+def test_firefox_options_follow_the_profile():
+    options = build_options("firefox", get_profile("fast"), "/profiles/firefox-0", _Proxy())
+
+    assert options.arguments == ["-headless", "--width=1920", "--height=1080", "-profile", "/profiles/firefox-0"]
+    assert options.preferences["permissions.default.image"] == 2
+    assert options.preferences["browser.display.use_document_fonts"] == 0
+    assert options.preferences["network.proxy.http_port"] == 8899
+    assert options.page_load_strategy == "eager"
+    with pytest.raises(ValueError):
+        build_options("safari", get_profile("default"))
+
+
+def test_live_profile_slots_are_not_shared(profile_root):
+    first = acquire_profile_dir("chrome")
+    second = acquire_profile_dir("chrome")
+    assert (os.path.basename(first), os.path.basename(second)) == ("chrome-0", "chrome-1")
+
+    release_profile_dir(first)
+    assert acquire_profile_dir("chrome") == first
+    assert os.path.basename(acquire_profile_dir("firefox")) == "firefox-0"
+    for path in (first, second):
+        release_profile_dir(path)
+
+
+def test_warm_profile_keeps_the_cache_but_not_the_session_state(profile_root):
+    path = acquire_profile_dir("chrome")
+    for relative_path in ("Default/Network/Cookies", "Default/Local Storage/leveldb/000003.log",
+                          "Default/Cache/Cache_Data/index"):
+        os.makedirs(os.path.dirname(os.path.join(path, relative_path)), exist_ok=True)
+        open(os.path.join(path, relative_path), "w").close()
+    release_profile_dir(path)
+
+    assert acquire_profile_dir("chrome") == path
+    assert not os.path.exists(os.path.join(path, "Default", "Network", "Cookies"))
+    assert not os.path.exists(os.path.join(path, "Default", "Local Storage"))
+    assert os.path.exists(os.path.join(path, "Default", "Cache", "Cache_Data", "index"))
+    release_profile_dir(path)
+
+
+def test_module_imports_without_fcntl(monkeypatch):
+    monkeypatch.setitem(sys.modules, "fcntl", None)
+    spec = importlib.util.spec_from_file_location("_profiles_without_fcntl", BrowserProfiles.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    assert module.get_profile("warm").warm_profile
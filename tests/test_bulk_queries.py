@@ -0,0 +1,61 @@
+import pytest
+from selenium.webdriver.common.by import By
+
+from pages.BasePage import BULK_QUERY_JS, FIND_ELEMENTS_JS, SCRIPT_LOCATOR_STRATEGIES, BasePage, check_script_locator
+from pages.CareerPage import CareerPage
+from pages.StepRecorder import TimedWebDriverWait
+
+
+class _QueryDriver:
+    """
+    Driver stand-in that answers :data:`BULK_QUERY_JS` with canned records per result name.
+
+    """
+
+    def __init__(self, records):
+        self.records = records
+        self.calls = []
+
+    def execute_script(self, script, queries, fields, attributes):
+        assert script == BULK_QUERY_JS
+        self.calls.append((queries, fields))
+        return {name: self.records.get(name, []) for name in queries}
+
+
+def test_every_selenium_strategy_is_resolved_in_the_page():
+    strategies = {value for name, value in vars(By).items() if name.isupper()}
+
+    assert SCRIPT_LOCATOR_STRATEGIES == strategies
+    for strategy in strategies:
+        assert f'by === "{strategy}"' in FIND_ELEMENTS_JS
+
+
+def test_unsupported_strategies_are_rejected_before_the_script_runs():
+    driver = _QueryDriver({})
+    page = BasePage(driver)
+
+    assert check_script_locator(By.LINK_TEXT, "Careers") == ["link text", "Careers"]
+    with pytest.raises(ValueError, match="css"):
+        page.query_elements({"jobs": ("css", ".position-list-item")})
+    assert driver.calls == []
+
+
+def test_records_keep_unrequested_fields_empty():
+    page = BasePage(_QueryDriver({"jobs": [{"text": "QA Engineer"}]}))
+
+    (record,) = page.query_elements({"jobs": (By.CSS_SELECTOR, ".position-list-item")})["jobs"]
+    assert (record.name, record.index, record.text, record.visible, record.href) == ("jobs", 0, "QA Engineer",
+                                                                                     None, None)
+
+
+def test_career_sections_must_be_visible():
+    visible = {"Locations": [{"visible": True}], "Teams": [{"visible": True}],
+               "Life at Insider": [{"visible": False}, {"visible": True}]}
+    driver = _QueryDriver(visible)
+    assert CareerPage(driver).verify_sections()
+    assert driver.calls[0][1] == ["visible"]
+
+    hidden = dict(visible, Teams=[{"visible": False}])
+    page = CareerPage(_QueryDriver(hidden))
+    page.wait = TimedWebDriverWait(page.driver, 0.2, poll_frequency=0.05)
+    assert not page.verify_sections()
@@ -0,0 +1,65 @@
+import pytest
+
+from pages.Checkpoints import CheckpointStore, RESTORE_STORAGE_JS, restore_checkpoint, save_checkpoint
+
+
+class _FakeDriver:
+    """
+    Driver stand-in that serves a fixed page skeleton and records navigation, cookies and storage.
+
+    """
+
+    def __init__(self, skeleton="DIV#career-our-location|NAV#navbarNavDropdown"):
+        self.skeleton = skeleton
+        self.url = "https://useinsider.com/careers/quality-assurance/"
+        self.visited = []
+        self.cookies = []
+        self.storage = {}
+
+    def execute_script(self, script, *args):
+        if script == RESTORE_STORAGE_JS:
+            self.storage.update(args[0])
+            return None
+        return {"url": self.url, "local_storage": {"consent": "yes"}, "skeleton": self.skeleton}
+
+    def get_cookies(self):
+        return [{"name": "wt-cli-accepted", "value": "1", "domain": ".useinsider.com"}]
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def get(self, url):
+        self.visited.append(url)
+
+
+ORIGIN = "https://useinsider.com"
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CheckpointStore(str(tmp_path), max_age=3600)
+
+
+def test_restore_sets_state_before_opening_the_stage_url(store):
+    save_checkpoint(_FakeDriver(), "qa_jobs", store, ORIGIN)
+    driver = _FakeDriver()
+
+    assert restore_checkpoint(driver, "qa_jobs", ORIGIN, store)
+    assert driver.visited == ["https://useinsider.com/robots.txt", "https://useinsider.com/careers/quality-assurance/"]
+    assert driver.cookies[0]["name"] == "wt-cli-accepted"
+    assert driver.storage == {"consent": "yes"}
+
+
+def test_markup_change_invalidates_the_checkpoint(store):
+    save_checkpoint(_FakeDriver(), "qa_jobs", store, ORIGIN)
+
+    assert not restore_checkpoint(_FakeDriver(skeleton="DIV#new-careers-layout"), "qa_jobs", ORIGIN, store)
+    assert store.load("qa_jobs", ORIGIN) is None
+
+
+def test_old_and_foreign_checkpoints_are_ignored(tmp_path):
+    save_checkpoint(_FakeDriver(), "careers", CheckpointStore(str(tmp_path)), ORIGIN)
+
+    assert CheckpointStore(str(tmp_path), max_age=-1).load("careers", ORIGIN) is None
+    assert CheckpointStore(str(tmp_path)).load("careers", "http://127.0.0.1:8000") is None
+    assert not restore_checkpoint(_FakeDriver(), "careers", "http://127.0.0.1:8000", CheckpointStore(str(tmp_path)))
@@ -0,0 +1,111 @@
+import json
+import os
+import threading
+
+import pytest
+
+from DriverCache import DriverBinaryCache
+
+
+def _cache(directory, version="114", **kwargs):
+    return DriverBinaryCache(directory, version_probe=lambda browser: version, **kwargs)
+
+
+@pytest.fixture
+def fake_installer(tmp_path):
+    calls = []
+
+    def install():
+        calls.append(1)
+        path = tmp_path / "wdm" / "114.0.5735.90" / "chromedriver"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # webdriver-manager gibi indirip yerine taşır; paralel çağrılar yarım dosya görmez
+        partial = path.with_name(f"chromedriver.{threading.get_ident()}")
+        partial.write_bytes(b"#!/bin/sh\necho chromedriver\n")
+        os.replace(partial, path)
+        return str(path)
+
+    install.calls = calls
+    return install
+
+
+def test_driver_is_pinned_by_digest_and_resolved_once_per_session(tmp_path, fake_installer):
+    cache = _cache(str(tmp_path / "cache"), installers={"chrome": fake_installer})
+    first = cache.resolve("chrome")
+    second = cache.resolve("chrome")
+
+    assert first == second
+    assert len(fake_installer.calls) == 1
+    manifest = json.loads((tmp_path / "cache" / "manifest.json").read_text())
+    assert manifest["chrome-114"]["version"] == "114.0.5735.90"
+    assert first.endswith(os.path.join("blobs", manifest["chrome-114"]["sha256"], "chromedriver"))
+    assert os.access(first, os.X_OK)
+    assert cache.stats["resolutions"] == 1
+    assert cache.stats["cache_hits"] == 1
+
+
+def test_warm_cache_works_offline_and_reports_saved_time(tmp_path, fake_installer):
+    _cache(str(tmp_path / "cache"), installers={"chrome": fake_installer}).resolve("chrome")
+
+    offline = _cache(str(tmp_path / "cache"), offline=True, installers={})
+    path = offline.resolve("chrome")
+    offline.resolve("chrome")
+
+    assert os.path.isfile(path)
+    assert len(fake_installer.calls) == 1
+    assert offline.stats["cache_hits"] == 2
+    assert offline.stats["seconds_saved"] >= 0
+    assert "2 from cache" in offline.report()
+
+
+def test_offline_without_cached_driver_fails(tmp_path):
+    cache = _cache(str(tmp_path / "cache"), offline=True, installers={})
+    with pytest.raises(RuntimeError):
+        cache.resolve("firefox")
+
+
+def test_tampered_or_stale_binary_is_resolved_again(tmp_path, fake_installer):
+    cache_dir = str(tmp_path / "cache")
+    path = _cache(cache_dir, installers={"chrome": fake_installer}).resolve("chrome")
+    with open(path, "ab") as binary:
+        binary.write(b"corrupted")
+
+    restored = _cache(cache_dir, installers={"chrome": fake_installer}).resolve("chrome")
+    assert restored == path
+    assert not open(restored, "rb").read().endswith(b"corrupted")
+
+    _cache(cache_dir, max_age_days=0, installers={"chrome": fake_installer}).resolve("chrome")
+    assert len(fake_installer.calls) == 3
+
+
+def test_browser_upgrade_resolves_a_matching_driver(tmp_path, fake_installer):
+    cache_dir = str(tmp_path / "cache")
+    _cache(cache_dir, installers={"chrome": fake_installer}).resolve("chrome")
+    _cache(cache_dir, installers={"chrome": fake_installer}).resolve("chrome")
+    _cache(cache_dir, version="115", installers={"chrome": fake_installer}).resolve("chrome")
+
+    assert len(fake_installer.calls) == 2
+    assert sorted(json.loads((tmp_path / "cache" / "manifest.json").read_text())) == ["chrome-114", "chrome-115"]
+    assert _cache(cache_dir, version=None).manifest_key("chrome") == "chrome"
+
+
+def test_parallel_cold_caches_warm_without_colliding(tmp_path, fake_installer):
+    cache_dir = str(tmp_path / "cache")
+    start, errors, paths = threading.Barrier(8), [], []
+
+    def warm():
+        start.wait()
+        try:
+            paths.append(_cache(cache_dir, installers={"chrome": fake_installer}).resolve("chrome"))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=warm) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == [] and len(set(paths)) == 1
+    assert sorted(os.listdir(cache_dir)) == ["blobs", "manifest.json"]
+    assert os.listdir(os.path.dirname(paths[0])) == ["chromedriver"]
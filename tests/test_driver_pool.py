@@ -0,0 +1,185 @@
+from selenium.common.exceptions import WebDriverException
+
+from DriverPool import DriverPool
+
+
+class _FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current_handle = handle
+
+
+def _origin(url):
+    return "/".join(url.split("/")[:3])
+
+
+class _FakeDriver:
+    """
+    In-memory stand-in for a WebDriver session without DevTools that records the reset calls.
+
+    Every tab has its own URL and cookies and localStorage are kept per origin, so clearing
+    only reaches the origin of the current tab. Navigation and scripts go through
+    ``execute`` like in Selenium, which lets the pool observe the visited URLs.
+
+    """
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.handles = ["main"]
+        self.current_handle = "main"
+        self.urls = {"main": "https://useinsider.com/careers/"}
+        self.cookies = {"https://useinsider.com": {"session": "1"}}
+        self.storage = {}
+        self.cookies_cleared = 0
+        self.alive = True
+        self.quit_called = False
+        self.switch_to = _FakeSwitchTo(self)
+
+    @property
+    def window_handles(self):
+        if not self.alive:
+            raise WebDriverException("session deleted")
+        return list(self.handles)
+
+    @property
+    def current_url(self):
+        return self.execute("getCurrentUrl")["value"]
+
+    def execute(self, driver_command, params=None):
+        if driver_command == "get":
+            self.urls[self.current_handle] = params["url"]
+            return {"value": None}
+        if driver_command == "getCurrentUrl":
+            return {"value": self.urls[self.current_handle]}
+        if driver_command == "w3cExecuteScript" and "localStorage.clear" in params["script"]:
+            self.storage.pop(_origin(self.urls[self.current_handle]), None)
+        return {"value": None}
+
+    def open_tab(self, handle, url):
+        self.handles.append(handle)
+        self.current_handle = handle
+        self.get(url)
+
+    def close(self):
+        self.handles.remove(self.current_handle)
+        self.urls.pop(self.current_handle)
+
+    def delete_all_cookies(self):
+        self.cookies_cleared += 1
+        self.cookies.pop(_origin(self.urls[self.current_handle]), None)
+
+    def execute_script(self, script, *args):
+        return self.execute("w3cExecuteScript", {"script": script, "args": list(args)})["value"]
+
+    def get(self, url):
+        self.execute("get", {"url": url})
+
+    def quit(self):
+        self.quit_called = True
+
+
+class _FakeChromeDriver(_FakeDriver):
+    def __init__(self, browser):
+        super().__init__(browser)
+        self.cdp_commands = []
+
+    def execute_cdp_cmd(self, command, args):
+        self.cdp_commands.append(command)
+        if command == "Network.clearBrowserCookies":
+            self.cookies.clear()
+        elif command == "Storage.clearDataForOrigin":
+            self.storage.pop(args["origin"], None)
+
+
+def _pool(size=1, **kwargs):
+    launched = []
+
+    def factory(browser):
+        driver = (_FakeChromeDriver if browser == "chrome" else _FakeDriver)(browser)
+        launched.append(driver)
+        return driver
+
+    return DriverPool(size=size, factory=factory, **kwargs), launched
+
+
+def test_released_driver_is_reset_and_reused():
+    pool, launched = _pool()
+    driver = pool.acquire("chrome")
+    driver.open_tab("lever-tab", "https://jobs.lever.co/useinsider/123")
+    pool.release(driver, "chrome")
+
+    assert driver.handles == ["main"]
+    assert driver.cookies_cleared == 2
+    assert driver.urls == {"main": "about:blank"}
+    assert pool.acquire("chrome") is driver
+    assert pool.stats == {"launches": 1, "reuses": 1, "recycled": 0}
+
+
+def test_drivers_are_keyed_by_browser():
+    pool, launched = _pool()
+    chrome = pool.acquire("chrome")
+    pool.release(chrome, "chrome")
+
+    firefox = pool.acquire("firefox")
+    assert firefox is not chrome
+    assert firefox.browser == "firefox"
+
+
+def test_unhealthy_driver_is_recycled():
+    pool, launched = _pool()
+    driver = pool.acquire("chrome")
+    pool.release(driver, "chrome")
+    driver.alive = False
+
+    replacement = pool.acquire("chrome")
+    assert replacement is not driver
+    assert driver.quit_called
+    assert pool.stats == {"launches": 2, "reuses": 0, "recycled": 1}
+
+
+def test_drivers_beyond_pool_size_are_quit():
+    pool, launched = _pool(size=1)
+    first, second = pool.acquire("chrome"), pool.acquire("chrome")
+    pool.release(first, "chrome")
+    pool.release(second, "chrome")
+
+    assert not first.quit_called
+    assert second.quit_called
+    pool.close()
+    assert first.quit_called
+
+
+def _visit_lever(driver):
+    driver.open_tab("lever-tab", "https://jobs.lever.co/useinsider/123")
+    driver.cookies["https://jobs.lever.co"] = {"lever": "1"}
+    driver.storage["https://jobs.lever.co"] = {"applied": "1"}
+    driver.storage["https://useinsider.com"] = {"consent": "1"}
+    driver.close()
+    driver.switch_to.window("main")
+
+
+def test_closed_tab_origins_are_cleared_through_devtools():
+    pool, launched = _pool()
+    driver = pool.acquire("chrome")
+    _visit_lever(driver)
+    pool.release(driver, "chrome")
+
+    assert driver.cookies == {} and driver.storage == {}
+    assert driver.cdp_commands.count("Storage.clearDataForOrigin") == 2
+    assert driver.visited_origins == set()
+    assert pool.acquire("chrome") is driver
+
+
+def test_drivers_without_devtools_clear_closed_tab_origins_by_visiting_them():
+    pool, launched = _pool()
+    driver = pool.acquire("firefox")
+    _visit_lever(driver)
+    pool.release(driver, "firefox")
+
+    assert driver.cookies == {} and driver.storage == {}
+    assert driver.urls == {"main": "about:blank"}
+    assert not driver.quit_called
+    assert pool.acquire("firefox") is driver
+    assert pool.stats == {"launches": 1, "reuses": 1, "recycled": 0}
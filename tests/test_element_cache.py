@@ -0,0 +1,88 @@
+import time
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+
+from pages.AdaptiveTimeouts import TimeoutModel
+from pages.BasePage import BasePage
+
+
+class _Element(WebElement):
+    def __init__(self, name, displayed=True):
+        self.name = name
+        self.displayed = displayed
+        self.stale = False
+
+    def is_displayed(self):
+        if self.stale:
+            raise StaleElementReferenceException(self.name)
+        return self.displayed
+
+    def is_enabled(self):
+        return True
+
+
+class _Driver:
+    """
+    Driver stand-in whose ``find_element`` returns the next element of ``elements``.
+
+    """
+
+    def __init__(self, *elements):
+        self.elements = list(elements)
+        self.lookups = 0
+
+    def find_element(self, by, value):
+        self.lookups += 1
+        return self.elements[min(self.lookups, len(self.elements)) - 1]
+
+
+@pytest.fixture(autouse=True)
+def _no_adaptive_timeouts(tmp_path, monkeypatch):
+    monkeypatch.setattr("pages.BasePage.timeout_model", TimeoutModel(path=str(tmp_path / "m.json"), enabled=False))
+
+
+def test_cached_clickable_element_is_a_hit():
+    page = BasePage(_Driver(_Element("apply")))
+
+    first = page.wait_for_element_to_be_clickable("css selector", "#apply")
+    assert page.wait_for_element_to_be_clickable("css selector", "#apply") is first
+    assert page.driver.lookups == 1
+    assert page.element_cache_stats == {"hits": 1, "misses": 1, "invalidations": 0}
+
+
+def test_stale_cached_element_counts_one_miss_and_is_resolved_again():
+    old, new = _Element("old"), _Element("new")
+    page = BasePage(_Driver(old, new))
+    page.wait_for_element_to_be_clickable("css selector", "#apply")
+    old.stale = True
+
+    assert page.wait_for_element_to_be_clickable("css selector", "#apply") is new
+    assert page.element_cache_stats == {"hits": 0, "misses": 2, "invalidations": 1}
+
+
+def test_unclickable_cached_element_is_replaced_without_waiting_out_the_timeout(monkeypatch):
+    monkeypatch.setattr("pages.BasePage.ELEMENT_CACHE_WAIT", 0.2)
+    old, new = _Element("old"), _Element("new")
+    page = BasePage(_Driver(old, new), timeout=30)
+    page.wait_for_element_to_be_clickable("css selector", "#apply")
+    # Sayfa yeniden çizildi: eski düğüm DOM'da ama gizli
+    old.displayed = False
+
+    started = time.perf_counter()
+    assert page.wait_for_element_to_be_clickable("css selector", "#apply") is new
+    assert time.perf_counter() - started < 5
+    assert page.element_cache_stats == {"hits": 0, "misses": 2, "invalidations": 1}
+
+
+def test_stale_element_in_a_cached_action_is_counted_once():
+    old, new = _Element("old"), _Element("new")
+    page = BasePage(_Driver(old, new))
+    page.wait_for_element("css selector", "#jobs")
+    old.stale = True
+
+    found = page._with_cached_element("css selector", "#jobs", lambda element: element.is_displayed() and element)
+    assert found is new
+    assert page.element_cache_stats == {"hits": 0, "misses": 1, "invalidations": 1}
+    assert page.element_cache_report()["hit_ratio"] == 0.0
@@ -0,0 +1,64 @@
+from pages.BasePage import BasePage
+from pages.EventLog import EventLog, read_events
+from pages.StepRecorder import recorder
+
+
+class _LoggingPage(BasePage):
+    def __init__(self, driver, log):
+        super().__init__(driver)
+        self.log = log
+
+    def open_section(self):
+        self.log.debug("Scrolled to element", locator="//h2")
+        self.log.warning("Cookie button not found")
+
+
+def test_events_below_the_level_are_dropped_and_the_rest_buffered(tmp_path, capsys):
+    log = EventLog(str(tmp_path / "events.jsonl"), level="INFO", stdout_level="WARNING")
+    log.debug("Clicked")
+    log.info("Cookies accepted")
+    log.warning("Page loading did not finish")
+
+    # Uyarı tampon boşalmadan konsolda
+    assert capsys.readouterr().out == "⚠️ Page loading did not finish\n"
+    assert not (tmp_path / "events.jsonl").exists()
+    assert log.flush() == 2
+    assert capsys.readouterr().out == ""
+
+
+def test_caller_fields_do_not_overwrite_reserved_fields(tmp_path):
+    path = str(tmp_path / "events.jsonl")
+    log = EventLog(path, level="DEBUG", stdout_level="ERROR")
+    log.start_test("test_qa_job_listings[chrome]")
+    log.info("Filter applied", step="department", level="QA", time=3)
+    log.flush()
+
+    (event,) = read_events(path)
+    assert (event["test"], event["step"], event["level"]) == ("test_qa_job_listings[chrome]", None, "INFO")
+    assert (event["field_step"], event["field_level"], event["field_time"]) == ("department", "QA", 3)
+
+
+def test_buffer_is_flushed_in_batches(tmp_path):
+    log = EventLog(str(tmp_path / "events.jsonl"), level="DEBUG", stdout_level="ERROR", batch_size=3)
+    for index in range(4):
+        log.debug("Polled", attempt=index)
+
+    assert len(list(read_events(str(tmp_path / "events.jsonl")))) == 3
+
+
+def test_events_are_queryable_by_test_and_step(tmp_path):
+    path = str(tmp_path / "events.jsonl")
+    log = EventLog(path, level="DEBUG", stdout_level="ERROR")
+    page = _LoggingPage(driver=object(), log=log)
+    recorder.start_test()
+    for test_name in ("test_home[chrome]", "test_home[firefox]"):
+        log.start_test(test_name)
+        page.open_section()
+        log.info("Outside any step")
+    log.flush()
+
+    found = list(read_events(path, test="test_home[firefox]", step="_LoggingPage.*"))
+    assert [(event["message"], event.get("locator")) for event in found] == [
+        ("Scrolled to element", "//h2"), ("Cookie button not found", None)]
+    assert [event["message"] for event in read_events(path, test="test_home[chrome]", level="WARNING")] == [
+        "Cookie button not found"]
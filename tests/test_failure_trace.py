@@ -0,0 +1,104 @@
+import base64
+import gzip
+import json
+import os
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from FailureTrace import FailureTraceWriter
+from pages.BasePage import BasePage
+from pages.StepRecorder import StepRecorder, recorder
+
+
+class _FakeDriver:
+    page_source = "<html><body>careers</body></html>"
+
+    def __init__(self, url="https://useinsider.com/careers/"):
+        self.url = url
+        self.url_reads = 0
+
+    @property
+    def current_url(self):
+        self.url_reads += 1
+        return self.url
+
+    def execute_script(self, script):
+        return {"title": "Careers", "url": self.url, "ready_state": "complete"}
+
+    def get_screenshot_as_base64(self):
+        return base64.b64encode(b"\x89PNG fake").decode()
+
+
+class _FailingPage(BasePage):
+    url = "https://useinsider.com/"
+
+    def open_section(self, by, locator):
+        raise ValueError("section missing")
+
+    def open_job(self):
+        self.get_page_state()
+        self.driver.url = "https://jobs.lever.co/useinsider/123"
+        self.open_section(By.ID, "apply")
+
+
+def test_trace_keeps_only_the_last_actions():
+    step_recorder = StepRecorder(trace_size=3)
+    step_recorder.start_test()
+    for index in range(5):
+        span, started = step_recorder._enter(f"Page.step_{index}", None)
+        step_recorder._exit(span, started)
+
+    assert [span.step for span in step_recorder.trace] == ["Page.step_2", "Page.step_3", "Page.step_4"]
+
+
+def test_failed_step_records_the_error_and_page_url():
+    page = _FailingPage(driver=_FakeDriver())
+    recorder.start_test()
+    with pytest.raises(ValueError):
+        page.open_section(By.CSS_SELECTOR, ".section")
+    (span,) = recorder.trace
+
+    assert (span.step, span.locator, span.url, span.error) == (
+        "_FailingPage.open_section", ".section", "https://useinsider.com/careers/", "ValueError")
+
+
+def test_spans_carry_the_url_of_the_page_they_ran_on():
+    driver = _FakeDriver()
+    page = _FailingPage(driver=driver)
+    recorder.start_test()
+    with pytest.raises(ValueError):
+        page.open_job()
+
+    urls = {span.step: span.url for span in recorder.trace}
+    assert urls == {"BasePage.get_page_state": "https://useinsider.com/careers/",
+                    "_FailingPage.open_section": "https://jobs.lever.co/useinsider/123",
+                    "_FailingPage.open_job": "https://jobs.lever.co/useinsider/123"}
+    # Hata dış adımlara yayılırken URL bir kez okunur
+    assert driver.url_reads == 1
+
+    page = _FailingPage(driver=object())
+    with pytest.raises(ValueError):
+        page.open_section(By.ID, "careers")
+    assert recorder.trace[-1].url == "https://jobs.lever.co/useinsider/123"
+
+
+def test_trace_is_written_with_screenshot_and_compressed_dom(tmp_path):
+    page = _FailingPage(driver=object())
+    recorder.start_test()
+    with pytest.raises(ValueError):
+        page.open_section(By.ID, "careers")
+    writer = FailureTraceWriter(str(tmp_path))
+
+    path = writer.capture(_FakeDriver(), "test_insider_career_page[chrome]", list(recorder.trace), "ValueError")
+    writer.close()
+
+    assert writer.written == [path]
+    with open(os.path.join(path, "trace.json"), encoding="utf-8") as trace_file:
+        trace = json.load(trace_file)
+    assert trace["url"] == "https://useinsider.com/careers/"
+    assert [action["step"] for action in trace["actions"]] == ["_FailingPage.open_section"]
+    with open(os.path.join(path, "screenshot.png"), "rb") as screenshot_file:
+        assert screenshot_file.read() == b"\x89PNG fake"
+    with gzip.open(os.path.join(path, "dom.html.gz"), "rt", encoding="utf-8") as dom_file:
+        assert dom_file.read() == _FakeDriver.page_source
@@ -0,0 +1,46 @@
+import json
+
+from HistoryOrdering import load_history, order_items, summarize_history, flaky_tests
+
+
+class _Item:
+    def __init__(self, name):
+        self.name = name
+
+
+def _rows(test_name, statuses, duration):
+    return [{"time": f"2024-05-0{day}T10:00:00Z", "test_name": test_name, "status": status, "duration": duration}
+            for day, status in enumerate(statuses, 1)]
+
+
+HISTORY = summarize_history(
+    _rows("test_stable_short", ["PASSED", "PASSED", "PASSED"], 5.0)
+    + _rows("test_stable_long", ["PASSED", "PASSED"], 60.0)
+    + _rows("test_flaky", ["PASSED", "FAIL", "PASSED", "PASSED"], 20.0)
+    + _rows("test_broken", ["PASSED", "PASSED", "FAIL"], 10.0)
+)
+
+
+def test_history_is_summarized_per_test():
+    assert HISTORY["test_flaky"] == {
+        "runs": 4, "failures": 1, "flips": 2, "last_failed": False, "avg_duration": 20.0, "flaky": True,
+    }
+    assert HISTORY["test_broken"]["last_failed"] and not HISTORY["test_broken"]["flaky"]
+    assert flaky_tests(HISTORY) == {"test_flaky"}
+
+
+def test_failing_and_flaky_tests_run_first_and_long_tests_start_early():
+    names = ["test_stable_short", "test_stable_long", "test_new", "test_flaky", "test_broken"]
+
+    ordered = order_items([_Item(name) for name in names], HISTORY)
+
+    assert [item.name for item in ordered] == [
+        "test_broken", "test_flaky", "test_new", "test_stable_long", "test_stable_short"]
+
+
+def test_cache_file_is_used_without_a_database(tmp_path):
+    cache_path = tmp_path / "history.json"
+    cache_path.write_text(json.dumps(HISTORY))
+
+    assert load_history("cache", str(cache_path)) == HISTORY
+    assert load_history("cache", str(tmp_path / "missing.json")) == {}
@@ -0,0 +1,89 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from HttpJobValidator import JobApiClient, validate_job_listings
+
+
+class _LeverStub(BaseHTTPRequestHandler):
+    """
+    Stand-in for the lever.co postings API and job pages; ``/useinsider/gone`` is a dead link.
+
+    """
+
+    def do_GET(self):
+        base = f"http://127.0.0.1:{self.server.server_port}"
+        if self.path.startswith("/v0/postings/useinsider"):
+            postings = [
+                {"text": "Senior Software QA Engineer", "hostedUrl": f"{base}/useinsider/0000",
+                 "categories": {"team": "Quality Assurance", "location": "Istanbul, Turkiye"}},
+                {"text": "QA Engineer - Mobile", "hostedUrl": f"{base}/useinsider/{self.server.second_job}",
+                 "categories": {"team": "Quality Assurance", "location": "Istanbul, Turkiye"}},
+                {"text": "Quality Assurance Engineer", "hostedUrl": f"{base}/useinsider/0002",
+                 "categories": {"team": "Quality Assurance", "location": "London, United Kingdom"}},
+                {"text": "Backend Developer", "hostedUrl": f"{base}/useinsider/0003",
+                 "categories": {"team": "Software Development", "location": "Istanbul, Turkiye"}},
+            ]
+            self._send(200, json.dumps(postings), "application/json")
+        elif self.path == "/useinsider/gone":
+            self._send(404, "<title>Not found</title>", "text/html")
+        else:
+            titles = {"0000": "Senior Software QA Engineer", "0001": "QA Engineer - Mobile"}
+            title = titles.get(self.path.rsplit("/", 1)[-1], "Other")
+            self._send(200, f"<html><title>Insider. - {title}</title><h2>{title}</h2></html>", "text/html")
+
+    def _send(self, status, body, content_type):
+        data = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def lever_stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _LeverStub)
+    server.second_job = "0001"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(lever_stub):
+    job_client = JobApiClient(f"http://127.0.0.1:{lever_stub.server_port}/v0/postings/useinsider?mode=json",
+                              job_host="127.0.0.1")
+    yield job_client
+    job_client.close()
+
+
+def test_postings_are_parsed_into_job_records(client):
+    snapshot = client.fetch_postings()
+
+    assert len(snapshot) == 4
+    assert snapshot.records[0].department == "Quality Assurance"
+    assert snapshot.values("location") == ["Istanbul, Turkiye", "London, United Kingdom"]
+
+
+def test_qa_jobs_in_istanbul_lead_to_their_job_pages(client):
+    result = validate_job_listings(client, check_all_pages=True)
+
+    assert [record.title for record in result["matching"]] == ["Senior Software QA Engineer", "QA Engineer - Mobile"]
+    assert [page["page_title"] for page in result["pages"]] == [
+        "Insider. - Senior Software QA Engineer", "Insider. - QA Engineer - Mobile"]
+    assert result["ok"]
+
+
+def test_dead_or_foreign_job_links_fail_the_check(client, lever_stub):
+    lever_stub.second_job = "gone"
+    assert not validate_job_listings(client, check_all_pages=True)["ok"]
+
+    client.job_host = "jobs.lever.co"
+    assert not validate_job_listings(client)["ok"]
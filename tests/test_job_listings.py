@@ -0,0 +1,75 @@
+from pages.JobListings import JobFilter, JobRecord, JobSnapshot
+from pages.QAPage import QAPage
+
+
+def _card(index, department="Quality Assurance", location="Istanbul, Turkiye"):
+    return [f"QA Engineer {index}", department, location, f"https://jobs.lever.co/useinsider/{index:04d}"]
+
+
+class _ListDriver:
+    """
+    Driver stand-in serving job cards; each load-more round appends the next page of cards,
+    or replaces the list when ``paginated`` is set.
+
+    """
+
+    def __init__(self, pages, paginated=False):
+        self.pages = pages
+        self.paginated = paginated
+        self.cards = list(pages[0])
+        self.loaded = 1
+        self.script_calls = 0
+
+    def execute_script(self, script, start, limit):
+        self.script_calls += 1
+        return {"records": self.cards[start:start + limit], "total": len(self.cards)}
+
+    def execute_async_script(self, script, known, timeout_ms, selector):
+        first = self.cards[0][3] if self.cards else None
+        if self.loaded < len(self.pages):
+            next_page = self.pages[self.loaded]
+            self.cards = list(next_page) if self.paginated else self.cards + list(next_page)
+            self.loaded += 1
+        return {"count": len(self.cards), "first": self.cards[0][3], "replaced": self.cards[0][3] != first}
+
+
+def test_records_are_streamed_in_batches():
+    driver = _ListDriver([[_card(i) for i in range(5)]])
+
+    records = list(QAPage(driver).iter_job_records(batch_size=2))
+
+    assert [record.link[-4:] for record in records] == ["0000", "0001", "0002", "0003", "0004"]
+    assert driver.script_calls == 3
+
+
+def test_lazy_loaded_and_paginated_lists_are_read_to_the_end():
+    pages = [[_card(0), _card(1)], [_card(2)], [_card(3)]]
+
+    lazy = list(QAPage(_ListDriver(pages)).iter_job_records(lazy=True))
+    paginated = list(QAPage(_ListDriver(pages, paginated=True)).iter_job_records(load_more_selector=".next"))
+
+    assert len(lazy) == len(paginated) == 4
+    assert len(list(QAPage(_ListDriver(pages)).iter_job_records())) == 2
+
+
+def test_many_filters_are_evaluated_against_one_snapshot():
+    snapshot = JobSnapshot([
+        JobRecord(*_card(0)),
+        JobRecord(*_card(1, location="London, United Kingdom")),
+        JobRecord(*_card(2, department="Software Development")),
+    ])
+
+    assert snapshot.matrix(["Quality Assurance", "Software Development"], ["Istanbul", "London"]) == {
+        ("Quality Assurance", "Istanbul"): 1, ("Quality Assurance", "London"): 1,
+        ("Software Development", "Istanbul"): 1, ("Software Development", "London"): 0,
+    }
+    assert snapshot.evaluate({"qa": JobFilter(department="quality assurance", title="engineer 1")})["qa"] == [
+        snapshot.records[1]]
+    assert snapshot.values("location") == ["Istanbul, Turkiye", "London, United Kingdom"]
+
+
+def test_records_use_slots_without_python_310_dataclass_options():
+    record = JobRecord("QA Engineer", "Quality Assurance", "Istanbul", "https://jobs.example/1")
+
+    assert not hasattr(record, "__dict__")
+    assert record == JobRecord("QA Engineer", "Quality Assurance", "Istanbul", "https://jobs.example/1")
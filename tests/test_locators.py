@@ -0,0 +1,61 @@
+import pytest
+from selenium.webdriver.common.by import By
+
+from benchmarks.LocatorHealth import check_locators
+from pages.HomePage import HomePage
+from pages.Locators import LocatorRegistry, locators, xpath_to_css
+from pages.QAPage import QAPage
+
+
+@pytest.mark.parametrize("xpath, css", [
+    ("//*[@id='wt-cli-accept-all-btn']", "#wt-cli-accept-all-btn"),
+    ("//*[@id='navbarNavDropdown']/ul[1]/li[6]/div/div[2]/a[2]",
+     "#navbarNavDropdown > ul:nth-of-type(1) > li:nth-of-type(6) > div > div:nth-of-type(2) > a:nth-of-type(2)"),
+    ("//div[@id='jobs-list']//div[contains(@class, 'position-list-item')]",
+     "div#jobs-list div[class*='position-list-item']"),
+    ("//a[starts-with(@href, 'https://jobs.lever.co') and @target]", "a[href^='https://jobs.lever.co'][target]"),
+    ("//h2[contains(text(), 'Life at Insider')]", None),
+    ("(//*[@id='navbarDropdownMenuLink'])[5]", None),
+    ("//h3/following-sibling::a", None),
+    ("//div[@class='team']", None),
+    ("//a[@target][2]", None),
+])
+def test_xpaths_are_translated_only_when_css_is_equivalent(xpath, css):
+    assert xpath_to_css(xpath) == css
+
+
+def test_pages_share_one_cookie_locator_and_keep_untranslatable_xpaths():
+    assert HomePage.locators.cookie_accept is QAPage.locators.cookie_accept
+    by, value = QAPage.locators.view_role_button
+    assert (by, value) == (By.XPATH, "//a[contains(text(), 'View Role')]")
+    assert QAPage.locators.job_list.fallback == (
+        By.XPATH, "//div[@id='jobs-list']//div[contains(@class, 'position-list-item')]")
+
+    with pytest.raises(AttributeError):
+        LocatorRegistry({"common": {}}).page("QAPage").job_list
+
+
+class _HealthDriver:
+    def __init__(self, results):
+        self.results = results
+        self.queries = None
+
+    def execute_script(self, script, queries, runs):
+        self.queries = queries
+        return self.results
+
+
+def test_health_check_reports_fallbacks_and_ambiguous_matches():
+    checked = [locators.page("QAPage").job_list, locators.page("QAPage").department_dropdown,
+               locators.page("CareerPage").life_at_insider, locators.page("HomePage").careers_link]
+    driver = _HealthDriver([
+        {"count": 0, "ms": 0.02, "fallback_count": 3, "fallback_ms": 0.1, "same": False},
+        {"count": 1, "ms": 0.01, "fallback_count": 1, "fallback_ms": 0.05, "same": True},
+        {"count": 2, "ms": 0.2, "fallback_count": None, "fallback_ms": None, "same": None},
+        {"count": 1, "ms": 2.5, "fallback_count": 1, "fallback_ms": 3.0, "same": True},
+    ])
+
+    rows = check_locators(driver, checked)
+
+    assert [row["status"] for row in rows] == ["fallback", "ok", "ambiguous", "slow"]
+    assert driver.queries[2] == [By.XPATH, "//h2[contains(text(), 'Life at Insider')]", None]
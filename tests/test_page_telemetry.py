@@ -0,0 +1,68 @@
+import json
+import os
+import subprocess
+import sys
+
+from pages.BasePage import BasePage
+from pages.PageTelemetry import PAGE_METRICS_JS, PageTelemetry, browser_process_usage, load_budgets, telemetry
+
+
+class _Process:
+    def __init__(self, pid):
+        self.pid = pid
+
+
+class _Service:
+    def __init__(self, pid):
+        self.process = _Process(pid)
+
+
+class _MetricsDriver:
+    """
+    Driver stand-in returning fixed page metrics; its "browser" is a child of the test process.
+
+    """
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+        self.scripts = []
+        self.service = _Service(os.getpid())
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        return dict(self.metrics)
+
+
+def test_one_script_call_per_page_is_checked_against_the_budget(tmp_path):
+    budget_path = tmp_path / "budgets.json"
+    budget_path.write_text(json.dumps({"careers": {"lcp": 2500}}))
+    telemetry = PageTelemetry(budgets=load_budgets(str(budget_path)), enabled=True)
+    driver = _MetricsDriver({"url": "https://useinsider.com/careers/", "ttfb": 300.0, "lcp": 3100.0,
+                             "load_event": 2000.0, "first_paint": None, "resource_count": 80})
+
+    metrics = telemetry.collect(driver, "careers")
+
+    assert driver.scripts == [PAGE_METRICS_JS]
+    assert "first_paint" not in metrics.values
+    assert metrics.violations == ["lcp 3100 > 2500"]
+    assert telemetry.budget_failed("enforce") and not telemetry.budget_failed("warn")
+    assert telemetry.finish_test() == [metrics] and telemetry.records == []
+
+
+def test_browser_memory_and_cpu_are_read_from_the_driver_process_tree():
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+    try:
+        usage = browser_process_usage(_MetricsDriver({}))
+    finally:
+        child.kill()
+        child.wait()
+
+    assert usage["rss_bytes"] > 0 and usage["cpu_seconds"] >= 0
+
+
+def test_disabled_telemetry_sends_no_commands(monkeypatch):
+    monkeypatch.setattr(telemetry, "enabled", False)
+    driver = _MetricsDriver({"url": "about:blank"})
+
+    assert BasePage(driver).collect_page_metrics("home", previous_url="https://useinsider.com/") is None
+    assert driver.scripts == []
@@ -0,0 +1,102 @@
+import json
+import subprocess
+
+import pytest
+
+import ParallelRunner
+from ParallelRunner import (collect_shards, collect_tests, merge_allure_results, merge_event_logs, merge_spools,
+                            run_parallel, run_shard, shard_browser, worker_limit)
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_shard_browser_reads_the_browser_parameter():
+    assert shard_browser("tests/tests.py::test_insider_career_page[chrome]") == "chrome"
+    assert shard_browser("tests/tests.py::test_view_role_tabs[firefox-headless]") == "firefox"
+    assert shard_browser("tests/test_locators.py::test_chromeless[chromedriver]") == "none"
+    assert shard_browser("tests/test_locators.py::test_plain") == "none"
+
+
+def test_shards_group_tests_per_browser_in_collection_order():
+    node_ids = ["t.py::test_b[firefox]", "t.py::test_a[chrome]", "t.py::test_plain", "t.py::test_a[firefox]"]
+
+    assert collect_shards(node_ids) == [
+        ("firefox", ["t.py::test_b[firefox]", "t.py::test_a[firefox]"]),
+        ("chrome", ["t.py::test_a[chrome]"]),
+        ("none", ["t.py::test_plain"]),
+    ]
+
+
+def test_worker_limit_takes_the_smallest_bound(monkeypatch):
+    monkeypatch.setattr(ParallelRunner.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(ParallelRunner, "available_memory_mb", lambda: 3 * 1024)
+
+    assert worker_limit(2) == 2
+    assert worker_limit(10) == 3
+    assert worker_limit(10, max_workers=1) == 1
+    assert worker_limit(10, memory_per_worker_mb=4096) == 1
+
+    monkeypatch.setattr(ParallelRunner, "available_memory_mb", lambda: None)
+    assert worker_limit(10) == 8
+
+
+def test_collection_errors_are_reported_with_their_exit_code(tmp_path, capsys):
+    _write(tmp_path / "test_broken.py", "import module_that_does_not_exist\n\n\ndef test_never():\n    pass\n")
+
+    with pytest.raises(subprocess.CalledProcessError) as error:
+        collect_tests([str(tmp_path / "test_broken.py")])
+    assert error.value.returncode not in (0, 5)
+    assert "module_that_does_not_exist" in error.value.stdout + error.value.stderr
+
+    assert run_parallel([str(tmp_path / "test_broken.py")]) == error.value.returncode
+    assert "module_that_does_not_exist" in capsys.readouterr().err
+
+
+def test_spools_are_merged_in_shard_order(tmp_path):
+    _write(tmp_path / "work" / "spool" / "10.lp", "ten\n")
+    _write(tmp_path / "work" / "spool" / "2.lp", "two-a\ntwo-b\n")
+    _write(tmp_path / "main.lp", "earlier\n")
+
+    assert merge_spools(str(tmp_path / "work"), str(tmp_path / "main.lp")) == 3
+    assert (tmp_path / "main.lp").read_text() == "earlier\ntwo-a\ntwo-b\nten\n"
+    assert merge_spools(str(tmp_path / "empty"), str(tmp_path / "main.lp")) == 0
+
+
+def test_allure_results_are_merged_once(tmp_path):
+    _write(tmp_path / "work" / "allure" / "0" / "a-result.json", "{}")
+    _write(tmp_path / "work" / "allure" / "0" / "env.properties", "browser=chrome")
+    _write(tmp_path / "work" / "allure" / "1" / "b-result.json", "{}")
+    _write(tmp_path / "work" / "allure" / "1" / "env.properties", "browser=chrome")
+
+    assert merge_allure_results(str(tmp_path / "work"), str(tmp_path / "results")) == 3
+    assert sorted(p.name for p in (tmp_path / "results").iterdir()) == ["a-result.json", "b-result.json",
+                                                                        "env.properties"]
+
+
+def test_shard_event_logs_are_merged_in_time_order(tmp_path):
+    def event(seconds, test):
+        return json.dumps({"time": seconds, "level": "INFO", "test": test, "step": None, "message": "m"}) + "\n"
+
+    _write(tmp_path / "work" / "events" / "0.jsonl", event(1.0, "a[chrome]") + event(3.0, "b[chrome]"))
+    _write(tmp_path / "work" / "events" / "1.jsonl", event(2.0, "a[firefox]"))
+
+    assert merge_event_logs(str(tmp_path / "work"), str(tmp_path / "events.jsonl")) == 3
+    merged = [json.loads(line)["test"] for line in (tmp_path / "events.jsonl").read_text().splitlines()]
+    assert merged == ["a[chrome]", "a[firefox]", "b[chrome]"]
+
+
+def test_shards_write_their_own_outputs(tmp_path, monkeypatch):
+    calls = []
+
+    def run(command, **kwargs):
+        calls.append(kwargs["env"])
+        return subprocess.CompletedProcess(command, 0, "")
+
+    monkeypatch.setattr(ParallelRunner.subprocess, "run", run)
+
+    run_shard(3, ["t.py::test_a[chrome]"], str(tmp_path))
+    assert calls[0]["EVENT_LOG_PATH"] == str(tmp_path / "events" / "3.jsonl")
+    assert calls[0]["INFLUXDB_SPOOL_PATH"] == str(tmp_path / "spool" / "3.lp")
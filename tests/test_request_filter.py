@@ -0,0 +1,138 @@
+import http.client
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from RequestFilter import FilteringProxy, RequestFilterRules, block_urls, measure_savings
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = b"<html>careers</html>"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def upstream():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def proxy():
+    filtering_proxy = FilteringProxy(RequestFilterRules(["tracker.test"], ["image"])).start()
+    yield filtering_proxy
+    filtering_proxy.stop()
+
+
+def _request(proxy, method, target):
+    connection = http.client.HTTPConnection("127.0.0.1", proxy.port, timeout=5)
+    connection.request(method, target)
+    response = connection.getresponse()
+    body = response.read()
+    connection.close()
+    return response.status, body
+
+
+def test_rules_block_subdomains_and_resource_types():
+    rules = RequestFilterRules(["hotjar.com"], ["font"])
+
+    assert rules.blocks_host("static.hotjar.com:443")
+    assert not rules.blocks_host("nothotjar.com")
+    assert rules.blocks_path("https://useinsider.com/fonts/inter.woff2?v=3")
+    assert "*://*.hotjar.com/*" in rules.url_patterns()
+    with pytest.raises(ValueError):
+        RequestFilterRules(resource_types=["video"])
+
+
+def test_proxy_stubs_blocked_requests_and_forwards_the_rest(proxy, upstream):
+    assert _request(proxy, "GET", "http://tracker.test/collect.js") == (204, b"")
+    assert _request(proxy, "GET", f"http://{upstream}/logo.png") == (204, b"")
+    assert _request(proxy, "GET", f"http://{upstream}/careers/") == (200, b"<html>careers</html>")
+
+    stats = proxy.reset_stats()
+    assert stats["blocked_requests"] == 2
+    assert stats["blocked_hosts"] == {"tracker.test": 1, "127.0.0.1": 1}
+    assert stats["forwarded_requests"] == 1
+    assert stats["forwarded_bytes"] == len(b"<html>careers</html>")
+
+
+def test_proxy_refuses_tunnels_to_blocked_hosts(proxy):
+    status, _ = _request(proxy, "CONNECT", "www.tracker.test:443")
+
+    assert status == 403
+    assert proxy.stats["blocked_requests"] == 1
+
+
+def test_disabled_proxy_forwards_everything(proxy, upstream):
+    proxy.enabled = False
+
+    assert _request(proxy, "GET", f"http://{upstream}/logo.png")[0] == 200
+
+
+def test_block_urls_keeps_the_patterns_already_set():
+    class _ChromeDriver:
+        def __init__(self):
+            self.commands = []
+
+        def execute_cdp_cmd(self, cmd, params):
+            self.commands.append((cmd, params))
+
+    driver = _ChromeDriver()
+    block_urls(driver, ["*.woff"])
+    block_urls(driver, ["*.woff", "*://*.hotjar.com/*"])
+
+    assert driver.commands[-1] == ("Network.setBlockedURLs", {"urls": ["*.woff", "*://*.hotjar.com/*"]})
+
+
+class _ProxiedBrowser:
+    """
+    Browser stand-in without DevTools that loads a page and its logo through the proxy, uncached.
+
+    """
+
+    def __init__(self, proxy, upstream):
+        self.proxy, self.upstream = proxy, upstream
+        self.loaded = []
+
+    def get(self, url):
+        paths = ("/careers/", "/logo.png")
+        self.loaded = [_request(self.proxy, "GET", f"http://{self.upstream}{path}") for path in paths]
+
+    def execute_script(self, script):
+        served = [body for status, body in self.loaded if status == 200]
+        return {"requests": len(served), "transfer_bytes": sum(map(len, served)), "load_ms": 100.0 * len(served)}
+
+
+def test_firefox_cache_is_disabled_only_for_measuring_proxies():
+    rules = RequestFilterRules(["tracker.test"])
+
+    assert "browser.cache.disk.enable" not in FilteringProxy(rules).firefox_preferences()
+    preferences = FilteringProxy(rules, cache_disabled=True).firefox_preferences()
+    assert preferences["browser.cache.disk.enable"] is False and preferences["browser.cache.memory.enable"] is False
+
+
+def test_savings_are_measured_through_an_uncached_proxy(upstream):
+    rules = RequestFilterRules(resource_types=["image"])
+    cached = FilteringProxy(rules)
+    with pytest.raises(ValueError):
+        measure_savings(_ProxiedBrowser(cached, upstream), "http://useinsider.test/careers/", rules, cached)
+
+    proxy = FilteringProxy(rules, cache_disabled=True).start()
+    try:
+        result = measure_savings(_ProxiedBrowser(proxy, upstream), "http://useinsider.test/careers/", rules, proxy)
+    finally:
+        proxy.stop()
+    assert (result["unfiltered"]["requests"], result["filtered"]["requests"]) == (2, 1)
+    assert result["filtered"]["blocked_requests"] == 1 and result["requests_saved"] == 1
+    assert proxy.enabled
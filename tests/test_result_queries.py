@@ -0,0 +1,138 @@
+import json
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ResultQueries import QueryCache, ResultQueries, compare_windows, duration_seconds
+
+
+class _QueryStandIn(BaseHTTPRequestHandler):
+    """
+    Minimal stand-in for the InfluxDB ``/query`` endpoint that answers with one canned series.
+
+    """
+
+    def do_GET(self):
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)["q"][0]
+        self.server.queries.append(query)
+        body = json.dumps({"results": [{"statement_id": 0, "series": [{
+            "name": "ui_test_results",
+            "tags": {"test_name": "test_insider_career_page[chrome]", "browser": "chrome"},
+            "columns": ["time", "p50", "p95", "runs", "failure_rate"],
+            "values": [["1970-01-01T00:00:00Z", 41.0, 55.5, 12, 0.25]],
+        }]}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_POST = do_GET
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def query_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _QueryStandIn)
+    server.queries = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_percentiles_are_read_from_raw_points_and_cached(query_server, tmp_path):
+    queries = ResultQueries(port=query_server.server_port, cache=QueryCache(str(tmp_path / "cache.json"), ttl=60))
+
+    first = queries.duration_percentiles("7d")
+    second = queries.duration_percentiles("7d")
+
+    assert first == second == [{
+        "test_name": "test_insider_career_page[chrome]", "browser": "chrome", "time": "1970-01-01T00:00:00Z",
+        "p50": 41.0, "p95": 55.5, "runs": 12, "failure_rate": 0.25,
+    }]
+    assert len(query_server.queries) == 1
+    assert 'PERCENTILE("duration", 95)' in query_server.queries[0]
+    assert "time > now() - 7d" in query_server.queries[0]
+
+
+def test_long_windows_read_the_downsampled_measurement(query_server):
+    queries = ResultQueries(port=query_server.server_port)
+
+    queries.duration_percentiles("90d")
+    queries.duration_percentiles("7d", offset="7d")
+
+    assert '"downsampled"."ui_test_results_1h"' in query_server.queries[0]
+    assert "time > now() - 1209600s AND time <= now() - 604800s" in query_server.queries[1]
+
+
+def test_expired_entries_are_evicted(tmp_path):
+    cache = QueryCache(str(tmp_path / "cache.json"), ttl=-1)
+    cache.set("old", [1])
+    cache.set("new", [2])
+
+    assert cache.get("new") is None
+    assert list(cache._load()) == ["new"]
+
+
+def test_windows_are_compared_per_test_and_browser():
+    previous = [{"test_name": "t", "browser": "chrome", "p95": 50.0},
+                {"test_name": "t", "browser": "firefox", "p95": 60.0}]
+    current = [{"test_name": "t", "browser": "chrome", "p95": 65.0},
+               {"test_name": "t", "browser": "firefox", "p95": 61.0},
+               {"test_name": "new", "browser": "chrome", "p95": 10.0}]
+
+    trends = compare_windows(current, previous, "p95", threshold=0.2)
+
+    assert [(t["browser"], t["delta"], t["regression"]) for t in trends] == [("chrome", 15.0, True), ("firefox", 1.0, False)]
+
+
+def test_invalid_windows_are_rejected():
+    assert duration_seconds("2w") == 1209600
+    with pytest.raises(ValueError):
+        duration_seconds("7d; DROP DATABASE test_results")
+
+
+class _RetentionClient:
+    """
+    InfluxDB client stand-in that records the retention and continuous query calls in order.
+
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def get_list_retention_policies(self, database):
+        return [{"name": "autogen"}]
+
+    def get_list_continuous_queries(self):
+        return [{"test_results": []}]
+
+    def alter_retention_policy(self, name, database, duration):
+        self.calls.append(("alter", name, duration))
+
+    def create_retention_policy(self, name, duration, replication, database, default=False):
+        self.calls.append(("create", name, duration))
+
+    def create_continuous_query(self, name, select, database):
+        self.calls.append(("cq", name, select))
+
+    def query(self, query, database=None, method="GET"):
+        self.calls.append(("query", method, query))
+
+
+def test_raw_history_is_downsampled_before_the_raw_retention_is_shortened():
+    queries = ResultQueries(database="test_results")
+    queries.client = _RetentionClient()
+
+    queries.setup_retention(raw_retention="30d", downsampled_retention="52w")
+
+    calls = queries.client.calls
+    assert [call[:2] for call in calls] == [("create", "downsampled"), ("cq", "cq_ui_test_results_1h"),
+                                            ("query", "POST"), ("alter", "autogen")]
+    assert 'INTO "downsampled"."ui_test_results_1h"' in calls[2][2] and "GROUP BY time(1h)" in calls[2][2]
+    assert calls[3] == ("alter", "autogen", "30d")
@@ -0,0 +1,186 @@
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from DBController import InfluxResultWriter, ResultSpool, replay_spool
+
+
+class _InfluxStandIn(BaseHTTPRequestHandler):
+    """
+    Minimal stand-in for the InfluxDB ``/write`` endpoint that records every request.
+
+    """
+
+    def do_POST(self):
+        self.server.released.wait(10)
+        if self.server.fail_writes:
+            self.send_response(500)
+            self.end_headers()
+            return
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode()
+        self.server.requests.append((self.path, body.splitlines()))
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def influx_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _InfluxStandIn)
+    server.requests = []
+    server.fail_writes = False
+    server.released = threading.Event()
+    server.released.set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _point(i):
+    return {
+        "measurement": "ui_test_results",
+        "tags": {"test_name": f"test_{i}", "status": "PASSED"},
+        "time": datetime(2024, 1, 1, 0, 0, i).isoformat(),
+        "fields": {"duration": float(i)},
+    }
+
+
+def test_points_are_sent_in_batches_by_size(influx_server):
+    writer = InfluxResultWriter(port=influx_server.server_port, batch_size=5, flush_interval=60).start()
+    for i in range(10):
+        writer.write(_point(i))
+    writer.close(timeout=5)
+
+    assert [len(lines) for _, lines in influx_server.requests] == [5, 5]
+    assert all(path.startswith("/write") and "db=test_results" in path for path, _ in influx_server.requests)
+    stats = writer.stats()
+    assert stats["points_written"] == 10
+    assert stats["flush_count"] == 2
+    assert stats["queue_depth"] == 0
+
+
+def test_partial_batch_is_sent_after_flush_interval(influx_server):
+    writer = InfluxResultWriter(port=influx_server.server_port, batch_size=100, flush_interval=0.2).start()
+    writer.write(_point(1))
+    writer.write(_point(2))
+
+    deadline = time.monotonic() + 5
+    while not influx_server.requests and time.monotonic() < deadline:
+        time.sleep(0.05)
+    writer.close(timeout=5)
+
+    assert len(influx_server.requests) == 1
+    assert len(influx_server.requests[0][1]) == 2
+
+
+def test_flush_sends_pending_points_and_records_latency(influx_server):
+    writer = InfluxResultWriter(port=influx_server.server_port, batch_size=100, flush_interval=60).start()
+    for i in range(3):
+        writer.write(_point(i))
+
+    assert writer.flush(timeout=5)
+    assert writer.queue_depth == 0
+    assert len(influx_server.requests) == 1
+    stats = writer.stats()
+    assert stats["max_flush_latency"] > 0
+    assert stats["avg_flush_latency"] == pytest.approx(stats["total_flush_latency"])
+    writer.close(timeout=5)
+
+
+def test_full_queue_drops_instead_of_blocking(influx_server):
+    writer = InfluxResultWriter(port=influx_server.server_port, max_queue_size=2)
+    assert writer.write(_point(1))
+    assert writer.write(_point(2))
+    assert not writer.write(_point(3))
+    assert writer.stats()["points_dropped"] == 1
+    writer.close()
+
+
+@pytest.mark.parametrize("finish", ["flush", "close"])
+def test_full_queue_of_a_stuck_writer_goes_to_the_spool(influx_server, tmp_path, finish):
+    influx_server.released.clear()
+    spool = ResultSpool(str(tmp_path / "spool.lp"))
+    writer = InfluxResultWriter(port=influx_server.server_port, batch_size=1, max_queue_size=2, timeout=30,
+                                spool=spool).start()
+    writer.write(_point(1))
+    deadline = time.monotonic() + 5
+    while writer._queue.qsize() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # İlk nokta cevap vermeyen InfluxDB'de takıldı; kuyruk dolar
+    assert writer.write(_point(2)) and writer.write(_point(3))
+
+    started = time.monotonic()
+    if finish == "flush":
+        assert writer.flush(timeout=0.3) is False
+    else:
+        writer.close(timeout=0.3)
+    assert time.monotonic() - started < 2
+    assert len((tmp_path / "spool.lp").read_text().splitlines()) == 2
+
+    influx_server.released.set()
+    writer.close(timeout=5)
+    deadline = time.monotonic() + 5
+    while not writer.stats()["points_written"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert writer.stats()["points_written"] == 1
+
+
+def test_spool_mode_writes_locally_without_network(tmp_path):
+    spool = ResultSpool(str(tmp_path / "spool.lp"))
+    writer = InfluxResultWriter(port=1, spool=spool, mode="spool").start()
+    writer.write(_point(1))
+    writer.write(_point(2))
+    writer.close()
+
+    lines = (tmp_path / "spool.lp").read_text().splitlines()
+    assert len(lines) == 2
+    assert lines[0].startswith("ui_test_results,status=PASSED,test_name=test_1 duration=1.0 ")
+    assert writer.stats()["points_spooled"] == 2
+
+
+def test_failed_batches_fall_back_to_spool(influx_server, tmp_path):
+    influx_server.fail_writes = True
+    spool = ResultSpool(str(tmp_path / "spool.lp"))
+    writer = InfluxResultWriter(port=influx_server.server_port, batch_size=2, spool=spool).start()
+    writer.write(_point(1))
+    writer.write(_point(2))
+    writer.close(timeout=10)
+
+    stats = writer.stats()
+    assert stats["points_failed"] == 2
+    assert stats["points_spooled"] == 2
+    assert len((tmp_path / "spool.lp").read_text().splitlines()) == 2
+
+
+def test_replay_drains_spool_and_deduplicates(influx_server, tmp_path):
+    path = str(tmp_path / "spool.lp")
+    spool = ResultSpool(path)
+    spool.append([_point(1), _point(2)])
+    spool.append([_point(2), _point(3)])
+
+    assert replay_spool(path, host="127.0.0.1", port=influx_server.server_port) == 3
+    assert len(influx_server.requests) == 1
+    assert sorted(line.split(",")[2].split(" ")[0] for line in influx_server.requests[0][1]) == [
+        "test_name=test_1", "test_name=test_2", "test_name=test_3"]
+    assert not (tmp_path / "spool.lp").exists()
+    assert not (tmp_path / "spool.lp.replay").exists()
+
+
+def test_failed_replay_keeps_points_for_next_run(influx_server, tmp_path):
+    path = str(tmp_path / "spool.lp")
+    spool = ResultSpool(path)
+    spool.append([_point(1)])
+
+    influx_server.fail_writes = True
+    assert replay_spool(path, host="127.0.0.1", port=influx_server.server_port) is None
+    spool.append([_point(2)])
+
+    influx_server.fail_writes = False
+    assert replay_spool(path, host="127.0.0.1", port=influx_server.server_port) == 2
@@ -0,0 +1,83 @@
+import urllib.error
+import urllib.request
+
+import pytest
+
+from SiteSnapshot import SnapshotServer, SnapshotStore
+
+
+@pytest.fixture
+def replay_server(tmp_path):
+    server = SnapshotServer("replay", SnapshotStore(str(tmp_path))).start()
+    yield server
+    server.stop()
+
+
+def _record(server, path, body, content_type="text/html", **headers):
+    url = server.upstream_url(path)
+    server.store.save(SnapshotStore.key("GET", url), url, 200, dict(headers, **{"Content-Type": content_type}),
+                      server.rewrite(body))
+
+
+def test_links_to_every_host_point_to_local_server(replay_server):
+    _record(replay_server, "/careers/",
+            b'<a href="https://useinsider.com/careers/quality-assurance/">QA</a>'
+            b'<a href="//www.useinsider.com/">Home</a>'
+            b'<a href="https://academy.useinsider.com/">Academy</a>'
+            b'<script src="https://cdn.segment.com:8443/analytics.js"></script>'
+            b'<svg xmlns="http://www.w3.org/2000/svg"></svg>')
+
+    body = urllib.request.urlopen(replay_server.base_url + "/careers/").read()
+    base = replay_server.base_url
+    assert body == (f'<a href="{base}/careers/quality-assurance/">QA</a>'
+                    f'<a href="{base}/">Home</a>'
+                    f'<a href="{base}/__host__/academy.useinsider.com/">Academy</a>'
+                    f'<script src="{base}/__host__/cdn.segment.com:8443/analytics.js"></script>'
+                    '<svg xmlns="http://www.w3.org/2000/svg"></svg>').encode()
+    assert replay_server.upstream_url("/__host__/cdn.segment.com:8443/analytics.js") == \
+        "https://cdn.segment.com:8443/analytics.js"
+
+
+def test_escaped_lever_links_in_json_are_rewritten(replay_server):
+    _record(replay_server, "/__host__/api.lever.co/v0/postings/useinsider?mode=json",
+            b'[{"hostedUrl": "https:\\/\\/jobs.lever.co\\/useinsider\\/1"}]', "application/json")
+
+    body = urllib.request.urlopen(
+        replay_server.base_url + "/__host__/api.lever.co/v0/postings/useinsider?mode=json&_=1700000000").read()
+    local = replay_server.base_url.replace("/", "\\/")
+    assert body == f'[{{"hostedUrl": "{local}\\/__host__\\/jobs.lever.co\\/useinsider\\/1"}}]'.encode()
+
+
+def test_unrecorded_request_is_a_miss(replay_server):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        urllib.request.urlopen(replay_server.base_url + "/unknown/")
+    assert error.value.code == 404
+    assert replay_server.stats == {"hits": 0, "misses": 1, "recorded": 0, "errors": 0}
+
+
+def test_cookies_become_host_only_cookies_of_the_local_server(replay_server):
+    assert replay_server.rewrite_cookie("ins_sid=1; Domain=.useinsider.com; Path=/; Secure; SameSite=None",
+                                        "useinsider.com") == "ins_sid=1; Path=/"
+    assert replay_server.rewrite_cookie("lever=2; Path=/useinsider; HttpOnly; SameSite=Lax", "jobs.lever.co") == \
+        "lever=2; Path=/__host__/jobs.lever.co/useinsider; HttpOnly; SameSite=Lax"
+
+    _record(replay_server, "/careers/", b"careers", **{"Set-Cookie": ["a=1; Path=/", "b=2; Path=/"]})
+    response = urllib.request.urlopen(replay_server.base_url + "/careers/")
+    assert response.headers.get_all("Set-Cookie") == ["a=1; Path=/", "b=2; Path=/"]
+
+
+def test_unreachable_upstream_is_a_bad_gateway_in_record_mode(tmp_path, monkeypatch):
+    server = SnapshotServer("record", SnapshotStore(str(tmp_path))).start()
+
+    def unreachable(request, timeout):
+        raise urllib.error.URLError("Name or service not known")
+
+    monkeypatch.setattr(server._opener, "open", unreachable)
+    try:
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(server.base_url + "/careers/")
+    finally:
+        server.stop()
+    assert error.value.code == 502
+    assert server.stats == {"hits": 0, "misses": 0, "recorded": 0, "errors": 1}
+    assert list(tmp_path.iterdir()) == []
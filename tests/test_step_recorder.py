@@ -0,0 +1,61 @@
+import time
+
+from selenium.webdriver.common.by import By
+
+from pages.BasePage import BasePage
+from pages.StepRecorder import TimedWebDriverWait, recorder
+
+
+class _SamplePage(BasePage):
+    def open_section(self, by, locator):
+        self.wait_until_ready()
+        return locator
+
+    def wait_until_ready(self):
+        ready_at = time.perf_counter() + 0.05
+        TimedWebDriverWait(self.driver, 1, poll_frequency=0.01).until(lambda d: time.perf_counter() >= ready_at)
+
+    def _helper(self):
+        return "not recorded"
+
+
+def test_public_methods_are_recorded_with_locator_and_nesting():
+    page = _SamplePage(driver=object())
+    recorder.start_test()
+    page.open_section(By.XPATH, "//h2")
+    page._helper()
+    spans = recorder.finish_test()
+
+    assert [(span.step, span.locator, span.depth) for span in spans] == [
+        ("_SamplePage.open_section", "//h2", 0),
+        ("_SamplePage.wait_until_ready", None, 1),
+    ]
+
+
+def test_wait_time_is_attributed_to_the_step_and_its_parents():
+    page = _SamplePage(driver=object())
+    recorder.start_test()
+    page.open_section(By.ID, "careers")
+    outer, inner = recorder.finish_test()
+
+    assert inner.wait_time >= 0.05
+    assert outer.wait_time == inner.wait_time
+    assert outer.wall_time >= inner.wall_time >= inner.wait_time
+
+
+def test_inherited_base_page_methods_are_recorded():
+    page = _SamplePage(driver=object())
+    recorder.start_test()
+    page.invalidate_element_cache()
+    spans = recorder.finish_test()
+
+    assert [span.step for span in spans] == ["BasePage.invalidate_element_cache"]
+
+
+def test_steps_with_unhashable_leading_arguments_are_recorded():
+    page = _SamplePage(driver=object())
+    recorder.start_test()
+    page.open_section({"jobs": (By.ID, "jobs")}, ["text"])
+    spans = recorder.finish_test()
+
+    assert [(span.step, span.locator) for span in spans][0] == ("_SamplePage.open_section", None)
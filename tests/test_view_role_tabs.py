@@ -0,0 +1,106 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from selenium.common.exceptions import NoSuchWindowException
+
+from pages.QAPage import NAVIGATE_JS, QAPage
+
+
+class _SwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def new_window(self, kind):
+        if self.driver.current_window_handle not in self.driver.tabs:
+            raise NoSuchWindowException(self.driver.current_window_handle)
+        self.driver.counter += 1
+        handle = f"tab-{self.driver.counter}"
+        self.driver.tabs[handle] = {"url": "about:blank", "polls_left": 0}
+        self.driver.current_window_handle = handle
+        self.driver.max_open = max(self.driver.max_open, len(self.driver.tabs) - 1)
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class _TabDriver:
+    """
+    Driver stand-in whose tabs finish loading after a number of polls given per link; like a real
+    browser, a closed tab stays the current context until another window is selected.
+
+    """
+
+    def __init__(self, load_polls, redirects=None, page_load_strategy="none"):
+        self.capabilities = {"pageLoadStrategy": page_load_strategy}
+        self.load_polls = load_polls
+        self.redirects = redirects or {}
+        self.tabs = {"main": {"url": "https://useinsider.com/careers/quality-assurance/", "polls_left": 0}}
+        self.current_window_handle = "main"
+        self.counter = 0
+        self.max_open = 0
+        self.closed = []
+        self.switch_to = _SwitchTo(self)
+
+    def execute_script(self, script, *args):
+        tab = self.tabs[self.current_window_handle]
+        if script == NAVIGATE_JS:
+            tab["url"] = self.redirects.get(args[0], args[0])
+            tab["polls_left"] = self.load_polls[args[0]]
+            return None
+        tab["polls_left"] -= 1
+        return {"url": tab["url"], "ready_state": "complete" if tab["polls_left"] < 0 else "loading",
+                "title": "Job", "status": 200}
+
+    def close(self):
+        self.closed.append(self.tabs.pop(self.current_window_handle)["url"])
+
+
+def test_every_link_is_checked_with_a_tab_limit():
+    links = [f"https://jobs.lever.co/useinsider/{i}" for i in range(5)]
+    driver = _TabDriver({link: polls for link, polls in zip(links, [3, 0, 1, 0, 2])})
+
+    results = QAPage(driver).verify_all_view_role_links(max_tabs=2, links=links)
+
+    assert sorted(result["link"] for result in results) == links
+    assert all(result["ok"] for result in results)
+    assert driver.max_open == 2
+    assert list(driver.tabs) == ["main"] and driver.current_window_handle == "main"
+    assert results[0]["link"] == links[1]
+
+
+def test_links_that_leave_lever_fail():
+    link = "https://jobs.lever.co/useinsider/gone"
+    driver = _TabDriver({link: 0}, redirects={link: "https://useinsider.com/careers/"})
+
+    (result,) = QAPage(driver).verify_all_view_role_links(links=[link])
+
+    assert not result["ok"] and result["final_url"] == "https://useinsider.com/careers/"
+
+
+class _JobPageStandIn(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = b"<title>Job</title>"
+        self.send_response(404 if self.path == "/gone" else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_links_are_checked_over_http_without_the_none_page_load_strategy():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JobPageStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    driver = _TabDriver({}, page_load_strategy="normal")
+    try:
+        results = QAPage(driver).verify_all_view_role_links(links=[f"{base}/job", f"{base}/gone"],
+                                                             expected_host="127.0.0.1")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert [(result["status"], result["title"], result["ok"]) for result in results] == [
+        (200, "Job", True), (404, "Job", False)]
+    assert driver.counter == 0
@@ -0,0 +1,139 @@
+import json
+import shutil
+import subprocess
+import time
+
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
+
+from pages.AdaptiveTimeouts import TimeoutModel
+from pages.BasePage import BasePage
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="the wait scripts run in Node.js")
+
+# Tarayıcı yerine Node: script'in kullandığı window/performance/rAF/MutationObserver/fetch/XHR kadar DOM
+HARNESS = """
+const input = JSON.parse(require("fs").readFileSync(0, "utf8"));
+globalThis.window = globalThis;
+window.scrollX = 0; window.scrollY = 0;
+window.requestAnimationFrame = (callback) => setTimeout(() => callback(performance.now()), 16);
+const resources = [];
+performance.getEntriesByType = () => resources;
+const observers = [];
+window.MutationObserver = class {
+    constructor(callback) { this.callback = callback; }
+    observe() { observers.push(this); }
+    disconnect() { observers.splice(observers.indexOf(this), 1); }
+};
+window.mutate = () => observers.forEach((observer) => observer.callback([]));
+window.document = {documentElement: {}};
+window.fetch = (ms) => new Promise((resolve) => { if (ms !== undefined) { setTimeout(resolve, ms); } });
+window.XMLHttpRequest = class { addEventListener() {} send() {} };
+window.loadResource = () => resources.push({});
+window.element = {isConnected: true, rect: {top: 0, left: 0, width: 100, height: 20},
+                  getBoundingClientRect() { return this.rect; }};
+const args = input.args.map((arg) => (arg && arg.__element__ ? window.element : arg));
+eval(input.scenario);
+const done = (result) => { process.stdout.write(JSON.stringify(result)); process.exit(0); };
+(new Function(input.script)).apply(null, args.concat([done]));
+"""
+
+
+class _Element(WebElement):
+    def __init__(self):
+        pass
+
+
+class _ScriptDriver:
+    """
+    Driver stand-in that runs async scripts in Node against a scripted page.
+
+    ``scenario`` is JavaScript run before the wait script, e.g. a timer that keeps scrolling.
+    A script that does not call back within ``script_timeout`` raises TimeoutException like
+    Selenium's script timeout.
+
+    """
+
+    def __init__(self, scenario="", script_timeout=5):
+        self.scenario = scenario
+        self.script_timeout = script_timeout
+        self.deadlines = []
+
+    def find_element(self, by, value):
+        return _Element()
+
+    def execute_async_script(self, script, *args):
+        self.deadlines.append(args[1])
+        payload = {"script": script, "scenario": self.scenario,
+                   "args": [{"__element__": True} if isinstance(arg, WebElement) else arg for arg in args]}
+        try:
+            result = subprocess.run(["node", "-e", HARNESS], input=json.dumps(payload), capture_output=True,
+                                    text=True, timeout=self.script_timeout)
+        except subprocess.TimeoutExpired:
+            raise TimeoutException("script timeout")
+        if result.returncode:
+            raise JavascriptException(result.stderr)
+        return json.loads(result.stdout)
+
+
+@pytest.fixture(autouse=True)
+def _no_adaptive_timeouts(tmp_path, monkeypatch):
+    monkeypatch.setattr("pages.BasePage.timeout_model", TimeoutModel(path=str(tmp_path / "m.json"), enabled=False))
+
+
+def _timed(wait, *args, **kwargs):
+    started = time.perf_counter()
+    return wait(*args, **kwargs), time.perf_counter() - started
+
+
+SETTLING = {
+    "scroll": "const scrolling = setInterval(() => { window.scrollY += 40; }, 10);"
+              "setTimeout(() => clearInterval(scrolling), 150);",
+    "element": "const moving = setInterval(() => { element.rect.top += 5; }, 10);"
+               "setTimeout(() => clearInterval(moving), 150);",
+    "network": "setTimeout(() => { fetch(150); loadResource(); }, 0);",
+    "dom": "const ticking = setInterval(mutate, 20); setTimeout(() => clearInterval(ticking), 150);",
+}
+NEVER_SETTLING = {
+    "scroll": "setInterval(() => { window.scrollY += 40; }, 5);",
+    "element": "setInterval(() => { element.rect.top += 5; }, 5);",
+    "network": "setTimeout(() => fetch(), 0);",
+    "dom": "setInterval(mutate, 20);",
+}
+
+
+def _wait(page, kind, timeout):
+    if kind == "scroll":
+        return page.wait_for_scroll_to_finish(timeout=timeout)
+    if kind == "element":
+        return page.wait_for_element_to_be_stable("css selector", "#apply", timeout=timeout)
+    if kind == "network":
+        return page.wait_for_network_idle(idle_time=0.2, timeout=timeout)
+    return page.wait_for_dom_to_settle(quiet_time=0.2, timeout=timeout)
+
+
+@pytest.mark.parametrize("kind", ["scroll", "element", "network", "dom"])
+def test_wait_resolves_as_soon_as_the_page_settles(kind):
+    page = BasePage(_ScriptDriver(SETTLING[kind]))
+
+    settled, seconds = _timed(_wait, page, kind, 3)
+    assert settled is True
+    assert seconds < 2
+    assert page.driver.deadlines == [3000]
+
+
+@pytest.mark.parametrize("kind", ["scroll", "element", "network", "dom"])
+def test_wait_gives_up_at_its_own_deadline(kind):
+    page = BasePage(_ScriptDriver(NEVER_SETTLING[kind]))
+
+    settled, seconds = _timed(_wait, page, kind, 0.6)
+    # Script kendi süresi dolunca false döner; Selenium'un script timeout'una kalmaz
+    assert settled is False
+    assert 0.6 <= seconds < 3
+
+
+def test_script_timeouts_and_errors_count_as_not_settled():
+    hanging = BasePage(_ScriptDriver("setTimeout(() => fetch(), 0);", script_timeout=0.5))
+    assert hanging.wait_for_network_idle(timeout=5) is False
+    assert BasePage(_ScriptDriver("throw new Error('navigated away');")).wait_for_dom_to_settle() is False
@@ -1,32 +1,62 @@
+import dataclasses
+import os
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
+from BrowserProfiles import get_profile
+from DBController import insert_page_metrics, insert_step_spans
+from DriverCache import get_driver_cache
+from DriverPool import DriverPool, create_driver
+from HttpJobValidator import JOB_VALIDATION, LEVER_API_URL, LEVER_JOB_HOST, JobApiClient, validate_job_listings
+from SiteSnapshot import SnapshotServer
 from pages.HomePage import HomePage
 from pages.CareerPage import CareerPage
 from pages.QAPage import QAPage
+from pages.Checkpoints import origin_of
+from pages.EventLog import events
+from pages.JobListings import JobFilter
+from pages.PageTelemetry import telemetry
+from pages.StepRecorder import recorder
+
+
+@pytest.fixture(scope="session")
+def driver_pool():
+    pool = DriverPool()
+    yield pool
+    pool.close()
+    print(get_driver_cache().report())
+
+
+@pytest.fixture(scope="session")
+def base_url():
+    # SITE_MODE=record|replay flow'u yerel snapshot sunucusu üzerinden çalıştırır
+    mode = os.environ.get("SITE_MODE", "live")
+    if mode == "live":
+        yield None
+        return
+    server = SnapshotServer(mode).start()
+    yield server.base_url
+    server.stop()
 
 
 @pytest.fixture(params=["chrome", "firefox"])
-def driver(request):
-    global driver
-    if request.param == "chrome":
-        service = ChromeService(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service)
-    elif request.param == "firefox":
-        service = FirefoxService(GeckoDriverManager().install())
-        driver = webdriver.Firefox(service=service)
-
-    driver.maximize_window()
+def driver(request, driver_pool):
+    driver = driver_pool.acquire(request.param)
+    recorder.start_test()
+    telemetry.start_test()
+    events.start_test(request.node.name)
     yield driver
-    driver.quit()
+    events.flush()
+    insert_step_spans(recorder.finish_test(), request.node.name, request.param)
+    insert_page_metrics(telemetry.finish_test(), request.node.name, request.param)
+    driver_pool.release(driver, request.param)
 
 
-def test_insider_career_page(driver):
+def test_insider_career_page(driver, base_url):
     print("🚀 Open Insider website")
-    home_page = HomePage(driver)
+    home_page = HomePage(driver, base_url)
     home_page.open()
     assert home_page.is_accessible(), "❌ Error, page not found"
 
@@ -37,6 +67,7 @@ def test_insider_career_page(driver):
     home_page.navigate_to_careers()
     careers_page = CareerPage(driver)
     assert careers_page.is_accessible(), "❌ Error: Career page not found"
+    careers_page.save_checkpoint("careers", origin_of(home_page.url))
 
     print("✅ Sayfa bölümleri kontrol ediliyor.")
     assert careers_page.verify_sections(), "❌ Error: Careers section not correct!"
@@ -47,6 +78,7 @@ def test_insider_career_page(driver):
 
     print("🔍 Checking for the QA Careers page.")
     assert qa_careers_page.is_accessible(), "❌ Error: QA Careers page not found!"
+    qa_careers_page.save_checkpoint("qa_jobs", origin_of(home_page.url))
 
     print("✅ 'See all QA jobs' button checked and click.")
     qa_careers_page.click_see_all_qa_jobs()
@@ -56,11 +88,110 @@ def test_insider_career_page(driver):
     qa_careers_page.wait_for_job_cards_to_be_replaced()
 
     qa_careers_page.wait_for_job_cards_to_load()
-    print("✅ Job postings are being verified.")
-    assert qa_careers_page.verify_job_listings(), "❌Error: Job postings do not meet the criteria!"
+    # JOB_VALIDATION=http: liste içeriği ve lever.co linkleri test_job_listings_over_http'de kontrol edilir
+    if JOB_VALIDATION != "http":
+        print("✅ Job postings are being verified.")
+        assert qa_careers_page.verify_job_listings(), "❌Error: Job postings do not meet the criteria!"
 
-    print("✅ View Role butonu kontrol ediliyor...")
-    assert qa_careers_page.verify_view_role_redirects(), "❌Error: View Role button does not redirect!"
+        print("✅ View Role butonu kontrol ediliyor...")
+        assert qa_careers_page.verify_view_role_redirects(), "❌Error: View Role button does not redirect!"
 
     print("🎉 All tests completed successfully!")
     print("🌐 Last URL:", driver.current_url)
+    for page in (home_page, careers_page, qa_careers_page):
+        print(f"📊 {type(page).__name__} element cache: {page.element_cache_report()}")
+
+
+def test_qa_job_listings(driver, base_url):
+    # test_insider_career_page'in kaydettiği checkpoint ile menü navigasyonu atlanır
+    home_page = HomePage(driver, base_url)
+    if home_page.fast_forward("qa_jobs"):
+        print("⏩ Fast-forwarded to the QA Careers page.")
+    else:
+        print("🚀 No checkpoint, navigating to the QA Careers page.")
+        home_page.open()
+        home_page.accept_cookies()
+        home_page.navigate_to_careers()
+        careers_page = CareerPage(driver)
+        assert careers_page.is_accessible(), "❌ Error: Career page not found"
+        careers_page.go_to_qa_careers()
+
+    qa_careers_page = QAPage(driver)
+    assert qa_careers_page.is_accessible(), "❌ Error: QA Careers page not found!"
+    qa_careers_page.save_checkpoint("qa_jobs", origin_of(home_page.url))
+
+    qa_careers_page.click_see_all_qa_jobs()
+    qa_careers_page.wait_for_job_cards_to_load()
+
+    # Liste "See all QA jobs"tan hemen sonra bir kez okunur; select2 filtresi yerine
+    # bütün filtre kombinasyonları bu snapshot üzerinde kontrol edilir
+    snapshot = qa_careers_page.job_snapshot()
+    departments, locations = snapshot.values("department"), snapshot.values("location")
+    print(f"📋 Jobs by department and location: {snapshot.matrix(departments, locations)}")
+    job_filters = {"QA in Istanbul": JobFilter(department="Quality Assurance", location="Istanbul")}
+    job_filters.update({f"QA in {location}": JobFilter(department="Quality Assurance", location=location)
+                        for location in locations})
+    filters = qa_careers_page.verify_job_filters(job_filters, snapshot)
+    assert filters["QA in Istanbul"], f"❌Error: Job filters without matches: {filters}"
+
+    if JOB_VALIDATION != "http":
+        links = [record.link for record in snapshot.evaluate(job_filters)["QA in Istanbul"] if record.link]
+        results = qa_careers_page.verify_all_view_role_links(max_tabs=4, links=links)
+        failed = [result for result in results if not result["ok"]]
+        assert results and not failed, f"❌Error: View Role links do not lead to lever.co: {failed}"
+
+
+def test_job_listings_over_http(base_url):
+    # Tarayıcısız: lever.co API'si ve iş detay sayfaları doğrudan HTTP ile kontrol edilir
+    if base_url:
+        client = JobApiClient(f"{base_url}/__host__/api.lever.co/v0/postings/useinsider?mode=json",
+                              urllib.parse.urlsplit(base_url).hostname)
+    else:
+        client = JobApiClient(LEVER_API_URL, LEVER_JOB_HOST)
+    try:
+        result = validate_job_listings(client, check_all_pages=True)
+    finally:
+        client.close()
+
+    print(f"🎯 {len(result['matching'])}/{result['jobs']} jobs match QA + Istanbul in {result['seconds']:.2f}s")
+    assert result["matching"], "❌Error: Job postings do not meet the criteria!"
+    failed = [page for page in result["pages"] if not page["ok"]]
+    assert not failed, f"❌Error: View Role links do not lead to lever.co: {failed}"
+
+
+class _SlowJobPage(BaseHTTPRequestHandler):
+    # Her iş sayfası yanıtını delay saniye geciktirir
+    delay = 1.5
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        body = b"<html><head><title>Job</title></head><body>Job</body></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.mark.parametrize("browser", ["chrome", "firefox"])
+def test_view_role_tabs_load_in_parallel(browser):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowJobPage)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    links = [f"http://127.0.0.1:{server.server_port}/job/{index}" for index in range(4)]
+    driver = create_driver(browser, dataclasses.replace(get_profile("headless"), page_load_strategy="none"))
+    try:
+        started = time.perf_counter()
+        results = QAPage(driver).verify_all_view_role_links(max_tabs=4, expected_host="127.0.0.1", links=links)
+        elapsed = time.perf_counter() - started
+    finally:
+        driver.quit()
+        server.shutdown()
+        server.server_close()
+
+    print(f"⏱️ {len(links)} tabs in {elapsed:.2f}s")
+    assert [result["ok"] for result in results] == [True] * len(links)
+    # Sekmeler sırayla yüklenseydi 4 x 1.5 s = 6 s sürerdi
+    assert elapsed < 2 * _SlowJobPage.delay + 1.5, f"❌Error: Tabs did not load in parallel ({elapsed:.2f}s)"